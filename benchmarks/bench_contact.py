@@ -0,0 +1,157 @@
+"""
+Contact extraction benchmark.
+
+Compares the previous implementation (five independent regex scans, kept here
+as the reference) with the single combined scan in parsing/contact.py, both
+over the whole text and header-first (stop once email, phone, LinkedIn and
+GitHub are found). Also reports how many documents differ from the reference,
+so a speedup never hides a behaviour change.
+
+--adversarial times both on inputs that make the reference regexes backtrack
+(digit/dash tables, long dotted or hyphenated runs) at two sizes; the growth
+column is time(large) / time(small), about 4 for a quadratic scan and about
+2 for a linear one at the default 2x size step.
+
+Run (from the repo root):
+    python benchmarks/bench_contact.py [--sizes 2000,8000,32000] [--docs 50] [--json out.json]
+    python benchmarks/bench_contact.py --adversarial [--adversarial-sizes 10000,20000]
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import random
+import re
+import time
+from pathlib import Path
+
+from corpus import make_resume
+from resume_analyzer.parsing.contact import (
+    ContactInfo,
+    _dedupe_keep_order,
+    extract_contact_info,
+    normalize_phone,
+    normalize_url,
+)
+
+
+REPEATS = 3
+
+# Repeated units that make a backtracking contact regex retry at every position
+ADVERSARIAL = {
+    "dash_words": "a-",
+    "digit_dash": "1-",
+    "dotted_domain": "x@" + "a." * 8,
+    "digits_gap": "12345 ",
+    "digit_groups": "(12) 34-",
+    "year_table": "2019 - 2021 | ",
+    "at_runs": "a@",
+}
+
+_EMAIL_RE = re.compile(r"\b[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}\b")
+_PHONE_RE = re.compile(r"(?<!\w)(?:\+?\(?\d[\d\s\-()]{8,}\d)(?!\w)")
+_URL_RE = re.compile(r"\bhttps?://[^\s)]+|\bwww\.[^\s)]+", re.IGNORECASE)
+_LINKEDIN_RE = re.compile(r"(https?://)?(www\.)?linkedin\.com/[^\s)]+", re.IGNORECASE)
+_GITHUB_RE = re.compile(r"(https?://)?(www\.)?github\.com/[^\s)]+", re.IGNORECASE)
+
+
+def reference_extract_contact_info(text: str) -> ContactInfo:
+    """
+    The five-scan extractor this benchmark measures against.
+    """
+    emails = _dedupe_keep_order(_EMAIL_RE.findall(text))
+    urls = _dedupe_keep_order([normalize_url(u) for u in _URL_RE.findall(text)])
+    phones = _dedupe_keep_order([p for p in (normalize_phone(x) for x in _PHONE_RE.findall(text)) if p])
+    linkedin = _dedupe_keep_order([normalize_url(m.group(0)) for m in _LINKEDIN_RE.finditer(text)])
+    github = _dedupe_keep_order([normalize_url(m.group(0)) for m in _GITHUB_RE.finditer(text)])
+    return ContactInfo(
+        email=emails[0] if emails else None,
+        phones=phones,
+        links=urls,
+        linkedin=linkedin[0] if linkedin else None,
+        github=github[0] if github else None,
+    )
+
+
+def _best_of(fn, texts: list[str]) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        for t in texts:
+            fn(t)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(texts)
+
+
+def run(sizes: list[int], n_docs: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    variants = {
+        "five_scans": reference_extract_contact_info,
+        "single_scan": extract_contact_info,
+        "header_first": lambda t: extract_contact_info(t, header_first=True),
+    }
+    rows: list[dict] = []
+    for size in sizes:
+        texts = [make_resume(rng, size).text for _ in range(n_docs)]
+        reference = [dataclasses.astuple(reference_extract_contact_info(t)) for t in texts]
+        row: dict = {"size": size, "us": {}, "differs": {}}
+        for name, fn in variants.items():
+            row["us"][name] = round(_best_of(fn, texts) * 1e6, 1)
+            row["differs"][name] = sum(dataclasses.astuple(fn(t)) != ref for t, ref in zip(texts, reference))
+        rows.append(row)
+    return rows
+
+
+def run_adversarial(sizes: list[int]) -> list[dict]:
+    variants = {"five_scans": reference_extract_contact_info, "single_scan": extract_contact_info}
+    rows: list[dict] = []
+    for name, unit in ADVERSARIAL.items():
+        row: dict = {"input": name, "ms": {n: [] for n in variants}, "growth": {}}
+        for size in sizes:
+            text = (unit * (size // len(unit) + 1))[:size]
+            for n, fn in variants.items():
+                row["ms"][n].append(round(_best_of(fn, [text]) * 1000, 2))
+        for n, ms in row["ms"].items():
+            row["growth"][n] = round(ms[-1] / ms[0], 1) if ms[0] else None
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Contact extraction benchmark")
+    parser.add_argument("--sizes", default="2000,8000,32000", help="Comma-separated resume sizes (chars)")
+    parser.add_argument("--docs", type=int, default=50, help="Documents per size")
+    parser.add_argument("--adversarial", action="store_true", help="Time backtracking-prone inputs instead")
+    parser.add_argument("--adversarial-sizes", default="10000,20000", help="Two comma-separated input sizes (chars)")
+    parser.add_argument("--json", help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    if args.adversarial:
+        rows = run_adversarial([int(s) for s in args.adversarial_sizes.split(",") if s.strip()])
+        names = list(rows[0]["ms"]) if rows else []
+        print(f"{'input':<14}" + "".join(f" {n + ' ms':>24} {'growth':>7}" for n in names))
+        for r in rows:
+            cells = "".join(
+                f" {' / '.join(f'{v:.2f}' for v in r['ms'][n]):>24} {r['growth'][n]:>7}" for n in names
+            )
+            print(f"{r['input']:<14}{cells}")
+        if args.json:
+            Path(args.json).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+            print(f"✅ Saved: {args.json}")
+        return
+
+    rows = run([int(s) for s in args.sizes.split(",") if s.strip()], args.docs)
+
+    names = list(rows[0]["us"]) if rows else []
+    print(f"{'chars':>7}" + "".join(f" {n + ' us':>16} {'diff':>5}" for n in names))
+    for r in rows:
+        print(f"{r['size']:>7}" + "".join(f" {r['us'][n]:>16.1f} {r['differs'][n]:>5}" for n in names))
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        print(f"✅ Saved: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
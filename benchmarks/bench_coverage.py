@@ -0,0 +1,100 @@
+"""
+Skill coverage benchmark.
+
+Times an N resumes x M JDs skill coverage matrix two ways, on skills already
+extracted (documents memoize them, so only the set arithmetic is measured):
+
+    sets      len(jd & resume) / len(jd) per pair, on frozensets of names
+    bitsets   skill_coverage_matrix: one matrix product over skill bitsets
+
+and checks that both give the same matrix.
+
+Run (from the repo root):
+    python benchmarks/bench_coverage.py [--resumes 200,2000] [--jds 50] [--json out.json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+
+import numpy as np
+
+from corpus import make_jd, make_resume
+from resume_analyzer.document import JobDescription, ResumeDocument
+from resume_analyzer.scoring.rank import skill_coverage_matrix
+
+
+RESUME_CHARS = 3000
+JD_CHARS = 1500
+REPEATS = 3
+
+
+def set_coverage(resumes: list[ResumeDocument], jds: list[JobDescription]) -> np.ndarray:
+    out = np.zeros((len(resumes), len(jds)))
+    for j, jd in enumerate(jds):
+        if jd.skills:
+            for i, r in enumerate(resumes):
+                out[i, j] = len(jd.skills & r.skills) / len(jd.skills)
+    return out
+
+
+def _best_of(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(resume_counts: list[int], n_jds: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    jds = [JobDescription(make_jd(rng, JD_CHARS).text) for _ in range(n_jds)]
+    pool = [ResumeDocument(make_resume(rng, RESUME_CHARS).text) for _ in range(max(resume_counts))]
+    for d in pool + jds:  # extract (and memoize) skills and bitsets outside the timings
+        _ = d.skills
+    skill_coverage_matrix(pool, jds)
+
+    rows: list[dict] = []
+    for n in resume_counts:
+        resumes = pool[:n]
+        same = np.array_equal(set_coverage(resumes, jds), skill_coverage_matrix(resumes, jds))
+        sets_ms = _best_of(lambda: set_coverage(resumes, jds)) * 1000
+        bits_ms = _best_of(lambda: skill_coverage_matrix(resumes, jds)) * 1000
+        rows.append({
+            "resumes": n,
+            "jds": n_jds,
+            "sets_ms": round(sets_ms, 2),
+            "bitsets_ms": round(bits_ms, 2),
+            "speedup": round(sets_ms / bits_ms, 1) if bits_ms else None,
+            "same": bool(same),
+        })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Skill coverage matrix benchmark")
+    parser.add_argument("--resumes", default="200,2000", help="Comma-separated resume counts")
+    parser.add_argument("--jds", type=int, default=50, help="Number of JDs")
+    parser.add_argument("--json", help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    rows = run([int(s) for s in args.resumes.split(",") if s.strip()], args.jds)
+
+    print(f"{'resumes':>8} {'jds':>5} {'sets ms':>10} {'bitsets ms':>11} {'x':>6} {'same':>5}")
+    for r in rows:
+        print(
+            f"{r['resumes']:>8} {r['jds']:>5} {r['sets_ms']:>10.2f} {r['bitsets_ms']:>11.2f}"
+            f" {r['speedup']:>6} {str(r['same']):>5}"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        print(f"✅ Saved: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+DOCX extraction benchmark.
+
+Compares the previous extractor (python-docx Document, then doc.paragraphs;
+kept here as the reference) with the streaming zip + XML reader in
+parsing/docx.py on synthetic resumes (benchmarks/corpus.py) of growing size.
+Reports per-document time, peak Python heap (tracemalloc) and whether the
+texts match: the corpus has body paragraphs only, so they should, while the
+streaming reader additionally picks up tables, text boxes, headers and footers.
+
+Run (from the repo root):
+    python benchmarks/bench_docx.py [--sizes 2000,32000,256000] [--docs 5] [--json out.json]
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import random
+import time
+import tracemalloc
+from pathlib import Path
+
+from corpus import build_docx, make_resume
+from resume_analyzer.parsing.docx import extract_text_from_docx
+
+
+REPEATS = 3
+
+
+def reference_extract_text_from_docx(data: bytes) -> str:
+    """
+    The python-docx extractor this benchmark measures against.
+    """
+    from docx import Document
+
+    doc = Document(io.BytesIO(data))
+    paragraphs = ((p.text or "").strip() for p in doc.paragraphs)
+    return "\n".join(t for t in paragraphs if t).strip()
+
+
+def _best_of(fn, docs: list[bytes]) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        for d in docs:
+            fn(d)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(docs)
+
+
+def _peak_kb(fn, data: bytes) -> float:
+    tracemalloc.start()
+    try:
+        fn(data)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes: list[int], n_docs: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    variants = {"python_docx": reference_extract_text_from_docx, "streaming": extract_text_from_docx}
+    for fn in variants.values():  # imports out of the timings
+        fn(build_docx(["warm-up"]))
+
+    rows: list[dict] = []
+    for size in sizes:
+        docs = [build_docx(make_resume(rng, size).lines) for _ in range(n_docs)]
+        row: dict = {
+            "size": size,
+            "docx_kb": round(sum(map(len, docs)) / len(docs) / 1024, 1),
+            "ms": {},
+            "peak_kb": {},
+            "differs": sum(reference_extract_text_from_docx(d) != extract_text_from_docx(d) for d in docs),
+        }
+        for name, fn in variants.items():
+            row["ms"][name] = round(_best_of(fn, docs) * 1000, 2)
+            row["peak_kb"][name] = round(max(_peak_kb(fn, d) for d in docs), 1)
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DOCX extraction benchmark")
+    parser.add_argument("--sizes", default="2000,32000,256000", help="Comma-separated resume sizes (chars)")
+    parser.add_argument("--docs", type=int, default=5, help="Documents per size")
+    parser.add_argument("--json", help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    rows = run([int(s) for s in args.sizes.split(",") if s.strip()], args.docs)
+
+    names = list(rows[0]["ms"]) if rows else []
+    print(
+        f"{'chars':>7} {'KB':>7}"
+        + "".join(f" {n + ' ms':>16} {n + ' peak KB':>21}" for n in names)
+        + f" {'diff':>5}"
+    )
+    for r in rows:
+        cells = "".join(f" {r['ms'][n]:>16.2f} {r['peak_kb'][n]:>21.1f}" for n in names)
+        print(f"{r['size']:>7} {r['docx_kb']:>7.1f}{cells} {r['differs']:>5}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        print(f"✅ Saved: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Cold import time of the entry points.
+
+Each measurement is a fresh interpreter importing one module, so nothing is
+shared between runs; the interpreter's own startup is measured separately and
+subtracted. Heavy dependencies (scikit-learn, numpy, pypdf, python-docx, ...)
+are loaded lazily, so these imports should stay cheap; --budget-ms turns that
+into a check.
+
+Run (from the repo root):
+    python benchmarks/bench_import_time.py [--repeats 5] [--budget-ms 400] [--json out.json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+MODULES = ["resume_analyzer.cli", "resume_analyzer.api.main"]
+HEAVY = ["numpy", "scipy", "sklearn", "joblib", "pandas", "pypdf", "docx"]
+
+
+def _run(code: str) -> tuple[float, str]:
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    t0 = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return time.perf_counter() - t0, out.stdout
+
+
+def _best_of(code: str, repeats: int) -> float:
+    return min(_run(code)[0] for _ in range(repeats))
+
+
+def run(repeats: int) -> dict:
+    baseline = _best_of("pass", repeats)
+    results: dict = {"interpreter_ms": round(baseline * 1000, 1), "modules": {}}
+    for module in MODULES:
+        seconds = _best_of(f"import {module}", repeats)
+        _, stdout = _run(f"import json, sys, {module}; print(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))")
+        results["modules"][module] = {
+            "import_ms": round(max(0.0, seconds - baseline) * 1000, 1),
+            "heavy_loaded": json.loads(stdout.strip().splitlines()[-1]),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold import time of the entry points")
+    parser.add_argument("--repeats", type=int, default=5, help="Fresh interpreters per module (best is kept)")
+    parser.add_argument("--budget-ms", type=float, help="Fail when any module imports slower than this")
+    parser.add_argument("--json", help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.repeats)
+
+    print(f"interpreter startup: {results['interpreter_ms']:.1f} ms (subtracted)")
+    print(f"{'module':<28} {'import ms':>10}  heavy modules loaded")
+    for module, r in results["modules"].items():
+        print(f"{module:<28} {r['import_ms']:>10.1f}  {', '.join(r['heavy_loaded']) or '-'}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"✅ Saved: {args.json}")
+
+    if args.budget_ms is not None:
+        slow = [m for m, r in results["modules"].items() if r["import_ms"] > args.budget_ms]
+        if slow:
+            print(f"❌ Over {args.budget_ms:.0f} ms: {', '.join(slow)}")
+            sys.exit(1)
+        print(f"✅ All imports under {args.budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Stored JD matching benchmark.
+
+Scores one resume against M job descriptions two ways:
+
+    pairwise   match_resume_to_jd(resume, jd_text) for every JD: each call
+               builds the JD document, extracts its skills and vectorizes it
+    index      JDIndex.match: JD skills and vectors were computed once at
+               registration; one sparse matrix-vector product for similarity
+               and one coverage product over stored skill sets
+
+Also reports the one-off registration cost (JDIndex.add_many) and checks that
+both ways agree on the top-k.
+
+Run (from the repo root):
+    python benchmarks/bench_match_jobs.py [--jds 1000,5000] [--top-k 10] [--json out.json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import make_jd, make_resume
+from resume_analyzer.document import ResumeDocument
+from resume_analyzer.scoring.jd_index import JDIndex
+from resume_analyzer.scoring.match import match_resume_to_jd
+
+
+RESUME_CHARS = 3000
+JD_CHARS = 1500
+REPEATS = 3
+
+
+def pairwise_top_k(resume: ResumeDocument, jd_texts: list[str], top_k: int) -> list[int]:
+    scores = [match_resume_to_jd(resume, text).final_score for text in jd_texts]
+    return sorted(range(len(scores)), key=lambda i: (-scores[i], i))[:top_k]
+
+
+def _best_of(fn, repeats: int = REPEATS) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(jd_counts: list[int], top_k: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    resume = ResumeDocument(make_resume(rng, RESUME_CHARS).text)
+    pool = [make_jd(rng, JD_CHARS).text for _ in range(max(jd_counts))]
+    match_resume_to_jd(resume, pool[0])  # load models / taxonomy out of the timings
+
+    rows: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for m in jd_counts:
+            texts = pool[:m]
+            index = JDIndex(Path(tmp) / f"jds_{m}.sqlite3")
+            t0 = time.perf_counter()
+            index.add_many(texts, ids=[str(i) for i in range(m)])
+            register_s = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            index.match(resume, top_k=top_k)  # first call builds the in-memory matrices
+            first_ms = (time.perf_counter() - t0) * 1000
+
+            indexed = [int(x.jd_id) for x in index.match(resume, top_k=top_k)]
+            pairwise_ms = _best_of(lambda: pairwise_top_k(resume, texts, top_k), repeats=1) * 1000
+            index_ms = _best_of(lambda: index.match(resume, top_k=top_k)) * 1000
+            rows.append({
+                "jds": m,
+                "pairwise_ms": round(pairwise_ms, 1),
+                "index_ms": round(index_ms, 2),
+                "index_first_ms": round(first_ms, 1),
+                "register_s": round(register_s, 2),
+                "speedup": round(pairwise_ms / index_ms) if index_ms else None,
+                "same_top_k": indexed == pairwise_top_k(resume, texts, top_k),
+            })
+            index.close()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="One resume vs. stored JDs benchmark")
+    parser.add_argument("--jds", default="1000,5000", help="Comma-separated JD counts")
+    parser.add_argument("--top-k", type=int, default=10, help="Matches returned")
+    parser.add_argument("--json", help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    rows = run([int(s) for s in args.jds.split(",") if s.strip()], args.top_k)
+
+    print(f"{'jds':>6} {'pairwise ms':>12} {'index ms':>9} {'first ms':>9} {'register s':>11} {'x':>6} {'same':>5}")
+    for r in rows:
+        print(
+            f"{r['jds']:>6} {r['pairwise_ms']:>12.1f} {r['index_ms']:>9.2f} {r['index_first_ms']:>9.1f}"
+            f" {r['register_s']:>11.2f} {r['speedup']:>6} {str(r['same_top_k']):>5}"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        print(f"✅ Saved: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
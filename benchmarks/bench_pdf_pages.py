@@ -0,0 +1,109 @@
+"""
+Parallel PDF page extraction benchmark.
+
+Builds synthetic text PDFs of increasing page count and times
+extract_text_from_pdf sequentially versus with page ranges sharded across a
+process pool. The pool is warmed up first so spawn cost is not counted (the
+server and CLI reuse one shared pool). Below PARALLEL_MIN_PAGES the parallel
+path falls back to sequential, so those rows should show no speedup.
+
+Run:
+    python benchmarks/bench_pdf_pages.py [--pages 8,32,128,512] [--workers 2,4,8] [--json out.json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import string
+import time
+from pathlib import Path
+
+from corpus import build_pdf
+from resume_analyzer.parsing.pdf import PARALLEL_MIN_PAGES, extract_text_from_pdf
+from resume_analyzer.parsing.pool import get_pool, shutdown_pools
+
+
+LINES_PER_PAGE = 45
+REPEATS = 3
+
+
+def _line(rng: random.Random) -> str:
+    return " ".join(
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(rng.randint(8, 12))
+    )
+
+
+def make_pdf(n_pages: int, rng: random.Random) -> bytes:
+    return build_pdf([_line(rng) for _ in range(n_pages * LINES_PER_PAGE)], lines_per_page=LINES_PER_PAGE)
+
+
+def _best_of(fn, repeats: int = REPEATS) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _warm_up(workers: int) -> None:
+    pool = get_pool(workers)
+    list(pool.map(abs, range(workers * 4)))
+
+
+def run(page_counts: list[int], worker_counts: list[int]) -> list[dict]:
+    rng = random.Random(7)
+    for w in worker_counts:
+        _warm_up(w)
+
+    results: list[dict] = []
+    for n in page_counts:
+        data = make_pdf(n, rng)
+        expected = extract_text_from_pdf(data)
+        row: dict = {
+            "pages": n,
+            "pdf_kb": round(len(data) / 1024, 1),
+            "sequential_ms": round(_best_of(lambda: extract_text_from_pdf(data)) * 1000, 1),
+            "parallel_ms": {},
+            "speedup": {},
+        }
+        for w in worker_counts:
+            assert extract_text_from_pdf(data, workers=w) == expected, "parallel output differs"
+            ms = _best_of(lambda: extract_text_from_pdf(data, workers=w)) * 1000
+            row["parallel_ms"][w] = round(ms, 1)
+            row["speedup"][w] = round(row["sequential_ms"] / ms, 2) if ms else None
+        results.append(row)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Parallel PDF page extraction benchmark")
+    parser.add_argument("--pages", default="8,32,128,512", help="Comma-separated page counts")
+    parser.add_argument("--workers", default="2,4,8", help="Comma-separated worker counts")
+    parser.add_argument("--json", help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    page_counts = [int(s) for s in args.pages.split(",") if s.strip()]
+    worker_counts = [int(s) for s in args.workers.split(",") if s.strip()]
+    try:
+        results = run(page_counts, worker_counts)
+    finally:
+        shutdown_pools()
+
+    print(f"parallel threshold: {PARALLEL_MIN_PAGES} pages")
+    header = f"{'pages':>6} {'KB':>8} {'seq ms':>9}" + "".join(f" {f'{w}w ms':>9} {'x':>5}" for w in worker_counts)
+    print(header)
+    for r in results:
+        line = f"{r['pages']:>6} {r['pdf_kb']:>8.1f} {r['sequential_ms']:>9.1f}"
+        for w in worker_counts:
+            line += f" {r['parallel_ms'][w]:>9.1f} {r['speedup'][w]:>5.2f}"
+        print(line)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"✅ Saved: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Stage-level pipeline benchmark.
+
+Generates synthetic PDF and DOCX resumes (benchmarks/corpus.py) at a few sizes
+and times each pipeline stage on its own, on plain strings, so one stage's
+memoization never hides another stage's cost:
+
+    extract_resume_text   bytes -> cleaned text (per format)
+    clean_text            raw extracted text -> cleaned text
+    iter_clean_text       raw pages -> cleaned text, page by page
+    extract_contact_info  cleaned text
+    extract_skills        cleaned text
+    predict_topk          cleaned text (skipped when no role model is available)
+    match_resume_to_jd    cleaned resume text vs one JD
+
+Results are per-document latencies (median / p95, ms). With --baseline, each
+stage is compared against a stored results file and the run fails when any
+stage is slower than --max-regression times its baseline median.
+
+Run (from the repo root):
+    python benchmarks/bench_pipeline.py [--sizes 2000,8000,32000] [--docs 20] [--json out.json]
+    python benchmarks/bench_pipeline.py --baseline benchmarks/baseline.json [--max-regression 1.25]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Sequence
+
+from corpus import build_docx, build_pdf, make_jd, make_resume
+from resume_analyzer.ml.registry import get_role_predictor
+from resume_analyzer.parsing.clean import clean_text, iter_clean_text
+from resume_analyzer.parsing.contact import extract_contact_info
+from resume_analyzer.parsing.resume import extract_resume_text, iter_resume_chunks
+from resume_analyzer.scoring.match import match_resume_to_jd
+from resume_analyzer.skills.extract import extract_skills
+
+
+JD_CHARS = 1500
+WARMUP = 2
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _time_each(fn: Callable, inputs: Sequence) -> dict:
+    """
+    Call fn once per input (after a short warm-up) and summarize per-call latency.
+    """
+    for x in inputs[:WARMUP]:
+        fn(x)
+    samples: list[float] = []
+    for x in inputs:
+        t0 = time.perf_counter()
+        fn(x)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return {
+        "n": len(samples),
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(_percentile(samples, 0.95), 3),
+        "total_ms": round(sum(samples), 1),
+    }
+
+
+def run(sizes: list[int], n_docs: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    jd_text = make_jd(rng, JD_CHARS).text
+
+    try:
+        predictor = get_role_predictor()
+    except Exception as e:
+        print(f"role model unavailable, skipping predict_topk: {e}", file=sys.stderr)
+        predictor = None
+
+    stages: dict[str, dict] = {}
+    for size in sizes:
+        docs = [make_resume(rng, size) for _ in range(n_docs)]
+        pdfs = [build_pdf(d.lines) for d in docs]
+        docxs = [build_docx(d.lines) for d in docs]
+
+        stages[f"extract_resume_text[pdf]@{size}"] = _time_each(extract_resume_text, pdfs)
+        stages[f"extract_resume_text[docx]@{size}"] = _time_each(extract_resume_text, docxs)
+
+        pages = [list(iter_resume_chunks(b)) for b in pdfs]
+        raw = ["\n".join(p) for p in pages]
+        texts = [clean_text(r) for r in raw]
+
+        stages[f"clean_text@{size}"] = _time_each(clean_text, raw)
+        stages[f"iter_clean_text@{size}"] = _time_each(lambda p: "".join(iter_clean_text(p)), pages)
+        stages[f"extract_contact_info@{size}"] = _time_each(extract_contact_info, texts)
+        stages[f"extract_skills@{size}"] = _time_each(extract_skills, texts)
+        if predictor is not None:
+            stages[f"predict_topk@{size}"] = _time_each(lambda t: predictor.predict_topk(t, k=3), texts)
+        stages[f"match_resume_to_jd@{size}"] = _time_each(lambda t: match_resume_to_jd(t, jd_text), texts)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "sizes": sizes,
+            "docs_per_size": n_docs,
+            "seed": seed,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "stages": stages,
+    }
+
+
+def compare(current: dict, baseline: dict, max_regression: float) -> list[dict]:
+    """
+    Per-stage ratio current/baseline of median latency; stages missing on either side are skipped.
+    """
+    rows: list[dict] = []
+    for name, cur in current["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if not base or not base.get("median_ms"):
+            continue
+        ratio = cur["median_ms"] / base["median_ms"]
+        rows.append({
+            "stage": name,
+            "baseline_ms": base["median_ms"],
+            "current_ms": cur["median_ms"],
+            "ratio": round(ratio, 3),
+            "regressed": ratio > max_regression,
+        })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stage-level pipeline benchmark")
+    parser.add_argument("--sizes", default="2000,8000,32000", help="Comma-separated resume sizes (chars)")
+    parser.add_argument("--docs", type=int, default=20, help="Documents per size")
+    parser.add_argument("--seed", type=int, default=7, help="Corpus random seed")
+    parser.add_argument("--json", help="Optional path to write results as JSON (e.g. a new baseline)")
+    parser.add_argument("--baseline", help="Results file to compare against")
+    parser.add_argument("--max-regression", type=float, default=1.25, help="Fail when median > baseline x this")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = run(sizes, args.docs, args.seed)
+
+    print(f"{'stage':<36} {'median ms':>10} {'p95 ms':>10}")
+    for name, r in results["stages"].items():
+        print(f"{name:<36} {r['median_ms']:>10.3f} {r['p95_ms']:>10.3f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"✅ Saved: {args.json}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        rows = compare(results, baseline, args.max_regression)
+        print()
+        print(f"{'stage':<36} {'base ms':>10} {'now ms':>10} {'ratio':>7}")
+        for r in rows:
+            flag = "  REGRESSED" if r["regressed"] else ""
+            print(f"{r['stage']:<36} {r['baseline_ms']:>10.3f} {r['current_ms']:>10.3f} {r['ratio']:>7.2f}{flag}")
+        regressed = [r["stage"] for r in rows if r["regressed"]]
+        if regressed:
+            print(f"❌ {len(regressed)} stage(s) slower than {args.max_regression}x baseline")
+            sys.exit(1)
+        print(f"✅ No stage slower than {args.max_regression}x baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Skill search benchmark.
+
+Builds a synthetic corpus of N resumes, each a random subset of the taxonomy's
+skills (a few common, most rare, like real resumes), and times boolean
+queries two ways:
+
+    scan     test every resume's skill set against the query (skills already
+             extracted; what answering a query costs without an index)
+    index    SkillIndex.search: posting lists -> bitmaps -> bytewise AND/OR/NOT,
+             cold (posting lists decoded on first use) and warm
+
+Also reports the index size on disk and the build / load times, and checks
+that the scan and the index agree on the number of matches.
+
+Run (from the repo root):
+    python benchmarks/bench_search.py [--docs 100000,1000000] [--json out.json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from resume_analyzer.skills.extract import get_default_extractor
+from resume_analyzer.skills.index import SkillIndex
+
+
+REPEATS = 5
+
+# query -> the same predicate over a set of skill names
+QUERIES = {
+    "python AND kafka AND NOT java": lambda s: "python" in s and "kafka" in s and "java" not in s,
+    "docker": lambda s: "docker" in s,
+    "(python OR java) AND NOT (aws OR docker)": lambda s: bool(s & {"python", "java"}) and not s & {"aws", "docker"},
+    "python OR java OR sql OR docker": lambda s: bool(s & {"python", "java", "sql", "docker"}),
+}
+
+
+def make_postings(n_docs: int, seed: int = 7) -> dict[str, np.ndarray]:
+    names = get_default_extractor().vocabulary.names
+    rng = np.random.default_rng(seed)
+    rates = {name: float(rng.choice([0.005, 0.01, 0.03, 0.1, 0.3])) for name in names}
+    rates.update(python=0.3, java=0.25, sql=0.3, docker=0.2, aws=0.2, kafka=0.05)
+    return {name: np.flatnonzero(rng.random(n_docs) < rate) for name, rate in rates.items()}
+
+
+def _skill_sets(n_docs: int, postings: dict[str, np.ndarray]) -> list[frozenset]:
+    sets: list[list[str]] = [[] for _ in range(n_docs)]
+    for name, ids in postings.items():
+        for i in ids.tolist():
+            sets[i].append(name)
+    return [frozenset(s) for s in sets]
+
+
+def _best_of(fn, repeats: int = REPEATS) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(doc_counts: list[int]) -> list[dict]:
+    rows: list[dict] = []
+    for n in doc_counts:
+        postings = make_postings(n)
+        keys = [f"resumes/{i:07d}.pdf" for i in range(n)]
+        skill_sets = _skill_sets(n, postings)
+
+        t0 = time.perf_counter()
+        built = SkillIndex.from_postings(keys, postings)
+        build_s = time.perf_counter() - t0
+        with tempfile.TemporaryDirectory() as tmp:
+            path = built.save(Path(tmp) / "index.npz")
+            size_mb = path.stat().st_size / 1e6
+            t0 = time.perf_counter()
+            index = SkillIndex.load(path)
+            load_ms = (time.perf_counter() - t0) * 1000
+
+        for query, pred in QUERIES.items():
+            t0 = time.perf_counter()
+            total = index.search(query).total
+            cold_ms = (time.perf_counter() - t0) * 1000
+            warm_ms = _best_of(lambda: index.search(query)) * 1000
+            scan_ms = _best_of(lambda: sum(1 for s in skill_sets if pred(s)), repeats=1) * 1000
+            rows.append({
+                "docs": n,
+                "query": query,
+                "matches": total,
+                "scan_ms": round(scan_ms, 1),
+                "index_cold_ms": round(cold_ms, 2),
+                "index_warm_ms": round(warm_ms, 2),
+                "same": total == sum(1 for s in skill_sets if pred(s)),
+                "index_mb": round(size_mb, 1),
+                "build_s": round(build_s, 2),
+                "load_ms": round(load_ms, 1),
+            })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Boolean skill search benchmark")
+    parser.add_argument("--docs", default="100000,1000000", help="Comma-separated corpus sizes")
+    parser.add_argument("--json", help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    rows = run([int(s) for s in args.docs.split(",") if s.strip()])
+
+    print(f"{'docs':>8} {'matches':>8} {'scan ms':>9} {'cold ms':>8} {'warm ms':>8} {'same':>5}  query")
+    for r in rows:
+        print(
+            f"{r['docs']:>8} {r['matches']:>8} {r['scan_ms']:>9.1f} {r['index_cold_ms']:>8.2f}"
+            f" {r['index_warm_ms']:>8.2f} {str(r['same']):>5}  {r['query']}"
+        )
+    for n in dict.fromkeys(r["docs"] for r in rows):
+        r = next(r for r in rows if r["docs"] == n)
+        print(f"{n:>8} docs: index {r['index_mb']} MB, built in {r['build_s']} s, loaded in {r['load_ms']} ms")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        print(f"✅ Saved: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
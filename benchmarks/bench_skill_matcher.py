@@ -0,0 +1,123 @@
+"""
+Skill matcher scaling benchmark.
+
+Compares the single-pass AliasMatcher (Aho-Corasick) with the old
+one-regex-per-alias loop as the taxonomy grows. Text size is fixed, so the
+automaton's scan time should stay roughly flat while the regex loop grows
+linearly with the number of aliases.
+
+Run:
+    python benchmarks/bench_skill_matcher.py [--sizes 100,1000,10000,50000] [--json out.json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import string
+import time
+from pathlib import Path
+
+from resume_analyzer.skills.matcher import AliasMatcher
+
+
+TEXT_CHARS = 20_000
+REGEX_MAX_ALIASES = 10_000  # the legacy loop gets too slow to be worth timing beyond this
+REPEATS = 5
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+
+
+def make_taxonomy(n_aliases: int, rng: random.Random) -> dict[str, str]:
+    alias_to_canonical: dict[str, str] = {}
+    while len(alias_to_canonical) < n_aliases:
+        alias = " ".join(_word(rng) for _ in range(rng.randint(1, 3)))
+        alias_to_canonical.setdefault(alias, alias.split()[0])
+    return alias_to_canonical
+
+
+def make_text(aliases: list[str], rng: random.Random) -> str:
+    parts: list[str] = []
+    size = 0
+    while size < TEXT_CHARS:
+        token = rng.choice(aliases) if rng.random() < 0.05 else _word(rng)
+        parts.append(token.title() if rng.random() < 0.2 else token)
+        size += len(token) + 1
+    return " ".join(parts)
+
+
+def legacy_extract(patterns: list[tuple[re.Pattern, str]], text: str) -> set[str]:
+    found: set[str] = set()
+    for pat, canonical in patterns:
+        if pat.search(text):
+            found.add(canonical)
+    return found
+
+
+def _best_of(fn, repeats: int = REPEATS) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(sizes: list[int]) -> list[dict]:
+    rng = random.Random(7)
+    results: list[dict] = []
+
+    for n in sizes:
+        tax = make_taxonomy(n, rng)
+        text = make_text(list(tax), rng)
+
+        t0 = time.perf_counter()
+        matcher = AliasMatcher(tax)
+        build_s = time.perf_counter() - t0
+
+        found = matcher.extract(text)
+        row = {
+            "aliases": n,
+            "text_chars": len(text),
+            "build_ms": round(build_s * 1000, 2),
+            "automaton_ms": round(_best_of(lambda: matcher.extract(text)) * 1000, 3),
+            "regex_loop_ms": None,
+            "skills_found": len(found),
+        }
+
+        if n <= REGEX_MAX_ALIASES:
+            patterns = [
+                (re.compile(r"(?<![A-Za-z0-9])" + re.escape(a) + r"(?![A-Za-z0-9])", re.IGNORECASE), c)
+                for a, c in tax.items()
+            ]
+            assert legacy_extract(patterns, text) == found, "automaton and regex loop disagree"
+            row["regex_loop_ms"] = round(_best_of(lambda: legacy_extract(patterns, text), repeats=1) * 1000, 3)
+
+        results.append(row)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Skill matcher scaling benchmark")
+    parser.add_argument("--sizes", default="100,1000,10000,50000", help="Comma-separated alias counts")
+    parser.add_argument("--json", help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = run(sizes)
+
+    print(f"{'aliases':>8} {'build ms':>10} {'automaton ms':>13} {'regex loop ms':>14} {'found':>6}")
+    for r in results:
+        regex = f"{r['regex_loop_ms']:.1f}" if r["regex_loop_ms"] is not None else "-"
+        print(f"{r['aliases']:>8} {r['build_ms']:>10.1f} {r['automaton_ms']:>13.2f} {regex:>14} {r['skills_found']:>6}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"✅ Saved: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Synthetic resume / JD corpus for benchmarks.
+
+Resumes are assembled from the role templates used to train the role model
+(training/generate_role_dataset.py) and from real taxonomy aliases, so every
+pipeline stage does representative work: contact details to find, skills to
+match, role-specific vocabulary to classify. Size is controlled in characters;
+PDFs are laid out as real pages (wrapped lines, fixed lines per page).
+
+Run (writes files for manual inspection or external tools):
+    python benchmarks/corpus.py --out benchmarks/corpus [--count 20] [--chars 4000] [--seed 7]
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import sys
+import textwrap
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from docx import Document
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from resume_analyzer.skills.taxonomy import load_taxonomy  # noqa: E402
+from training.generate_role_dataset import LABEL_TEMPLATES  # noqa: E402
+
+
+TAXONOMY_PATH = ROOT / "data" / "skills_taxonomy.json"
+LINE_WIDTH = 90
+LINES_PER_PAGE = 50
+
+FIRST_NAMES = ["Aarav", "Maya", "Lucas", "Sofia", "Ken", "Amina", "Omar", "Lena", "Ravi", "Chloe"]
+LAST_NAMES = ["Sharma", "Okafor", "Nguyen", "Garcia", "Kowalski", "Haddad", "Smith", "Ito", "Larsen", "Rossi"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries", "Wayne Tech"]
+FILLER = [
+    "agile", "scrum", "documentation", "debugging", "testing", "code review", "design patterns",
+    "mentored junior engineers", "collaborated with product and design", "improved release cadence",
+    "reduced crash rate", "on-call rotation", "stakeholder demos", "sprint planning",
+]
+
+
+@dataclass(frozen=True)
+class SyntheticDoc:
+    label: str
+    lines: list[str]
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+
+@lru_cache(maxsize=1)
+def _aliases_by_canonical() -> dict[str, list[str]]:
+    return load_taxonomy(TAXONOMY_PATH).canonical_to_aliases
+
+
+def _skill_phrases(rng: random.Random, k: int) -> list[str]:
+    by_canonical = _aliases_by_canonical()
+    canonicals = rng.sample(sorted(by_canonical), k=min(k, len(by_canonical)))
+    return [rng.choice(by_canonical[c]) for c in canonicals]
+
+
+def _bullet(rng: random.Random, label: str) -> str:
+    base = rng.choice(LABEL_TEMPLATES[label])
+    extra = rng.sample(FILLER, k=rng.randint(0, 3))
+    return "- " + base + ("; " + ", ".join(extra) if extra else "") + "."
+
+
+def make_resume(rng: random.Random, target_chars: int, label: str | None = None) -> SyntheticDoc:
+    """
+    Resume of roughly `target_chars` characters for one role label.
+    """
+    label = label or rng.choice(sorted(LABEL_TEMPLATES))
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    handle = f"{first}{last}".lower()
+    phone = f"+1 ({rng.randint(200, 989)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+
+    lines = [
+        f"{first} {last}",
+        f"{handle}@example.com | {phone}",
+        f"linkedin.com/in/{handle} | github.com/{handle}",
+        "",
+        "SUMMARY",
+        f"{label.replace('_', ' ').title()} with {rng.randint(2, 12)} years of experience.",
+        "",
+        "SKILLS",
+        ", ".join(_skill_phrases(rng, rng.randint(8, 16))),
+        "",
+        "EXPERIENCE",
+    ]
+    while sum(len(ln) + 1 for ln in lines) < target_chars:
+        lines.append(f"{rng.choice(COMPANIES)} - {label.replace('_', ' ').title()} ({rng.randint(2012, 2025)})")
+        lines.extend(_bullet(rng, label) for _ in range(rng.randint(3, 6)))
+        lines.append("")
+    lines.extend(["EDUCATION", "B.Sc. Computer Science"])
+    return SyntheticDoc(label=label, lines=lines)
+
+
+def make_jd(rng: random.Random, target_chars: int, label: str | None = None) -> SyntheticDoc:
+    """
+    Job description of roughly `target_chars` characters for one role label.
+    """
+    label = label or rng.choice(sorted(LABEL_TEMPLATES))
+    lines = [
+        f"We are hiring a {label.replace('_', ' ')}.",
+        "Requirements: " + ", ".join(_skill_phrases(rng, rng.randint(6, 12))) + ".",
+    ]
+    while sum(len(ln) + 1 for ln in lines) < target_chars:
+        lines.append(_bullet(rng, label)[2:])
+    return SyntheticDoc(label=label, lines=lines)
+
+
+def _wrap(lines: list[str]) -> list[str]:
+    out: list[str] = []
+    for ln in lines:
+        out.extend(textwrap.wrap(ln, LINE_WIDTH) or [""])
+    return out
+
+
+def _pdf_escape(s: str) -> str:
+    s = s.encode("latin-1", errors="replace").decode("latin-1")
+    return s.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def build_pdf(lines: list[str], lines_per_page: int = LINES_PER_PAGE) -> bytes:
+    """
+    Minimal multi-page text PDF: lines wrapped to LINE_WIDTH, `lines_per_page` per page.
+    """
+    wrapped = _wrap(lines) or [""]
+    return build_pdf_pages([wrapped[i : i + lines_per_page] for i in range(0, len(wrapped), lines_per_page)])
+
+
+def build_pdf_pages(pages: list[list[str]]) -> bytes:
+    """
+    Minimal text PDF with the given lines on each page (Helvetica, one text
+    block per page), enough for pypdf to extract. Also used by tests/conftest.py.
+    """
+    objects: list[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # pages tree, filled in below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for page in pages:
+        body = " T* ".join(f"({_pdf_escape(ln)}) Tj" for ln in page)
+        stream = f"BT /F1 10 Tf 13 TL 50 770 Td {body} ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % k for k in kids), len(kids))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (i, obj))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for off in offsets:
+        out.write(b"%010d 00000 n \n" % off)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def build_docx(lines: list[str]) -> bytes:
+    doc = Document()
+    for ln in lines:
+        doc.add_paragraph(ln)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic resume / JD corpus")
+    parser.add_argument("--out", default="benchmarks/corpus", help="Output directory")
+    parser.add_argument("--count", type=int, default=20, help="Resumes per format")
+    parser.add_argument("--chars", type=int, default=4000, help="Approximate characters per resume")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+
+    for i in range(args.count):
+        doc = make_resume(rng, args.chars)
+        (out / f"resume_{i:04d}_{doc.label}.pdf").write_bytes(build_pdf(doc.lines))
+        doc = make_resume(rng, args.chars)
+        (out / f"resume_{i:04d}_{doc.label}.docx").write_bytes(build_docx(doc.lines))
+    for label in sorted(LABEL_TEMPLATES):
+        (out / f"jd_{label}.txt").write_text(make_jd(rng, 1500, label).text, encoding="utf-8")
+
+    print(f"✅ Generated corpus: {out} ({args.count * 2} resumes, {len(LABEL_TEMPLATES)} JDs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,49 @@ class Settings(BaseSettings):
     MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
     API_VERSION: str = "1.0.0"
 
+    # Analysis pipeline pool ("thread" or "process")
+    PIPELINE_EXECUTOR: str = "thread"
+    PIPELINE_WORKERS: int = 4
+    PIPELINE_QUEUE_SIZE: int = 16
+    PIPELINE_RETRY_AFTER_SECONDS: int = 5
+
+    # Parse cache (content-addressed; empty path = memory tier only)
+    PARSE_CACHE_ENABLED: bool = True
+    PARSE_CACHE_PATH: str = ".cache/parse_cache.sqlite3"
+    PARSE_CACHE_MEMORY_ITEMS: int = 256
+    PARSE_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    PARSE_CACHE_MAX_AGE_SECONDS: int = 7 * 24 * 3600
+
+    # Extraction budget per document (0 = unlimited); truncated results are flagged
+    MAX_PDF_PAGES: int = 50
+    MAX_TEXT_CHARS: int = 200_000
+    MAX_PARSE_SECONDS: float = 20.0
+    # >1 extracts pages of large PDFs in parallel (process pool); 1 = sequential
+    PDF_PAGE_WORKERS: int = 1
+
+    # Batch ranking (/rank)
+    RANK_MAX_RESUMES: int = 200
+    RANK_PARSE_WORKERS: int = 4
+
+    # Skill search (GET /search): index built by `resume-analyzer index`, reloaded when replaced
+    SKILL_INDEX_PATH: str = ".cache/skill_index.npz"
+    SEARCH_MAX_LIMIT: int = 100
+
+    # Stored JDs (POST /jds, POST /match/jobs): SQLite rows with precomputed skills and vectors
+    JDS_DB_PATH: str = ".cache/jds.sqlite3"
+    JDS_MAX_PER_REQUEST: int = 500
+
+    # Startup: preload models / taxonomy and run one dummy analysis before /ready says yes
+    WARMUP_ON_STARTUP: bool = True
+
+    # Async jobs (POST /jobs): SQLite-backed queue drained through the pipeline pool
+    JOBS_ENABLED: bool = True
+    JOBS_DB_PATH: str = ".cache/jobs.sqlite3"
+    JOBS_WORKERS: int = 2
+    JOBS_MAX_AGE_SECONDS: int = 24 * 3600
+    # All uploads of one job together (each file is still capped by MAX_UPLOAD_BYTES)
+    JOBS_MAX_TOTAL_BYTES: int = 100 * 1024 * 1024
+
     model_config = ConfigDict(env_file=".env")
 
 
@@ -17,8 +17,34 @@ def unauthorized(msg: str = "Unauthorized") -> HTTPException:
     )
 
 
+def not_found(msg: str = "Not found", detail: str | None = None) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={"error": msg, "detail": detail},
+    )
+
+
 def too_large(msg: str = "File too large", detail: str | None = None) -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
         detail={"error": msg, "detail": detail},
     )
+
+
+def too_many_requests(
+    msg: str = "Too many requests",
+    detail: str | None = None,
+    retry_after: int = 5,
+) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail={"error": msg, "detail": detail},
+        headers={"Retry-After": str(max(1, int(retry_after)))},
+    )
+
+
+def unavailable(msg: str = "Service unavailable", detail: str | None = None) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail={"error": msg, "detail": detail},
+    )
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+EXECUTOR_KINDS = {"thread", "process"}
+
+
+class PipelineSaturated(Exception):
+    """
+    Raised when every worker is busy and the wait queue is full.
+    """
+
+
+class PipelineExecutor:
+    """
+    Bounded pool for the CPU-bound analysis pipeline.
+
+    Work runs on a thread or process pool so the event loop stays free for
+    other connections. At most `max_workers` jobs run at once and at most
+    `max_queue` more may wait; anything beyond that is rejected immediately
+    with PipelineSaturated instead of piling up behind a slow document.
+
+    With kind="process", `fn` and its arguments must be picklable (module-level
+    functions, bytes/str arguments). `initializer` runs once in each worker
+    process (e.g. to load models before the first request lands there).
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue: int = 16,
+        kind: str = "thread",
+        initializer: Optional[Callable[[], Any]] = None,
+    ):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind: {kind}. Use one of {sorted(EXECUTOR_KINDS)}")
+
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(0, int(max_queue))
+        self.kind = kind
+        self.initializer = initializer
+
+        self._pool: Executor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0  # accepted and not yet finished (running + queued)
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    @property
+    def in_flight(self) -> int:
+        return min(self._pending, self.max_workers)
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self._pending - self.max_workers)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+        }
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    if self.kind == "process":
+                        self._pool = ProcessPoolExecutor(
+                            max_workers=self.max_workers, initializer=self.initializer
+                        )
+                    else:
+                        self._pool = ThreadPoolExecutor(
+                            max_workers=self.max_workers, thread_name_prefix="pipeline"
+                        )
+        return self._pool
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> Future[T]:
+        """
+        Synchronous counterpart of run() for callers outside the event loop
+        (e.g. the job runner): same slots, same PipelineSaturated when full.
+        """
+        with self._lock:
+            if self._pending >= self.capacity:
+                raise PipelineSaturated(
+                    f"Pipeline saturated ({self.max_workers} running, {self.max_queue} queued)"
+                )
+            self._pending += 1
+
+        try:
+            future = self._get_pool().submit(fn, *args)
+        except Exception:
+            self._release()
+            raise
+
+        # Release the slot when the job really finishes, not when the awaiting request goes away.
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future: object = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
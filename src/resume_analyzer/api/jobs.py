@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import CancelledError
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .executor import PipelineExecutor, PipelineSaturated
+
+
+log = logging.getLogger("resume_analyzer.api.jobs")
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class JobFile:
+    role: str  # "resume" | "jd"
+    filename: Optional[str]
+    data: bytes
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    status: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    files: List[JobFile] = field(default_factory=list)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+
+class JobStore:
+    """
+    SQLite-backed job queue. Inputs are stored with the job so queued work
+    survives a restart; they are dropped once the job finishes.
+
+    Claiming is a single UPDATE ... RETURNING, so several worker threads (or
+    processes sharing the file) never pick up the same job.
+    """
+
+    def __init__(self, path: str | Path, max_age_seconds: float = 24 * 3600):
+        self.path = Path(path)
+        self.max_age_seconds = float(max_age_seconds)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL, params TEXT NOT NULL,"
+            " result TEXT, error TEXT, created_at REAL NOT NULL, started_at REAL, finished_at REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS job_files ("
+            " job_id TEXT NOT NULL, position INTEGER NOT NULL, role TEXT NOT NULL,"
+            " filename TEXT, data BLOB NOT NULL, PRIMARY KEY (job_id, position))"
+        )
+
+    def submit(self, kind: str, params: Dict[str, Any], files: List[JobFile]) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "INSERT INTO job_files (job_id, position, role, filename, data) VALUES (?, ?, ?, ?, ?)",
+                    [(job_id, i, f.role, f.filename, f.data) for i, f in enumerate(files)],
+                )
+                self._db.execute(
+                    "INSERT INTO jobs (id, kind, status, params, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (job_id, kind, QUEUED, json.dumps(params), now),
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, kind, status, params, result, error, created_at, started_at, finished_at"
+                " FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return Job(
+            id=row[0],
+            kind=row[1],
+            status=row[2],
+            params=json.loads(row[3]),
+            result=json.loads(row[4]) if row[4] else None,
+            error=row[5],
+            created_at=row[6],
+            started_at=row[7],
+            finished_at=row[8],
+        )
+
+    def claim(self) -> Optional[Job]:
+        """
+        Move the oldest queued job to running and return it with its input files.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "UPDATE jobs SET status = ?, started_at = ? WHERE id = ("
+                " SELECT id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1"
+                ") AND status = ? RETURNING id, kind, params, created_at",
+                (RUNNING, now, QUEUED, QUEUED),
+            ).fetchone()
+            if row is None:
+                return None
+            files = [
+                JobFile(role=r[0], filename=r[1], data=r[2])
+                for r in self._db.execute(
+                    "SELECT role, filename, data FROM job_files WHERE job_id = ? ORDER BY position", (row[0],)
+                )
+            ]
+        return Job(
+            id=row[0], kind=row[1], status=RUNNING, params=json.loads(row[2]),
+            files=files, created_at=row[3], started_at=now,
+        )
+
+    def finish(self, job_id: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+                (
+                    FAILED if error is not None else DONE,
+                    json.dumps(result, ensure_ascii=False) if result is not None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                ),
+            )
+            self._db.execute("DELETE FROM job_files WHERE job_id = ?", (job_id,))
+
+    def release(self, job_id: str) -> None:
+        """
+        Hand a claimed job back to the queue untouched (no free worker to run it yet).
+        """
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, started_at = NULL WHERE id = ? AND status = ?",
+                (QUEUED, job_id, RUNNING),
+            )
+
+    def requeue_running(self) -> int:
+        """
+        After a restart nothing is really running: put interrupted jobs back in the queue.
+        """
+        with self._lock:
+            cur = self._db.execute(
+                "UPDATE jobs SET status = ?, started_at = NULL WHERE status = ?", (QUEUED, RUNNING)
+            )
+            return cur.rowcount
+
+    def purge(self, now: Optional[float] = None) -> int:
+        """
+        Delete finished jobs older than max_age_seconds.
+        """
+        if self.max_age_seconds <= 0:
+            return 0
+        cutoff = (now or time.time()) - self.max_age_seconds
+        with self._lock:
+            cur = self._db.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?", (DONE, FAILED, cutoff)
+            )
+            return cur.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        out = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        out.update({status: n for status, n in rows})
+        return out
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+JobHandler = Callable[[Job], Dict[str, Any]]
+
+
+class JobRunner:
+    """
+    Local worker threads draining a JobStore. `handlers` maps job kind to a
+    function returning the JSON-serializable result; an exception fails the job.
+
+    With `executor` (the API's PipelineExecutor) the handlers run on its pool,
+    sharing its worker and queue bounds with interactive requests; a job that
+    finds the pool saturated goes back to the queue and is retried on the next
+    poll. Without it they run on the runner's own threads.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        handlers: Dict[str, JobHandler],
+        workers: int = 2,
+        poll_interval: float = 0.5,
+        executor: Optional[PipelineExecutor] = None,
+    ):
+        self.store = store
+        self.handlers = handlers
+        self.executor = executor
+        self.workers = max(1, int(workers))
+        self.poll_interval = float(poll_interval)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        requeued = self.store.requeue_running()
+        if requeued:
+            log.info("Requeued %d interrupted job(s)", requeued)
+        self.store.purge()
+        for i in range(self.workers):
+            t = threading.Thread(target=self._loop, name=f"job-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def notify(self) -> None:
+        """
+        Wake an idle worker right away instead of waiting for the next poll.
+        """
+        self._wake.set()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads.clear()
+
+    def run_one(self) -> Optional[Tuple[str, str]]:
+        """
+        Claim and execute one job. Returns (job id, final status), or None when
+        the queue is empty or the pipeline has no free slot.
+        """
+        job = self.store.claim()
+        if job is None:
+            return None
+        handler = self.handlers.get(job.kind)
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job kind: {job.kind}")
+            if self.executor is None:
+                result = handler(job)
+            else:
+                try:
+                    future = self.executor.submit(handler, job)
+                except PipelineSaturated:
+                    self.store.release(job.id)
+                    return None
+                try:
+                    result = future.result()
+                except CancelledError:  # pool shut down under it: rerun after restart
+                    self.store.release(job.id)
+                    return None
+        except Exception as e:
+            log.warning("Job %s (%s) failed: %s", job.id, job.kind, e)
+            self.store.finish(job.id, error=str(e) or type(e).__name__)
+            return job.id, FAILED
+        self.store.finish(job.id, result=result)
+        return job.id, DONE
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ran = self.run_one()
+            except Exception:  # store trouble: back off, keep the worker alive
+                log.exception("Job worker error")
+                ran = None
+            if ran is None:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
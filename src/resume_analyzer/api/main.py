@@ -1,42 +1,411 @@
 from __future__ import annotations
 
-import tempfile
+import threading
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import Depends, FastAPI, File, Form, UploadFile
+from fastapi import Depends, FastAPI, File, Form, Query, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 
 from .auth import require_api_key
 from .config import settings
 from .deps import ALLOWED_JD_EXT, ALLOWED_RESUME_EXT, validate_upload
-from .schemas import AnalyzeResponse, ContactOut, MatchOut, RolePredictionOut
+from .errors import bad_request, not_found, too_large, too_many_requests, unavailable
+from .executor import PipelineExecutor, PipelineSaturated
+from .jobs import Job, JobFile, JobRunner, JobStore
+from .metrics import PipelineMetrics
+from .schemas import (
+    AnalyzeResponse,
+    ContactOut,
+    JDRegisterRequest,
+    JDRegisterResponse,
+    JobMatchOut,
+    JobOut,
+    JobSubmittedOut,
+    MatchJobsResponse,
+    MatchOut,
+    RankedResumeOut,
+    RankErrorOut,
+    RankResponse,
+    RolePredictionOut,
+    SearchHitOut,
+    SearchResponse,
+    StoredJDOut,
+)
+from .services.analyze_service import analyze_resume
 
 # Existing pipeline functions
-from resume_analyzer.parsing.resume import extract_resume_text
-from resume_analyzer.parsing.contact import extract_contact_info
-from resume_analyzer.skills.extract import extract_skills
-from resume_analyzer.scoring.match import match_resume_to_jd
-from resume_analyzer.ml.role_predictor import RolePredictor
+from resume_analyzer.document import JobDescription, ResumeDocument, resumes_from_sources
+from resume_analyzer.parsing.batch import shutdown_pools
+from resume_analyzer.parsing.budget import ExtractionBudget
+from resume_analyzer.parsing.cache import ParseCache
+from resume_analyzer.scoring.jd_index import JDIndex
+from resume_analyzer.scoring.match import MatchResult, match_resume_to_jd
+from resume_analyzer.scoring.rank import rank_resumes
+from resume_analyzer.ml.registry import get_role_predictor
+from resume_analyzer.skills.index import get_skill_index
+from resume_analyzer.utils.timing import StageTimer
+from resume_analyzer.warmup import warm_up
 
 
 # -------------------------------------------------------------------
 # Helpers
 # -------------------------------------------------------------------
 
-def _bytes_to_tempfile(data: bytes, filename: str) -> Path:
+_parse_cache: ParseCache | None = None
+_parse_cache_lock = threading.Lock()
+
+
+def _get_parse_cache() -> ParseCache | None:
+    """
+    Per-process parse cache built from settings (pipeline workers may be separate processes).
+    """
+    global _parse_cache
+    if not settings.PARSE_CACHE_ENABLED:
+        return None
+    if _parse_cache is None:
+        with _parse_cache_lock:
+            if _parse_cache is None:
+                _parse_cache = ParseCache(
+                    path=settings.PARSE_CACHE_PATH or None,
+                    max_memory_items=settings.PARSE_CACHE_MEMORY_ITEMS,
+                    max_disk_bytes=settings.PARSE_CACHE_MAX_BYTES,
+                    max_age_seconds=settings.PARSE_CACHE_MAX_AGE_SECONDS,
+                )
+    return _parse_cache
+
+
+def _parse_budget() -> ExtractionBudget:
+    return ExtractionBudget(
+        max_pages=settings.MAX_PDF_PAGES or None,
+        max_chars=settings.MAX_TEXT_CHARS or None,
+        max_seconds=settings.MAX_PARSE_SECONDS or None,
+    )
+
+
+def _jd_document(
+    jd_text: str | None,
+    jd_bytes: bytes | None,
+    jd_filename: str | None,
+) -> JobDescription | None:
+    """
+    Raw JD text wins; otherwise decode a .txt upload or parse a PDF/DOCX one.
+    """
+    if jd_text and jd_text.strip():
+        return JobDescription(jd_text.strip())
+
+    if jd_bytes is not None and jd_filename is not None:
+        ext = (Path(jd_filename).suffix or "").lower()
+        if ext == ".txt":
+            text = jd_bytes.decode("utf-8", errors="ignore")
+            if settings.MAX_TEXT_CHARS:
+                text = text[: settings.MAX_TEXT_CHARS]
+            return JobDescription(text)
+        return JobDescription.from_source(jd_bytes, cache=_get_parse_cache(), budget=_parse_budget())
+
+    return None
+
+
+def _match_out(m: MatchResult) -> MatchOut:
+    return MatchOut(
+        similarity_score=float(m.similarity_score),
+        skill_coverage=float(m.skill_coverage),
+        final_score=float(m.final_score),
+        resume_skills=list(m.resume_skills),
+        jd_skills=list(m.jd_skills),
+        matched_skills=list(m.matched_skills),
+        missing_skills=list(m.missing_skills),
+    )
+
+
+def _analyze_pipeline(
+    resume_bytes: bytes,
+    resume_filename: str | None,
+    jd_bytes: bytes | None,
+    jd_filename: str | None,
+    jd_text: str | None,
+) -> tuple[AnalyzeResponse, StageTimer]:
+    """
+    CPU-bound part of /analyze. Runs on the pipeline executor, never on the
+    event loop, so it stays module-level with picklable arguments.
+    Returns the response plus the per-stage timings for metrics / Server-Timing.
+    """
+    timer = StageTimer()
+
+    # 1) Resume → document (parsed in memory; type sniffed from magic bytes).
+    #    Features are computed once and shared by every later stage.
+    #    Page / character / time budgets bound the work on oversized uploads.
+    with timer.stage("parse"):
+        resume_doc = ResumeDocument.from_source(
+            resume_bytes,
+            cache=_get_parse_cache(),
+            budget=_parse_budget(),
+            page_workers=settings.PDF_PAGE_WORKERS,
+        )
+    timer.document(resume_doc)
+
+    # 2) Contact + skills
+    with timer.stage("contact"):
+        contact = resume_doc.contact
+    with timer.stage("skills"):
+        skills = sorted(resume_doc.skills)
+
+    # 3) Role prediction (optional)
+    role_prediction: list[RolePredictionOut] = []
+    role_model: str | None = None
+    role_model_version: str | None = None
+
+    with timer.stage("role"):
+        try:
+            predictor = get_role_predictor()
+            pred = predictor.predict(resume_doc)
+            role_prediction = [
+                RolePredictionOut(
+                    label=pred.label,
+                    confidence=float(pred.confidence),
+                )
+            ]
+            role_model = str(predictor.model_path)
+            role_model_version = predictor.model_version
+        except Exception:
+            role_prediction = []
+            role_model = None
+            role_model_version = None
+
+    # 4) JD document
+    with timer.stage("jd"):
+        jd_doc = _jd_document(jd_text, jd_bytes, jd_filename)
+    if jd_doc is not None and jd_doc.extraction is not None:
+        timer.document(jd_doc)
+
+    # 5) Match resume ↔ JD
+    match_out: MatchOut | None = None
+    if jd_doc is not None and jd_doc.text:
+        with timer.stage("match"):
+            match_out = _match_out(match_resume_to_jd(resume_doc, jd_doc))
+
+    # 6) Response DTO
+    response = AnalyzeResponse(
+        resume_filename=resume_filename,
+        contact=ContactOut(
+            email=contact.email,
+            phones=contact.phones,
+            linkedin=contact.linkedin,
+            github=contact.github,
+            links=contact.links,
+        ),
+        skills=skills,
+        role_prediction=role_prediction,
+        role_model=role_model,
+        role_model_version=role_model_version,
+        match=match_out,
+        truncated=resume_doc.truncated,
+        truncation_reason=resume_doc.extraction.reason if resume_doc.extraction else None,
+    )
+    return response, timer
+
+
+def _rank_pipeline(
+    resumes: list[tuple[str | None, bytes]],
+    jd_text: str | None,
+    jd_bytes: bytes | None,
+    jd_filename: str | None,
+    top_k: int,
+) -> tuple[RankResponse, StageTimer]:
+    """
+    CPU-bound part of /rank: parse all resumes in parallel, then score them
+    against the JD and predict the shortlist's roles, each in one batch.
+    """
+    timer = StageTimer()
+
+    with timer.stage("jd"):
+        jd_doc = _jd_document(jd_text, jd_bytes, jd_filename)
+    if jd_doc is None or not jd_doc.text:
+        raise ValueError("Job description is empty.")
+
+    with timer.stage("parse"):
+        parsed = resumes_from_sources(
+            [data for _, data in resumes],
+            cache=_get_parse_cache(),
+            workers=settings.RANK_PARSE_WORKERS,
+            budget=_parse_budget(),
+        )
+
+    docs: list[ResumeDocument] = []
+    names: list[str | None] = []
+    errors: list[RankErrorOut] = []
+    for (filename, _), outcome in zip(resumes, parsed):
+        if isinstance(outcome, Exception):
+            errors.append(RankErrorOut(resume_filename=filename, error=str(outcome) or type(outcome).__name__))
+            continue
+        docs.append(outcome)
+        names.append(filename)
+        timer.document(outcome)
+
+    with timer.stage("rank"):
+        ranked = rank_resumes(jd_doc, docs, top_k=top_k)
+
+    # Top-3 roles of the shortlisted resumes, in one model call (optional, like in /analyze)
+    roles: list[list[RolePredictionOut]] = [[] for _ in ranked]
+    role_model_version: str | None = None
+    with timer.stage("role"):
+        try:
+            predictor = get_role_predictor()
+            batch = predictor.predict_topk_batch([docs[r.index] for r in ranked], k=3)
+            roles = [[RolePredictionOut(label=p.label, confidence=p.confidence) for p in row] for row in batch]
+            role_model_version = predictor.model_version
+        except Exception:
+            pass
+
+    response = RankResponse(
+        jd_skills=sorted(jd_doc.skills),
+        total_resumes=len(resumes),
+        results=[
+            RankedResumeOut(
+                rank=pos,
+                resume_filename=names[r.index],
+                match=_match_out(r.result),
+                truncated=docs[r.index].truncated,
+                role_prediction=role_rows,
+            )
+            for pos, (r, role_rows) in enumerate(zip(ranked, roles), start=1)
+        ],
+        errors=errors,
+        role_model_version=role_model_version,
+    )
+    return response, timer
+
+
+_jd_indexes: dict[str, JDIndex] = {}
+_jd_indexes_lock = threading.Lock()
+
+
+def _get_jd_index() -> JDIndex:
+    """
+    Per-process JD index on settings.JDS_DB_PATH (pipeline workers may be
+    separate processes; they all see the same rows through the file).
+    """
+    path = settings.JDS_DB_PATH
+    index = _jd_indexes.get(path)
+    if index is None:
+        with _jd_indexes_lock:
+            index = _jd_indexes.get(path)
+            if index is None:
+                index = _jd_indexes[path] = JDIndex(path)
+    return index
+
+
+def _close_jd_indexes() -> None:
+    with _jd_indexes_lock:
+        for index in _jd_indexes.values():
+            index.close()
+        _jd_indexes.clear()
+
+
+def _register_jds_pipeline(
+    jds: list[tuple[str, str | None, str | None]],
+) -> tuple[JDRegisterResponse, StageTimer]:
+    """
+    CPU-bound part of /jds: extract each JD's skills and vectorize them, then store.
+    jds are (text, title, id); texts over MAX_TEXT_CHARS are cut and flagged.
+    """
+    timer = StageTimer()
+    limit = settings.MAX_TEXT_CHARS
+    index = _get_jd_index()
+    with timer.stage("register"):
+        stored = index.add_many(
+            [text[:limit] if limit else text for text, _, _ in jds],
+            [title for _, title, _ in jds],
+            [jd_id for _, _, jd_id in jds],
+        )
+    response = JDRegisterResponse(
+        registered=[
+            StoredJDOut(id=s.id, title=s.title, skills=s.skills, truncated=bool(limit) and len(text) > limit)
+            for s, (text, _, _) in zip(stored, jds)
+        ],
+        total_jds=len(index),
+    )
+    return response, timer
+
+
+def _match_jobs_pipeline(
+    resume_bytes: bytes,
+    resume_filename: str | None,
+    top_k: int,
+) -> tuple[MatchJobsResponse, StageTimer]:
+    """
+    CPU-bound part of /match/jobs: parse the resume, then score it against
+    every stored JD (precomputed vectors and skill sets).
     """
-    Write bytes to a temp file so existing extract_resume_text(path)
-    can be reused without modification.
+    timer = StageTimer()
+    with timer.stage("parse"):
+        resume_doc = ResumeDocument.from_source(
+            resume_bytes,
+            cache=_get_parse_cache(),
+            budget=_parse_budget(),
+            page_workers=settings.PDF_PAGE_WORKERS,
+        )
+    timer.document(resume_doc)
+    with timer.stage("skills"):
+        skills = sorted(resume_doc.skills)
+
+    index = _get_jd_index()
+    with timer.stage("match"):
+        matches = index.match(resume_doc, top_k=top_k)
+
+    response = MatchJobsResponse(
+        resume_filename=resume_filename,
+        resume_skills=skills,
+        total_jds=len(index),
+        results=[
+            JobMatchOut(rank=pos, jd_id=m.jd_id, title=m.title, match=_match_out(m.result))
+            for pos, m in enumerate(matches, start=1)
+        ],
+        truncated=resume_doc.truncated,
+    )
+    return response, timer
+
+
+def _job_jd(job: Job) -> tuple[str | None, bytes | None, str | None]:
+    jd = next((f for f in job.files if f.role == "jd"), None)
+    if jd is None:
+        return job.params.get("jd_text"), None, None
+    return job.params.get("jd_text"), jd.data, jd.filename
+
+
+def _run_analyze_job(job: Job) -> dict:
+    """
+    Same pipeline as analyze_service.analyze_resume, result shaped like /analyze.
     """
-    suffix = Path(filename).suffix or ".bin"
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-    try:
-        tmp.write(data)
-        tmp.flush()
-        return Path(tmp.name)
-    finally:
-        tmp.close()
+    resume = next(f for f in job.files if f.role == "resume")
+    jd_text, jd_bytes, jd_filename = _job_jd(job)
+    jd_document: bytes | None = None
+    if not (jd_text and jd_text.strip()) and jd_bytes is not None:
+        if (Path(jd_filename or "").suffix or "").lower() == ".txt":
+            jd_text = jd_bytes.decode("utf-8", errors="ignore")
+        else:
+            jd_document = jd_bytes
+
+    data = analyze_resume(
+        resume.data, jd_text, jd_document, cache=_get_parse_cache(), budget=_parse_budget()
+    )
+    return AnalyzeResponse(resume_filename=resume.filename, **data).model_dump()
+
+
+def _run_rank_job(job: Job) -> dict:
+    resumes = [(f.filename, f.data) for f in job.files if f.role == "resume"]
+    jd_text, jd_bytes, jd_filename = _job_jd(job)
+    response, _ = _rank_pipeline(resumes, jd_text, jd_bytes, jd_filename, int(job.params.get("top_k", 10)))
+    return response.model_dump()
+
+
+JOB_HANDLERS = {"analyze": _run_analyze_job, "rank": _run_rank_job}
+
+
+def _warm_up_app(app: FastAPI) -> None:
+    app.state.warmup = warm_up()
+    app.state.ready = True
 
 
 # -------------------------------------------------------------------
@@ -44,7 +413,50 @@ def _bytes_to_tempfile(data: bytes, filename: str) -> Path:
 # -------------------------------------------------------------------
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Resume Analyzer", version=settings.API_VERSION)
+    pipeline = PipelineExecutor(
+        max_workers=settings.PIPELINE_WORKERS,
+        max_queue=settings.PIPELINE_QUEUE_SIZE,
+        kind=settings.PIPELINE_EXECUTOR,
+        # Process workers have their own models; warm each one as it starts
+        initializer=warm_up if settings.WARMUP_ON_STARTUP else None,
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if settings.WARMUP_ON_STARTUP:
+            # Off the event loop, so /health answers while models load
+            threading.Thread(target=_warm_up_app, args=(app,), name="warmup", daemon=True).start()
+        else:
+            app.state.ready = True
+
+        runner: JobRunner | None = None
+        if settings.JOBS_ENABLED:
+            store = JobStore(settings.JOBS_DB_PATH, max_age_seconds=settings.JOBS_MAX_AGE_SECONDS)
+            runner = JobRunner(store, JOB_HANDLERS, workers=settings.JOBS_WORKERS, executor=pipeline)
+            runner.start()
+            app.state.jobs = runner
+        yield
+        if runner is not None:
+            app.state.jobs = None
+            runner.stop(timeout=5)
+            runner.store.close()
+        pipeline.shutdown(wait=False)
+        shutdown_pools()
+        _close_jd_indexes()
+
+    metrics = PipelineMetrics(
+        gauges=lambda: {
+            "resume_analyzer_pipeline_in_flight": pipeline.in_flight,
+            "resume_analyzer_pipeline_queue_depth": pipeline.queue_depth,
+        }
+    )
+
+    app = FastAPI(title="Resume Analyzer", version=settings.API_VERSION, lifespan=lifespan)
+    app.state.pipeline = pipeline
+    app.state.metrics = metrics
+    app.state.jobs = None  # JobRunner, started by the lifespan
+    app.state.ready = False  # flipped by warm-up (or at startup when warm-up is off)
+    app.state.warmup = None
 
     # -----------------------------
     # CORS
@@ -74,12 +486,36 @@ def create_app() -> FastAPI:
             "status": "running",
             "docs": "/docs",
             "health": "/health",
+            "ready": "/ready",
             "analyze": "/analyze",
+            "rank": "/rank",
+            "search": "/search",
+            "jds": "/jds",
+            "match_jobs": "/match/jobs",
+            "metrics": "/metrics",
+            "jobs": "/jobs",
         }
 
     @app.get("/health")
     def health():
-        return {"status": "ok", "version": settings.API_VERSION}
+        return {
+            "status": "ok",
+            "version": settings.API_VERSION,
+            "pipeline": pipeline.stats(),
+            "parse_cache": _parse_cache.stats() if _parse_cache is not None else None,
+        }
+
+    @app.get("/ready")
+    def ready():
+        """
+        Readiness probe: 503 until warm-up has finished, then 200.
+        """
+        body = {"ready": app.state.ready, "warmup": app.state.warmup}
+        return JSONResponse(body, status_code=200 if app.state.ready else 503)
+
+    @app.get("/metrics", include_in_schema=False)
+    def prometheus_metrics():
+        return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
 
     # -----------------------------
     # Analyze endpoint
@@ -91,102 +527,322 @@ def create_app() -> FastAPI:
             400: {"model": dict},
             401: {"model": dict},
             413: {"model": dict},
+            429: {"model": dict},
         },
     )
     async def analyze(
+        response: Response,
         resume: UploadFile = File(...),
         jd_file: UploadFile | None = File(None),
         jd_text: str | None = Form(None),
         _: str = Depends(require_api_key),
     ) -> AnalyzeResponse:
 
-        # 1) Validate uploads
-        resume_bytes = await validate_upload(
-            resume, ALLOWED_RESUME_EXT, "resume"
-        )
+        with metrics.track("analyze") as tracked:
+            # 1) Validate uploads
+            resume_bytes = await validate_upload(
+                resume, ALLOWED_RESUME_EXT, "resume"
+            )
 
-        jd_bytes: bytes | None = None
-        if jd_file is not None:
-            jd_bytes = await validate_upload(
-                jd_file, ALLOWED_JD_EXT, "jd_file"
+            jd_bytes: bytes | None = None
+            if jd_file is not None:
+                jd_bytes = await validate_upload(
+                    jd_file, ALLOWED_JD_EXT, "jd_file"
+                )
+
+            # 2) Parse / extract / predict / match off the event loop
+            try:
+                result, tracked.timer = await pipeline.run(
+                    _analyze_pipeline,
+                    resume_bytes,
+                    resume.filename,
+                    jd_bytes,
+                    jd_file.filename if jd_file is not None else None,
+                    jd_text,
+                )
+            except PipelineSaturated as e:
+                raise too_many_requests(
+                    "Analysis queue full",
+                    str(e),
+                    retry_after=settings.PIPELINE_RETRY_AFTER_SECONDS,
+                )
+            except ValueError as e:
+                raise bad_request("Unsupported document", str(e))
+
+            response.headers["Server-Timing"] = tracked.server_timing()
+            return result
+
+    # -----------------------------
+    # Rank endpoint (one JD, many resumes)
+    # -----------------------------
+    @app.post(
+        "/rank",
+        response_model=RankResponse,
+        responses={
+            400: {"model": dict},
+            401: {"model": dict},
+            413: {"model": dict},
+            429: {"model": dict},
+        },
+    )
+    async def rank(
+        response: Response,
+        resumes: list[UploadFile] = File(...),
+        jd_file: UploadFile | None = File(None),
+        jd_text: str | None = Form(None),
+        top_k: int = Form(10),
+        _: str = Depends(require_api_key),
+    ) -> RankResponse:
+
+        with metrics.track("rank") as tracked:
+            # 1) Validate uploads
+            if len(resumes) > settings.RANK_MAX_RESUMES:
+                raise bad_request(
+                    "Too many resumes",
+                    f"Max resumes per request: {settings.RANK_MAX_RESUMES}, got: {len(resumes)}",
+                )
+
+            resume_files: list[tuple[str | None, bytes]] = []
+            for r in resumes:
+                resume_files.append(
+                    (r.filename, await validate_upload(r, ALLOWED_RESUME_EXT, "resume"))
+                )
+
+            jd_bytes: bytes | None = None
+            if jd_file is not None:
+                jd_bytes = await validate_upload(
+                    jd_file, ALLOWED_JD_EXT, "jd_file"
+                )
+            elif not (jd_text and jd_text.strip()):
+                raise bad_request("jd missing", "Provide jd_text or jd_file")
+
+            # 2) Parse + score off the event loop
+            try:
+                result, tracked.timer = await pipeline.run(
+                    _rank_pipeline,
+                    resume_files,
+                    jd_text,
+                    jd_bytes,
+                    jd_file.filename if jd_file is not None else None,
+                    top_k,
+                )
+            except PipelineSaturated as e:
+                raise too_many_requests(
+                    "Analysis queue full",
+                    str(e),
+                    retry_after=settings.PIPELINE_RETRY_AFTER_SECONDS,
+                )
+            except ValueError as e:
+                raise bad_request("Unsupported document", str(e))
+
+            response.headers["Server-Timing"] = tracked.server_timing()
+            return result
+
+    # -----------------------------
+    # Skill search over the indexed corpus
+    # -----------------------------
+    @app.get(
+        "/search",
+        response_model=SearchResponse,
+        responses={400: {"model": dict}, 401: {"model": dict}, 503: {"model": dict}},
+    )
+    def search(
+        q: str = Query(..., description="Boolean skill query, e.g. 'python AND kafka AND NOT java'"),
+        limit: int = Query(20, ge=1),
+        offset: int = Query(0, ge=0),
+        _: str = Depends(require_api_key),
+    ) -> SearchResponse:
+        with metrics.track("search"):
+            try:
+                index = get_skill_index(settings.SKILL_INDEX_PATH)
+            except FileNotFoundError as e:
+                raise unavailable("Search index not built", f"{e}; run 'resume-analyzer index'")
+            except ValueError as e:  # unreadable / foreign file
+                raise unavailable("Search index unavailable", str(e))
+            try:
+                found = index.search(q, limit=min(limit, settings.SEARCH_MAX_LIMIT), offset=offset)
+            except ValueError as e:
+                raise bad_request("Invalid query", str(e))
+            return SearchResponse(
+                query=q,
+                total=found.total,
+                skills=found.skills,
+                results=[
+                    SearchHitOut(resume=h.key, score=h.score, matched_skills=h.matched_skills)
+                    for h in found.hits
+                ],
+                indexed_resumes=len(index),
             )
 
-        # 2) Resume → text
-        resume_tmp = _bytes_to_tempfile(
-            resume_bytes, resume.filename or "resume.pdf"
-        )
-        try:
-            resume_text = extract_resume_text(str(resume_tmp))
-        finally:
-            resume_tmp.unlink(missing_ok=True)
+    # -----------------------------
+    # Stored JDs (one resume vs. every open role)
+    # -----------------------------
+    @app.post(
+        "/jds",
+        response_model=JDRegisterResponse,
+        status_code=201,
+        responses={400: {"model": dict}, 401: {"model": dict}, 429: {"model": dict}},
+    )
+    async def register_jds(
+        response: Response,
+        body: JDRegisterRequest,
+        _: str = Depends(require_api_key),
+    ) -> JDRegisterResponse:
 
-        # 3) Contact + skills
-        contact = extract_contact_info(resume_text)
-        skills = sorted(extract_skills(resume_text))
+        with metrics.track("jds") as tracked:
+            if not body.jds:
+                raise bad_request("jds missing", "Provide at least one JD")
+            if len(body.jds) > settings.JDS_MAX_PER_REQUEST:
+                raise bad_request(
+                    "Too many JDs",
+                    f"Max JDs per request: {settings.JDS_MAX_PER_REQUEST}, got: {len(body.jds)}",
+                )
 
-        # 4) Role prediction (optional)
-        role_prediction: list[RolePredictionOut] = []
-        role_model: str | None = None
+            try:
+                result, tracked.timer = await pipeline.run(
+                    _register_jds_pipeline, [(jd.text, jd.title, jd.id) for jd in body.jds]
+                )
+            except PipelineSaturated as e:
+                raise too_many_requests(
+                    "Analysis queue full",
+                    str(e),
+                    retry_after=settings.PIPELINE_RETRY_AFTER_SECONDS,
+                )
+            except ValueError as e:
+                raise bad_request("Invalid JD", str(e))
 
-        try:
-            predictor = RolePredictor("models/role_pipeline.joblib")
-            pred = predictor.predict(resume_text)
-            role_prediction = [
-                RolePredictionOut(
-                    label=pred.label,
-                    confidence=float(pred.confidence),
+            response.headers["Server-Timing"] = tracked.server_timing()
+            return result
+
+    @app.delete(
+        "/jds/{jd_id}",
+        status_code=204,
+        responses={401: {"model": dict}, 404: {"model": dict}},
+    )
+    def delete_jd(jd_id: str, _: str = Depends(require_api_key)) -> Response:
+        if not _get_jd_index().remove(jd_id):
+            raise not_found("JD not found", jd_id)
+        return Response(status_code=204)
+
+    @app.post(
+        "/match/jobs",
+        response_model=MatchJobsResponse,
+        responses={
+            400: {"model": dict},
+            401: {"model": dict},
+            413: {"model": dict},
+            429: {"model": dict},
+        },
+    )
+    async def match_jobs(
+        response: Response,
+        resume: UploadFile = File(...),
+        top_k: int = Form(10),
+        _: str = Depends(require_api_key),
+    ) -> MatchJobsResponse:
+
+        with metrics.track("match_jobs") as tracked:
+            resume_bytes = await validate_upload(resume, ALLOWED_RESUME_EXT, "resume")
+
+            # Parse + match off the event loop, on the bounded pipeline pool
+            try:
+                result, tracked.timer = await pipeline.run(
+                    _match_jobs_pipeline, resume_bytes, resume.filename, top_k
                 )
-            ]
-            role_model = "models/role_pipeline.joblib"
-        except Exception:
-            role_prediction = []
-            role_model = None
+            except PipelineSaturated as e:
+                raise too_many_requests(
+                    "Analysis queue full",
+                    str(e),
+                    retry_after=settings.PIPELINE_RETRY_AFTER_SECONDS,
+                )
+            except ValueError as e:
+                raise bad_request("Unsupported document", str(e))
 
-        # 5) JD final text
-        jd_final_text: str | None = None
-
-        if jd_text and jd_text.strip():
-            jd_final_text = jd_text.strip()
-
-        elif jd_bytes is not None and jd_file is not None:
-            ext = (Path(jd_file.filename).suffix or "").lower()
-            if ext == ".txt":
-                jd_final_text = jd_bytes.decode("utf-8", errors="ignore")
-            else:
-                jd_tmp = _bytes_to_tempfile(jd_bytes, jd_file.filename)
-                try:
-                    jd_final_text = extract_resume_text(str(jd_tmp))
-                finally:
-                    jd_tmp.unlink(missing_ok=True)
-
-        # 6) Match resume ↔ JD
-        match_out: MatchOut | None = None
-        if jd_final_text and jd_final_text.strip():
-            m = match_resume_to_jd(resume_text, jd_final_text)
-            match_out = MatchOut(
-                similarity_score=float(m.similarity_score),
-                skill_coverage=float(m.skill_coverage),
-                final_score=float(m.final_score),
-                resume_skills=list(m.resume_skills),
-                jd_skills=list(m.jd_skills),
-                matched_skills=list(m.matched_skills),
-                missing_skills=list(m.missing_skills),
+            response.headers["Server-Timing"] = tracked.server_timing()
+            return result
+
+    # -----------------------------
+    # Async jobs (large / batch analyses)
+    # -----------------------------
+    @app.post(
+        "/jobs",
+        response_model=JobSubmittedOut,
+        status_code=202,
+        responses={
+            400: {"model": dict},
+            401: {"model": dict},
+            413: {"model": dict},
+            503: {"model": dict},
+        },
+    )
+    async def submit_job(
+        resumes: list[UploadFile] = File(...),
+        kind: str = Form("analyze"),
+        jd_file: UploadFile | None = File(None),
+        jd_text: str | None = Form(None),
+        top_k: int = Form(10),
+        _: str = Depends(require_api_key),
+    ) -> JobSubmittedOut:
+        runner: JobRunner | None = app.state.jobs
+        if runner is None:
+            raise unavailable("Jobs disabled", "The job queue is not running")
+
+        # 1) Validate the request shape before reading any upload
+        if kind not in JOB_HANDLERS:
+            raise bad_request("Unknown job kind", f"Allowed: {', '.join(sorted(JOB_HANDLERS))}")
+        if kind == "analyze" and len(resumes) != 1:
+            raise bad_request("One resume per analyze job", f"got: {len(resumes)}")
+        if len(resumes) > settings.RANK_MAX_RESUMES:
+            raise bad_request(
+                "Too many resumes",
+                f"Max resumes per request: {settings.RANK_MAX_RESUMES}, got: {len(resumes)}",
             )
+        if kind == "rank" and jd_file is None and not (jd_text and jd_text.strip()):
+            raise bad_request("jd missing", "Provide jd_text or jd_file")
 
-        # 7) Response DTO
-        return AnalyzeResponse(
-            resume_filename=resume.filename,
-            contact=ContactOut(
-                email=contact.email,
-                phones=contact.phones,
-                linkedin=contact.linkedin,
-                github=contact.github,
-                links=contact.links,
-            ),
-            skills=skills,
-            role_prediction=role_prediction,
-            role_model=role_model,
-            match=match_out,
+        # 2) Read the uploads, stopping as soon as the job as a whole is too big
+        uploads = [("resume", r, ALLOWED_RESUME_EXT) for r in resumes]
+        if jd_file is not None:
+            uploads.append(("jd", jd_file, ALLOWED_JD_EXT))
+        files: list[JobFile] = []
+        total_bytes = 0
+        for role, upload, allowed in uploads:
+            data = await validate_upload(upload, allowed, "resume" if role == "resume" else "jd_file")
+            total_bytes += len(data)
+            if total_bytes > settings.JOBS_MAX_TOTAL_BYTES:
+                raise too_large(
+                    "Job too large",
+                    f"Max total bytes per job: {settings.JOBS_MAX_TOTAL_BYTES}, got at least: {total_bytes}",
+                )
+            files.append(JobFile(role, upload.filename, data))
+
+        # 3) Persist the inputs with the job; the runner hands it to the pipeline pool
+
+        job_id = runner.store.submit(kind, {"jd_text": jd_text, "top_k": top_k}, files)
+        runner.notify()
+        return JobSubmittedOut(id=job_id, kind=kind, status="queued", status_url=f"/jobs/{job_id}")
+
+    @app.get(
+        "/jobs/{job_id}",
+        response_model=JobOut,
+        responses={401: {"model": dict}, 404: {"model": dict}, 503: {"model": dict}},
+    )
+    def get_job(job_id: str, _: str = Depends(require_api_key)) -> JobOut:
+        runner: JobRunner | None = app.state.jobs
+        if runner is None:
+            raise unavailable("Jobs disabled", "The job queue is not running")
+        job = runner.store.get(job_id)
+        if job is None:
+            raise not_found("Job not found", job_id)
+        return JobOut(
+            id=job.id,
+            kind=job.kind,
+            status=job.status,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            error=job.error,
+            result=job.result,
         )
 
     return app
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from resume_analyzer.utils.timing import StageTimer
+
+
+LabelValues = Tuple[str, ...]
+
+# Prometheus client defaults, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PAGE_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+CHAR_BUCKETS = (1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000, 200_000)
+
+
+def _fmt(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{n}="{v}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, value: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + value
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, v in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {_fmt(v)}")
+        return lines
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram in the Prometheus exposition format.
+    Observing is one bisect plus two additions.
+    """
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last), sum]
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1][0] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        bounds = self.buckets + (math.inf,)
+        for labels, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, n in zip(bounds, counts):
+                cumulative += n
+                le = f'le="{_fmt(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_fmt(total[0])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class TrackedRequest:
+    """
+    Handle yielded by PipelineMetrics.track; the endpoint attaches the pipeline's timer.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.timer: Optional[StageTimer] = None
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        return (self.timer or StageTimer()).server_timing(self.elapsed())
+
+
+class PipelineMetrics:
+    """
+    Request / stage latency histograms and document size counters for one app.
+
+    No prometheus_client dependency: the handful of metric types needed here are
+    rendered directly in the text exposition format.
+    """
+
+    def __init__(self, gauges: Callable[[], Dict[str, float]] | None = None):
+        self._lock = threading.Lock()
+        self._gauges = gauges
+        self.request_seconds = Histogram(
+            "resume_analyzer_request_seconds", "End-to-end request latency.", ["endpoint"]
+        )
+        self.stage_seconds = Histogram(
+            "resume_analyzer_stage_seconds", "Latency of one pipeline stage.", ["endpoint", "stage"]
+        )
+        self.document_pages = Histogram(
+            "resume_analyzer_document_pages", "Pages read per parsed document.", buckets=PAGE_BUCKETS
+        )
+        self.document_chars = Histogram(
+            "resume_analyzer_document_chars", "Cleaned text length per document.", buckets=CHAR_BUCKETS
+        )
+        self.requests = Counter("resume_analyzer_requests_total", "Requests by endpoint and status.", ["endpoint", "status"])
+        self.documents = Counter("resume_analyzer_documents_total", "Documents parsed or restored from cache.")
+        self.pages = Counter("resume_analyzer_document_pages_total", "Pages read across all documents.")
+        self.chars = Counter("resume_analyzer_document_chars_total", "Cleaned characters across all documents.")
+        self.cache = Counter("resume_analyzer_parse_cache_total", "Parse cache lookups by result.", ["result"])
+        self.truncated = Counter("resume_analyzer_truncated_documents_total", "Documents cut short by a budget.")
+
+    def observe_request(self, endpoint: str, status: str, seconds: float, timer: StageTimer | None = None) -> None:
+        with self._lock:
+            self.requests.inc(endpoint, status)
+            self.request_seconds.observe(seconds, endpoint)
+            if timer is None:
+                return
+            for stage, stage_seconds in timer.stages.items():
+                self.stage_seconds.observe(stage_seconds, endpoint, stage)
+            for doc in timer.documents:
+                self.documents.inc()
+                self.pages.inc(value=doc.pages)
+                self.chars.inc(value=doc.chars)
+                self.document_pages.observe(doc.pages)
+                self.document_chars.observe(doc.chars)
+                if doc.cache_hit is not None:
+                    self.cache.inc("hit" if doc.cache_hit else "miss")
+                if doc.truncated:
+                    self.truncated.inc()
+
+    @contextmanager
+    def track(self, endpoint: str) -> Iterator[TrackedRequest]:
+        """
+        Time one request; the status label comes from the HTTPException raised, if any.
+        """
+        req = TrackedRequest()
+        status = "200"
+        try:
+            yield req
+        except Exception as e:
+            status = str(getattr(e, "status_code", 500))
+            raise
+        finally:
+            self.observe_request(endpoint, status, req.elapsed(), req.timer)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics: Iterable = (
+                self.request_seconds, self.stage_seconds, self.document_pages, self.document_chars,
+                self.requests, self.documents, self.pages, self.chars, self.cache, self.truncated,
+            )
+            lines: List[str] = []
+            for m in metrics:
+                lines.extend(m.render())
+        if self._gauges is not None:
+            for name, value in self._gauges().items():
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {_fmt(value)}")
+        return "\n".join(lines) + "\n"
@@ -3,12 +3,16 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi import APIRouter, Depends, File, Form, Request, Response, UploadFile
 
+from resume_analyzer.api.config import settings
+from resume_analyzer.api.errors import too_many_requests
+from resume_analyzer.api.executor import PipelineSaturated
 from resume_analyzer.api.schemas import AnalyzeResponse, ContactOut, MatchOut, RolePredictionOut
 from resume_analyzer.api.security import require_api_key
-from resume_analyzer.api.services.analyze_service import analyze_resume
-from resume_analyzer.api.services.upload_service import save_upload_to_temp
+from resume_analyzer.api.services.analyze_service import analyze_resume_timed
+from resume_analyzer.api.services.upload_service import read_upload_bytes
+from resume_analyzer.parsing.budget import ExtractionBudget
 
 router = APIRouter(tags=["analyze"])
 
@@ -18,38 +22,50 @@ ALLOWED_JD_EXTS = {".txt", ".pdf", ".docx"}
 
 @router.post("/analyze", response_model=AnalyzeResponse, dependencies=[Depends(require_api_key)])
 async def analyze(
+    request: Request,
+    response: Response,
     resume: UploadFile = File(...),
     jd_text: Optional[str] = Form(None),
     jd_file: Optional[UploadFile] = File(None),
 ):
-    tmp_resume = save_upload_to_temp(resume, ALLOWED_RESUME_EXTS)
+    resume_bytes = read_upload_bytes(resume, ALLOWED_RESUME_EXTS)
+
+    jd_final = None
+    jd_bytes = None
+    if jd_text and jd_text.strip():
+        jd_final = jd_text.strip()
+    elif jd_file is not None:
+        jd_bytes = read_upload_bytes(jd_file, ALLOWED_JD_EXTS)
+        ext = Path(jd_file.filename or "").suffix.lower()
+        if ext == ".txt":
+            jd_final = jd_bytes.decode("utf-8", errors="ignore")
+            jd_bytes = None
 
-    tmp_jd_path = None
     try:
-        jd_final = None
-
-        if jd_text and jd_text.strip():
-            jd_final = jd_text.strip()
-        elif jd_file is not None:
-            tmp_jd_path = save_upload_to_temp(jd_file, ALLOWED_JD_EXTS)
-            ext = Path(jd_file.filename or "").suffix.lower()
-            if ext == ".txt":
-                jd_final = tmp_jd_path.read_text(encoding="utf-8", errors="ignore")
-            else:
-                from resume_analyzer.parsing.resume import extract_resume_text
-                jd_final = extract_resume_text(str(tmp_jd_path))
-
-        data = analyze_resume(str(tmp_resume), jd_final)
-
-        return AnalyzeResponse(
-            resume_filename=resume.filename,
-            contact=ContactOut(**data["contact"]),
-            skills=data["skills"],
-            role_prediction=[RolePredictionOut(**x) for x in data["role_prediction"]],
-            role_model=data["role_model"],
-            match=MatchOut(**data["match"]) if data["match"] else None,
+        budget = ExtractionBudget(
+            max_pages=settings.MAX_PDF_PAGES or None,
+            max_chars=settings.MAX_TEXT_CHARS or None,
+            max_seconds=settings.MAX_PARSE_SECONDS or None,
+        )
+        data, timer = await request.app.state.pipeline.run(
+            analyze_resume_timed, resume_bytes, jd_final, jd_bytes, None, budget
         )
-    finally:
-        tmp_resume.unlink(missing_ok=True)
-        if tmp_jd_path is not None:
-            tmp_jd_path.unlink(missing_ok=True)
+    except PipelineSaturated as e:
+        raise too_many_requests(
+            "Analysis queue full",
+            str(e),
+            retry_after=settings.PIPELINE_RETRY_AFTER_SECONDS,
+        )
+
+    response.headers["Server-Timing"] = timer.server_timing()
+    return AnalyzeResponse(
+        resume_filename=resume.filename,
+        contact=ContactOut(**data["contact"]),
+        skills=data["skills"],
+        role_prediction=[RolePredictionOut(**x) for x in data["role_prediction"]],
+        role_model=data["role_model"],
+        role_model_version=data["role_model_version"],
+        match=MatchOut(**data["match"]) if data["match"] else None,
+        truncated=data["truncated"],
+        truncation_reason=data["truncation_reason"],
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -39,4 +39,98 @@ class AnalyzeResponse(BaseModel):
     skills: List[str] = Field(default_factory=list)
     role_prediction: List[RolePredictionOut] = Field(default_factory=list)
     role_model: Optional[str] = None
+    role_model_version: Optional[str] = None
     match: Optional[MatchOut] = None
+    truncated: bool = False
+    truncation_reason: Optional[str] = None
+
+
+class RankedResumeOut(BaseModel):
+    rank: int
+    resume_filename: Optional[str] = None
+    match: MatchOut
+    truncated: bool = False
+    role_prediction: List[RolePredictionOut] = Field(default_factory=list)
+
+
+class RankErrorOut(BaseModel):
+    resume_filename: Optional[str] = None
+    error: str
+
+
+class RankResponse(BaseModel):
+    jd_skills: List[str] = Field(default_factory=list)
+    total_resumes: int
+    results: List[RankedResumeOut] = Field(default_factory=list)
+    errors: List[RankErrorOut] = Field(default_factory=list)
+    role_model_version: Optional[str] = None
+
+
+class SearchHitOut(BaseModel):
+    resume: str
+    score: float
+    matched_skills: List[str] = Field(default_factory=list)
+
+
+class SearchResponse(BaseModel):
+    query: str
+    total: int
+    skills: List[str] = Field(default_factory=list)
+    results: List[SearchHitOut] = Field(default_factory=list)
+    indexed_resumes: int
+
+
+class JDIn(BaseModel):
+    text: str
+    title: Optional[str] = None
+    id: Optional[str] = None  # registering an existing id replaces that JD
+
+
+class JDRegisterRequest(BaseModel):
+    jds: List[JDIn]
+
+
+class StoredJDOut(BaseModel):
+    id: str
+    title: Optional[str] = None
+    skills: List[str] = Field(default_factory=list)
+    truncated: bool = False  # text cut to MAX_TEXT_CHARS before registering
+
+
+class JDRegisterResponse(BaseModel):
+    registered: List[StoredJDOut] = Field(default_factory=list)
+    total_jds: int
+
+
+class JobMatchOut(BaseModel):
+    rank: int
+    jd_id: str
+    title: Optional[str] = None
+    match: MatchOut
+
+
+class MatchJobsResponse(BaseModel):
+    resume_filename: Optional[str] = None
+    resume_skills: List[str] = Field(default_factory=list)
+    total_jds: int
+    results: List[JobMatchOut] = Field(default_factory=list)
+    truncated: bool = False
+
+
+class JobSubmittedOut(BaseModel):
+    id: str
+    kind: str
+    status: str
+    status_url: str
+
+
+class JobOut(BaseModel):
+    id: str
+    kind: str
+    status: str  # queued | running | done | failed
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None  # AnalyzeResponse or RankResponse once done
+
@@ -2,18 +2,47 @@ from __future__ import annotations
 
 from typing import Optional
 
-from resume_analyzer.ml.role_predictor import RolePredictor
-from resume_analyzer.parsing.contact import extract_contact_info
-from resume_analyzer.parsing.resume import extract_resume_text
+from resume_analyzer.document import JobDescription, ResumeDocument
+from resume_analyzer.ml.registry import get_role_predictor
+from resume_analyzer.parsing.budget import ExtractionBudget
+from resume_analyzer.parsing.cache import ParseCache
+from resume_analyzer.parsing.source import DocumentSource
 from resume_analyzer.scoring.match import match_resume_to_jd
-from resume_analyzer.skills.extract import extract_skills
+from resume_analyzer.utils.timing import StageTimer
 
 
-def analyze_resume(resume_path: str, jd_text: Optional[str] = None) -> dict:
-    resume_text = extract_resume_text(resume_path)
+def analyze_resume(
+    resume: DocumentSource,
+    jd_text: Optional[str] = None,
+    jd_document: Optional[DocumentSource] = None,
+    cache: Optional[ParseCache] = None,
+    budget: Optional[ExtractionBudget] = None,
+    timer: Optional[StageTimer] = None,
+) -> dict:
+    """
+    Run the full pipeline. `resume` / `jd_document` may be paths or in-memory bytes.
+    `jd_text` wins over `jd_document` when both are given.
+    With a timer, each stage's wall-clock time and the parsed documents are recorded.
+    """
+    timer = timer if timer is not None else StageTimer()
 
-    contact = extract_contact_info(resume_text)
-    skills = sorted(extract_skills(resume_text))
+    with timer.stage("parse"):
+        resume_doc = ResumeDocument.from_source(resume, cache=cache, budget=budget)
+    timer.document(resume_doc)
+
+    jd_doc: Optional[JobDescription] = None
+    with timer.stage("jd"):
+        if jd_text and jd_text.strip():
+            jd_doc = JobDescription(jd_text)
+        elif jd_document is not None:
+            jd_doc = JobDescription.from_source(jd_document, cache=cache, budget=budget)
+    if jd_doc is not None and jd_doc.extraction is not None:
+        timer.document(jd_doc)
+
+    with timer.stage("contact"):
+        contact = resume_doc.contact
+    with timer.stage("skills"):
+        skills = sorted(resume_doc.skills)
 
     result: dict = {
         "contact": {
@@ -26,21 +55,27 @@ def analyze_resume(resume_path: str, jd_text: Optional[str] = None) -> dict:
         "skills": skills,
         "role_prediction": [],
         "role_model": None,
+        "role_model_version": None,
         "match": None,
+        "truncated": resume_doc.truncated,
+        "truncation_reason": resume_doc.extraction.reason if resume_doc.extraction else None,
     }
 
     # role prediction (top 3)
-    try:
-        predictor = RolePredictor()  # loads latest from latest_role_model.txt
-        top3 = predictor.predict_topk(resume_text, k=3)
-        result["role_prediction"] = [{"label": r.label, "confidence": r.confidence} for r in top3]
-        result["role_model"] = str(predictor.model_path)
-    except Exception:
-        pass
-
-    # JD match (only if jd_text present)
-    if jd_text and jd_text.strip():
-        m = match_resume_to_jd(resume_text, jd_text)
+    with timer.stage("role"):
+        try:
+            predictor = get_role_predictor()  # shared; follows latest_role_model.txt
+            top3 = predictor.predict_topk(resume_doc, k=3)
+            result["role_prediction"] = [{"label": r.label, "confidence": r.confidence} for r in top3]
+            result["role_model"] = str(predictor.model_path)
+            result["role_model_version"] = predictor.model_version
+        except Exception:
+            pass
+
+    # JD match (only if a JD was given)
+    if jd_doc is not None and jd_doc.text:
+        with timer.stage("match"):
+            m = match_resume_to_jd(resume_doc, jd_doc)
         result["match"] = {
             "similarity_score": m.similarity_score,
             "skill_coverage": m.skill_coverage,
@@ -52,3 +87,11 @@ def analyze_resume(resume_path: str, jd_text: Optional[str] = None) -> dict:
         }
 
     return result
+
+
+def analyze_resume_timed(*args, **kwargs) -> tuple[dict, StageTimer]:
+    """
+    analyze_resume plus its StageTimer; for executors that may run it in another process.
+    """
+    timer = StageTimer()
+    return analyze_resume(*args, timer=timer, **kwargs), timer
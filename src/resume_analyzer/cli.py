@@ -1,16 +1,25 @@
 from __future__ import annotations
 
 import argparse
+import glob
+import itertools
 import json
 import logging
+import multiprocessing
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
 from urllib.parse import urlparse, unquote
 
-from resume_analyzer.ml.role_predictor import RolePredictor
-from resume_analyzer.parsing.contact import extract_contact_info
-from resume_analyzer.parsing.resume import extract_resume_text
+from resume_analyzer.document import JobDescription, ResumeDocument, resumes_from_sources
+from resume_analyzer.ml.registry import get_role_predictor
+from resume_analyzer.ml.role_predictor import RolePrediction
+from resume_analyzer.parsing.budget import ExtractionBudget
+from resume_analyzer.parsing.cache import ParseCache
 from resume_analyzer.scoring.match import match_resume_to_jd
-from resume_analyzer.skills.extract import extract_skills
+from resume_analyzer.scoring.rank import rank_resumes
+from resume_analyzer.skills.extract import get_default_extractor
+from resume_analyzer.skills.index import SkillIndex
 from resume_analyzer.utils.logging import setup_logging
 
 
@@ -33,48 +42,68 @@ def read_text_file(path: str | Path) -> str:
     return p.read_text(encoding="utf-8", errors="ignore")
 
 
-def main() -> None:
-    setup_logging()
-    log = logging.getLogger("resume_analyzer.cli")
+DEFAULT_CACHE_PATH = ".cache/parse_cache.sqlite3"
 
-    parser = argparse.ArgumentParser(
-        prog="resume-analyzer",
-        description="Analyze a resume and optionally match it against a Job Description (JD).",
-    )
 
-    parser.add_argument("--resume", required=True, help="Path to resume file (.pdf or .docx)")
-    parser.add_argument("--jd-file", help="Path to JD text file (.txt)")
-    parser.add_argument("--jd-text", help="JD as raw text (alternative to --jd-file)")
-    parser.add_argument("--out", help="Optional output file path (json/text based on --format)")
-    parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
-    parser.add_argument("--format", choices=["json", "text"], default="json", help="Output format")
-    parser.add_argument("--top-missing", type=int, default=0, help="Show only top N missing skills (0 = all)")
+def _add_cache_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--cache-path", default=DEFAULT_CACHE_PATH, help="Parse cache SQLite file")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-parse documents")
 
-    args = parser.parse_args()
 
-    resume_path = normalize_path(args.resume)
-    resume_file_abs = str(Path(resume_path).resolve())
+def _open_cache(args: argparse.Namespace) -> ParseCache | None:
+    return None if args.no_cache else ParseCache(path=args.cache_path)
 
-    # Parse resume text
-    resume_text = extract_resume_text(resume_path)
-    log.info("Parsed resume file successfully: %s", resume_file_abs)
 
-    # Role prediction (optional)
-    role_pred = None
-    try:
-        predictor = RolePredictor()
-        role_pred = predictor.predict_topk(resume_text, k=3)
+def _add_budget_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--max-pages", type=int, default=None, help="Stop reading a PDF after N pages")
+    parser.add_argument("--max-chars", type=int, default=None, help="Stop extracting after N characters")
+    parser.add_argument("--max-seconds", type=float, default=None, help="Stop extracting after N seconds")
+
+
+def _budget(args: argparse.Namespace) -> ExtractionBudget | None:
+    if args.max_pages is None and args.max_chars is None and args.max_seconds is None:
+        return None
+    return ExtractionBudget(max_pages=args.max_pages, max_chars=args.max_chars, max_seconds=args.max_seconds)
+
+
+def _emit(output: str, out_path: str | None) -> None:
+    if out_path:
+        Path(out_path).write_text(output, encoding="utf-8")
+        print(f"✅ Saved: {out_path}")
+    else:
+        print(output)
 
-    except Exception as e:
-        # Don't crash CLI if model isn't present; just log for debugging.
-        log.debug("Role prediction skipped: %s", e)
+
+def analyze_document(
+    resume_doc: ResumeDocument,
+    resume_file: str,
+    jd_doc: JobDescription | None = None,
+    top_missing: int = 0,
+    role_pred: list[RolePrediction] | None = None,
+    role_model_version: str | None = None,
+) -> dict:
+    """
+    CLI result dict for one parsed resume (contact, skills, roles, optional JD match).
+    Pass role_pred (and role_model_version) when roles were already predicted in a batch.
+    """
+    log = logging.getLogger("resume_analyzer.cli")
+
+    # Role prediction (optional)
+    if role_pred is None:
+        try:
+            predictor = get_role_predictor()
+            role_pred = predictor.predict_topk(resume_doc, k=3)
+            role_model_version = predictor.model_version
+        except Exception as e:
+            # Don't crash CLI if model isn't present; just log for debugging.
+            log.debug("Role prediction skipped: %s", e)
 
     # Contact + skills
-    contact = extract_contact_info(resume_text)
-    resume_skills = sorted(extract_skills(resume_text))
+    contact = resume_doc.contact
+    resume_skills = sorted(resume_doc.skills)
 
     result: dict = {
-        "resume_file": resume_file_abs,
+        "resume_file": resume_file,
         "contact": {
             "email": contact.email,
             "phones": contact.phones,
@@ -84,26 +113,23 @@ def main() -> None:
         },
         "skills": resume_skills,
     }
+    if resume_doc.truncated:
+        result["truncated"] = True
+        result["truncation_reason"] = resume_doc.extraction.reason
 
     if role_pred:
         result["role_prediction"] = [
             {"label": r.label, "confidence": r.confidence} for r in role_pred
         ]
-
-    # JD input
-    jd_text = None
-    if args.jd_text and args.jd_text.strip():
-        jd_text = args.jd_text
-    elif args.jd_file:
-        jd_text = read_text_file(normalize_path(args.jd_file))
+        result["role_model_version"] = role_model_version
 
     # Match (if JD provided)
-    if jd_text:
-        match = match_resume_to_jd(resume_text, jd_text)
+    if jd_doc is not None and jd_doc.text:
+        match = match_resume_to_jd(resume_doc, jd_doc)
 
         missing = match.missing_skills
-        if args.top_missing and args.top_missing > 0:
-            missing = missing[: args.top_missing]
+        if top_missing and top_missing > 0:
+            missing = missing[:top_missing]
 
         result["match"] = {
             "similarity_score": match.similarity_score,
@@ -115,6 +141,467 @@ def main() -> None:
             "missing_skills": missing,
         }
 
+    return result
+
+
+def rank_main(argv: list[str] | None = None) -> None:
+    """
+    resume-analyzer rank: score many resumes against one JD, best first.
+    """
+    setup_logging()
+    log = logging.getLogger("resume_analyzer.cli")
+
+    parser = argparse.ArgumentParser(
+        prog="resume-analyzer rank",
+        description="Rank many resumes against one Job Description (JD).",
+    )
+
+    parser.add_argument("--resumes", nargs="+", required=True, help="Paths to resume files (.pdf or .docx)")
+    parser.add_argument("--jd-file", help="Path to JD text file (.txt)")
+    parser.add_argument("--jd-text", help="JD as raw text (alternative to --jd-file)")
+    parser.add_argument("--top-k", type=int, default=10, help="Number of best resumes to return")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel parse processes (1 = sequential)")
+    parser.add_argument("--out", help="Optional output file path (json/text based on --format)")
+    parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
+    parser.add_argument("--format", choices=["json", "text"], default="json", help="Output format")
+    _add_cache_args(parser)
+    _add_budget_args(parser)
+
+    args = parser.parse_args(argv)
+
+    if args.jd_text and args.jd_text.strip():
+        jd_text = args.jd_text
+    elif args.jd_file:
+        jd_text = read_text_file(normalize_path(args.jd_file))
+    else:
+        parser.error("one of --jd-text or --jd-file is required")
+
+    paths = [str(Path(normalize_path(p)).resolve()) for p in args.resumes]
+    parsed = resumes_from_sources(paths, cache=_open_cache(args), workers=args.workers, budget=_budget(args))
+
+    docs: list[ResumeDocument] = []
+    doc_paths: list[str] = []
+    errors: list[dict] = []
+    for path, outcome in zip(paths, parsed):
+        if isinstance(outcome, Exception):
+            log.warning("Skipping %s: %s", path, outcome)
+            errors.append({"resume_file": path, "error": str(outcome) or type(outcome).__name__})
+            continue
+        docs.append(outcome)
+        doc_paths.append(path)
+
+    jd_doc = JobDescription(jd_text)
+    ranked = rank_resumes(jd_doc, docs, top_k=args.top_k)
+
+    result: dict = {
+        "jd_skills": sorted(jd_doc.skills),
+        "total_resumes": len(paths),
+        "results": [
+            {
+                "rank": pos,
+                "resume_file": doc_paths[r.index],
+                "truncated": docs[r.index].truncated,
+                "match": {
+                    "similarity_score": r.result.similarity_score,
+                    "skill_coverage": r.result.skill_coverage,
+                    "final_score": r.result.final_score,
+                    "matched_skills": r.result.matched_skills,
+                    "missing_skills": r.result.missing_skills,
+                },
+            }
+            for pos, r in enumerate(ranked, start=1)
+        ],
+        "errors": errors,
+    }
+
+    if args.format == "text":
+        lines: list[str] = [f"JD Skills ({len(result['jd_skills'])}): {', '.join(result['jd_skills']) or '-'}", ""]
+        for row in result["results"]:
+            m = row["match"]
+            lines.append(
+                f"{row['rank']:>3}. {m['final_score']:.2f} "
+                f"(Similarity {m['similarity_score']:.2f}, Coverage {m['skill_coverage']:.2f})  {row['resume_file']}"
+            )
+        for err in errors:
+            lines.append(f"  ! {err['resume_file']}: {err['error']}")
+        output = "\n".join(lines)
+    else:
+        output = json.dumps(result, indent=2 if args.pretty else None, ensure_ascii=False)
+
+    _emit(output, args.out)
+
+
+# -------------------------------------------------------------------
+# Batch mode (many resumes -> JSONL, resumable)
+# -------------------------------------------------------------------
+
+RESUME_EXTS = {".pdf", ".docx"}
+BATCH_CHUNK_SIZE = 32  # resumes per worker task (one role-model call each)
+
+# Per-process state for batch workers: built once by _batch_init, reused for every resume
+_batch_state: dict = {}
+
+
+def collect_resume_paths(
+    resume_dir: str | None = None,
+    globs: list[str] | None = None,
+    manifest: str | None = None,
+) -> list[str]:
+    """
+    Absolute resume paths from a directory (recursive), glob patterns and/or a
+    manifest file (one path per line, '#' comments). Order-preserving, no duplicates.
+    """
+    found: list[Path] = []
+    if resume_dir:
+        root = Path(normalize_path(resume_dir))
+        if not root.is_dir():
+            raise FileNotFoundError(f"Resume directory not found: {root}")
+        found.extend(sorted(p for p in root.rglob("*") if p.suffix.lower() in RESUME_EXTS))
+    for pattern in globs or []:
+        found.extend(sorted(Path(p) for p in glob.glob(normalize_path(pattern), recursive=True)))
+    if manifest:
+        for line in read_text_file(normalize_path(manifest)).splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                found.append(Path(normalize_path(line)))
+
+    seen: set[str] = set()
+    paths: list[str] = []
+    for p in found:
+        key = str(p.resolve())
+        if key not in seen and p.suffix.lower() in RESUME_EXTS:
+            seen.add(key)
+            paths.append(key)
+    return paths
+
+
+def _batch_init(
+    jd_text: str | None,
+    cache_path: str | None,
+    budget: ExtractionBudget | None,
+    top_missing: int,
+) -> None:
+    """
+    Worker initializer: load the role model, taxonomy and JD features once per process.
+    """
+    jd_doc = JobDescription(jd_text) if jd_text else None
+    if jd_doc is not None:
+        _ = jd_doc.skills  # loads the taxonomy; JD features are then shared by every resume
+    try:
+        get_role_predictor()
+    except Exception:
+        pass
+    _batch_state.update(
+        jd=jd_doc,
+        cache=ParseCache(path=cache_path) if cache_path else None,
+        budget=budget,
+        top_missing=top_missing,
+    )
+
+
+def _batch_roles(docs: list[ResumeDocument]) -> tuple[list[list[RolePrediction]] | None, str | None]:
+    """
+    Top-3 roles for a whole chunk in one model call; (None, None) without a model.
+    """
+    try:
+        predictor = get_role_predictor()
+        return predictor.predict_topk_batch(docs, k=3), predictor.model_version
+    except Exception as e:
+        logging.getLogger("resume_analyzer.cli").debug("Role prediction skipped: %s", e)
+        return None, None
+
+
+def _batch_analyze(paths: list[str]) -> list[dict]:
+    """
+    Analyze a chunk of resumes inside a batch worker, in input order; failures become "error" rows.
+    """
+    rows: list[dict | None] = [None] * len(paths)
+    parsed: list[tuple[int, ResumeDocument]] = []
+    for i, path in enumerate(paths):
+        try:
+            doc = ResumeDocument.from_source(
+                Path(path).read_bytes(), cache=_batch_state["cache"], budget=_batch_state["budget"]
+            )
+            parsed.append((i, doc))
+        except Exception as e:
+            rows[i] = {"resume_file": path, "error": str(e) or type(e).__name__}
+
+    roles, version = _batch_roles([doc for _, doc in parsed])
+    for j, (i, doc) in enumerate(parsed):
+        try:
+            rows[i] = analyze_document(
+                doc,
+                paths[i],
+                _batch_state["jd"],
+                top_missing=_batch_state["top_missing"],
+                role_pred=roles[j] if roles is not None else [],
+                role_model_version=version,
+            )
+        except Exception as e:
+            rows[i] = {"resume_file": paths[i], "error": str(e) or type(e).__name__}
+    return rows  # type: ignore[return-value]
+
+
+def _load_checkpoint(path: Path) -> set[str]:
+    if not path.exists():
+        return set()
+    return {line for line in path.read_text(encoding="utf-8").splitlines() if line}
+
+
+def _iter_batch_results(paths: list[str], workers: int, initargs: tuple, chunk_size: int = BATCH_CHUNK_SIZE):
+    """
+    Yield result rows as their chunk completes. Resumes go to workers in chunks
+    so role prediction runs once per chunk; at most a few chunks per worker are
+    in flight, so memory stays flat however long the input list is.
+    """
+    chunk_size = max(1, chunk_size)
+    chunks = (paths[i : i + chunk_size] for i in range(0, len(paths), chunk_size))
+    if workers <= 1:
+        _batch_init(*initargs)
+        for chunk in chunks:
+            yield from _batch_analyze(chunk)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_batch_init,
+        initargs=initargs,
+    ) as pool:
+        in_flight = set()
+        for chunk in itertools.islice(chunks, workers * 2):
+            in_flight.add(pool.submit(_batch_analyze, chunk))
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield from fut.result()
+                nxt = next(chunks, None)
+                if nxt is not None:
+                    in_flight.add(pool.submit(_batch_analyze, nxt))
+
+
+def batch_main(argv: list[str] | None = None) -> None:
+    """
+    resume-analyzer batch: analyze many resumes, one JSON line per resume.
+    """
+    setup_logging()
+    log = logging.getLogger("resume_analyzer.cli")
+
+    parser = argparse.ArgumentParser(
+        prog="resume-analyzer batch",
+        description="Analyze many resumes (optionally against one JD) and stream JSONL results.",
+    )
+
+    parser.add_argument("--resume-dir", help="Directory searched recursively for .pdf/.docx resumes")
+    parser.add_argument("--glob", action="append", default=[], help="Glob pattern for resumes (repeatable)")
+    parser.add_argument("--manifest", help="Text file with one resume path per line")
+    parser.add_argument("--jd-file", help="Path to JD text file (.txt)")
+    parser.add_argument("--jd-text", help="JD as raw text (alternative to --jd-file)")
+    parser.add_argument("--top-missing", type=int, default=0, help="Show only top N missing skills (0 = all)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes, each with a warm model (1 = in-process)")
+    parser.add_argument("--chunk-size", type=int, default=BATCH_CHUNK_SIZE, help="Resumes per worker task")
+    parser.add_argument("--out", help="JSONL output file (appended to when resuming); stdout if omitted")
+    parser.add_argument("--checkpoint", help="Checkpoint file of analyzed resumes; failed ones are retried (default: <out>.checkpoint)")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint and overwrite --out")
+    _add_cache_args(parser)
+    _add_budget_args(parser)
+
+    args = parser.parse_args(argv)
+    if not (args.resume_dir or args.glob or args.manifest):
+        parser.error("one of --resume-dir, --glob or --manifest is required")
+
+    jd_text = None
+    if args.jd_text and args.jd_text.strip():
+        jd_text = args.jd_text
+    elif args.jd_file:
+        jd_text = read_text_file(normalize_path(args.jd_file))
+
+    paths = collect_resume_paths(args.resume_dir, args.glob, args.manifest)
+
+    checkpoint: Path | None = None
+    if args.checkpoint or args.out:
+        checkpoint = Path(args.checkpoint or f"{args.out}.checkpoint")
+    if args.restart and checkpoint is not None and checkpoint.exists():
+        checkpoint.unlink()
+    done = _load_checkpoint(checkpoint) if checkpoint is not None else set()
+    todo = [p for p in paths if p not in done]
+    log.info("Batch: %d resumes found, %d already done, %d to analyze", len(paths), len(paths) - len(todo), len(todo))
+
+    cache_path = None if args.no_cache else args.cache_path
+    initargs = (jd_text, cache_path, _budget(args), args.top_missing)
+
+    out_fh = open(args.out, "w" if args.restart else "a", encoding="utf-8") if args.out else sys.stdout
+    ckpt_fh = open(checkpoint, "a", encoding="utf-8") if checkpoint is not None else None
+    errors = 0
+    try:
+        for row in _iter_batch_results(todo, args.workers, initargs, args.chunk_size):
+            # Row first, then checkpoint: a crash in between re-analyzes one resume, never loses it
+            out_fh.write(json.dumps(row, ensure_ascii=False) + "\n")
+            out_fh.flush()
+            if "error" in row:
+                # Not checkpointed: a failed resume is retried by the next run
+                errors += 1
+                log.warning("Failed %s: %s", row["resume_file"], row["error"])
+            elif ckpt_fh is not None:
+                ckpt_fh.write(row["resume_file"] + "\n")
+                ckpt_fh.flush()
+    finally:
+        if ckpt_fh is not None:
+            ckpt_fh.close()
+        if out_fh is not sys.stdout:
+            out_fh.close()
+
+    if args.out:
+        skipped = len(paths) - len(todo)
+        print(f"✅ Saved: {args.out} ({len(todo) - errors} analyzed, {errors} failed, {skipped} skipped)")
+
+
+# -------------------------------------------------------------------
+# Skill index (boolean search over a corpus)
+# -------------------------------------------------------------------
+
+DEFAULT_INDEX_PATH = ".cache/skill_index.npz"
+INDEX_CHUNK_SIZE = 256  # resumes parsed (and held in memory) at a time
+
+
+def _skills_from_jsonl(path: str, log: logging.Logger):
+    """
+    (resume_file, skills) from batch output; failed rows and repeated files are skipped.
+    """
+    seen: set[str] = set()
+    with open(normalize_path(path), encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if "error" in row or "skills" not in row or row["resume_file"] in seen:
+                continue
+            seen.add(row["resume_file"])
+            yield row["resume_file"], row["skills"]
+    log.info("Index: %d resumes read from %s", len(seen), path)
+
+
+def _skills_from_resumes(paths: list[str], args: argparse.Namespace, log: logging.Logger):
+    """
+    (resume_file, skills) for every resume that parses, a chunk at a time.
+    """
+    cache = _open_cache(args)
+    for i in range(0, len(paths), INDEX_CHUNK_SIZE):
+        chunk = paths[i : i + INDEX_CHUNK_SIZE]
+        parsed = resumes_from_sources(chunk, cache=cache, workers=args.workers, budget=_budget(args))
+        for path, outcome in zip(chunk, parsed):
+            if isinstance(outcome, Exception):
+                log.warning("Skipping %s: %s", path, outcome)
+                continue
+            yield path, outcome.skills
+
+
+def index_main(argv: list[str] | None = None) -> None:
+    """
+    resume-analyzer index: build the skill index queried by GET /search.
+    """
+    setup_logging()
+    log = logging.getLogger("resume_analyzer.cli")
+
+    parser = argparse.ArgumentParser(
+        prog="resume-analyzer index",
+        description="Build a skill -> resumes index for boolean search (e.g. 'python AND kafka AND NOT java').",
+    )
+
+    parser.add_argument("--resume-dir", help="Directory searched recursively for .pdf/.docx resumes")
+    parser.add_argument("--glob", action="append", default=[], help="Glob pattern for resumes (repeatable)")
+    parser.add_argument("--manifest", help="Text file with one resume path per line")
+    parser.add_argument("--from-jsonl", help="Reuse the skills of a 'resume-analyzer batch' JSONL output")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel parse processes (1 = sequential)")
+    parser.add_argument("--out", default=DEFAULT_INDEX_PATH, help="Index file to write (.npz)")
+    _add_cache_args(parser)
+    _add_budget_args(parser)
+
+    args = parser.parse_args(argv)
+    if not (args.resume_dir or args.glob or args.manifest or args.from_jsonl):
+        parser.error("one of --resume-dir, --glob, --manifest or --from-jsonl is required")
+
+    if args.from_jsonl:
+        docs = _skills_from_jsonl(args.from_jsonl, log)
+        taxonomy = None  # whichever taxonomy the batch run used
+    else:
+        paths = collect_resume_paths(args.resume_dir, args.glob, args.manifest)
+        log.info("Index: %d resumes found", len(paths))
+        docs = _skills_from_resumes(paths, args, log)
+        taxonomy = get_default_extractor().fingerprint
+
+    index = SkillIndex.build(docs, taxonomy=taxonomy)
+    index.save(args.out)
+    print(f"✅ Saved: {args.out} ({len(index)} resumes, {len(index.names)} skills)")
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "rank":
+        rank_main(argv[1:])
+        return
+    if argv and argv[0] == "batch":
+        batch_main(argv[1:])
+        return
+    if argv and argv[0] == "index":
+        index_main(argv[1:])
+        return
+
+    setup_logging()
+    log = logging.getLogger("resume_analyzer.cli")
+
+    parser = argparse.ArgumentParser(
+        prog="resume-analyzer",
+        description="Analyze a resume and optionally match it against a Job Description (JD).",
+        epilog=(
+            "Use 'resume-analyzer rank --help' to rank many resumes against one JD, "
+            "'resume-analyzer batch --help' to analyze a whole directory to JSONL, "
+            "or 'resume-analyzer index --help' to build the skill search index."
+        ),
+    )
+
+    parser.add_argument("--resume", required=True, help="Path to resume file (.pdf or .docx)")
+    parser.add_argument("--jd-file", help="Path to JD text file (.txt)")
+    parser.add_argument("--jd-text", help="JD as raw text (alternative to --jd-file)")
+    parser.add_argument("--out", help="Optional output file path (json/text based on --format)")
+    parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
+    parser.add_argument("--format", choices=["json", "text"], default="json", help="Output format")
+    parser.add_argument("--top-missing", type=int, default=0, help="Show only top N missing skills (0 = all)")
+    parser.add_argument(
+        "--page-workers", type=int, default=1, help="Parallel processes for pages of large PDFs (1 = sequential)"
+    )
+    _add_cache_args(parser)
+    _add_budget_args(parser)
+
+    args = parser.parse_args(argv)
+
+    resume_path = normalize_path(args.resume)
+    resume_file_abs = str(Path(resume_path).resolve())
+
+    # Parse resume text (read once, parsed in memory; cached by content hash)
+    resume_file = Path(resume_path)
+    if not resume_file.exists():
+        raise FileNotFoundError(f"Resume not found: {resume_file}")
+    resume_doc = ResumeDocument.from_source(
+        resume_file.read_bytes(),
+        cache=_open_cache(args),
+        budget=_budget(args),
+        page_workers=args.page_workers,
+    )
+    log.info("Parsed resume file successfully: %s", resume_file_abs)
+    if resume_doc.truncated:
+        log.warning("Resume text truncated (%s): %s", resume_doc.extraction.reason, resume_file_abs)
+
+    # JD input
+    jd_text = None
+    if args.jd_text and args.jd_text.strip():
+        jd_text = args.jd_text
+    elif args.jd_file:
+        jd_text = read_text_file(normalize_path(args.jd_file))
+
+    jd_doc = JobDescription(jd_text) if jd_text else None
+    result = analyze_document(resume_doc, resume_file_abs, jd_doc, top_missing=args.top_missing)
+
     # Output formatting
     if args.format == "text":
         lines: list[str] = []
@@ -145,11 +632,7 @@ def main() -> None:
         output = json.dumps(result, indent=2 if args.pretty else None, ensure_ascii=False)
 
     # Write or print
-    if args.out:
-        Path(args.out).write_text(output, encoding="utf-8")
-        print(f"✅ Saved: {args.out}")
-    else:
-        print(output)
+    _emit(output, args.out)
 
 
 if __name__ == "__main__":
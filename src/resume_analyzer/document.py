@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import re
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+from resume_analyzer.parsing.batch import extract_many_with_reports
+from resume_analyzer.parsing.budget import ExtractionBudget, ExtractionReport
+from resume_analyzer.parsing.cache import ParseCache, cache_key
+from resume_analyzer.parsing.clean import clean_text, iter_clean_text
+from resume_analyzer.parsing.contact import ContactInfo, extract_contact_info
+from resume_analyzer.parsing.resume import iter_resume_chunks
+from resume_analyzer.parsing.source import DocumentSource, is_path_source
+from resume_analyzer.skills.bitset import SkillVocabulary
+from resume_analyzer.skills.extract import extract_skills, get_default_extractor
+
+if TYPE_CHECKING:
+    from resume_analyzer.ml.role_predictor import RolePredictor
+
+
+# Same default token pattern as sklearn's vectorizers
+_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
+
+class TextDocument:
+    """
+    A piece of text plus lazily computed, memoized features.
+
+    Every stage (skills, contact, matching, role prediction) reads features from
+    the document instead of recomputing them from the raw string, so passing the
+    same document through several stages does each piece of work once.
+    """
+
+    def __init__(self, text: str):
+        self.raw_text = text or ""
+        self._vectors: Dict[int, Tuple[Any, Any]] = {}
+        self._skill_masks: Dict[int, Tuple[SkillVocabulary, int]] = {}
+        # Set by from_source: pages/chars read and whether a budget cut the text short
+        self.extraction: Optional[ExtractionReport] = None
+        # True/False once looked up in a parse cache; None when parsed without one
+        self.from_cache: Optional[bool] = None
+
+    @property
+    def truncated(self) -> bool:
+        return self.extraction is not None and self.extraction.truncated
+
+    @classmethod
+    def from_source(
+        cls,
+        source: DocumentSource,
+        cache: Optional[ParseCache] = None,
+        budget: Optional[ExtractionBudget] = None,
+        page_workers: int = 1,
+    ):
+        """
+        Parse a PDF/DOCX path, bytes or stream (cleaned page by page, as in extract_resume_text).
+
+        With a cache, the document bytes are hashed first: a hit skips parsing and
+        restores the stored features; a miss parses, computes the features and
+        stores them for next time. With a budget, extraction stops at its
+        page / character / time limit and `doc.extraction` says why.
+        page_workers > 1 extracts the pages of large PDFs in parallel.
+        """
+        report = ExtractionReport()
+        if cache is None:
+            return cls._streamed(source, budget, report, page_workers)
+
+        data = _read_bytes(source)
+        key = cache_key(data, budget.deterministic_key if budget else "")
+        entry = cache.get(key)
+        if entry is not None:
+            return cls._cached(entry)
+
+        doc = cls._streamed(data, budget, report, page_workers)
+        doc._store(cache, key)
+        return doc
+
+    @classmethod
+    def _clean(cls, text: str):
+        """
+        Document over text the extractors (or the parse cache) already cleaned: no second clean_text pass.
+        """
+        doc = cls(text)
+        doc.__dict__["text"] = doc.raw_text
+        return doc
+
+    @classmethod
+    def _streamed(
+        cls,
+        source: DocumentSource,
+        budget: Optional[ExtractionBudget],
+        report: ExtractionReport,
+        page_workers: int,
+    ):
+        """
+        Parse with skill extraction running over the cleaned pages as they are
+        extracted, so the skills are ready when the last page is read.
+        """
+        pages: List[str] = []
+
+        def collect():
+            for chunk in iter_clean_text(iter_resume_chunks(source, budget, report, page_workers)):
+                pages.append(chunk)
+                yield chunk
+
+        skills = get_default_extractor().extract_stream(collect())
+        doc = cls._parsed("".join(pages), report)
+        doc.__dict__["skills"] = frozenset(skills)
+        return doc
+
+    @classmethod
+    def _parsed(cls, text: str, report: ExtractionReport):
+        doc = cls._clean(text)
+        doc.extraction = report
+        return doc
+
+    @classmethod
+    def _cached(cls, entry):
+        doc = cls._clean(entry.text)
+        doc._import_features(entry.features)
+        doc.from_cache = True
+        return doc
+
+    def _store(self, cache: ParseCache, key: str) -> None:
+        self.from_cache = False
+        # A wall-clock cut depends on machine load, not on the bytes: never cache it
+        if self.extraction is not None and self.extraction.reason == "max_seconds":
+            return
+        cache.put(key, self.text, self._export_features())
+
+    def _export_features(self) -> Dict[str, Any]:
+        features: Dict[str, Any] = {
+            "skills": sorted(self.skills),
+            "skills_taxonomy": get_default_extractor().fingerprint,
+        }
+        if self.extraction is not None:
+            e = self.extraction
+            features["extraction"] = {
+                "pages_total": e.pages_total,
+                "pages_read": e.pages_read,
+                "chars": e.chars,
+                "truncated": e.truncated,
+                "reason": e.reason,
+            }
+        return features
+
+    def _import_features(self, features: Dict[str, Any]) -> None:
+        if "extraction" in features:
+            self.extraction = ExtractionReport(**features["extraction"])
+        # Skills are only valid for the taxonomy that produced them
+        if features.get("skills_taxonomy") == get_default_extractor().fingerprint:
+            self.__dict__["skills"] = frozenset(features.get("skills", ()))
+
+    @cached_property
+    def text(self) -> str:
+        return clean_text(self.raw_text)
+
+    @cached_property
+    def tokens(self) -> Tuple[str, ...]:
+        return tuple(_TOKEN_RE.findall(self.text.lower()))
+
+    @cached_property
+    def skills(self) -> FrozenSet[str]:
+        return frozenset(extract_skills(self.text))
+
+    def skill_mask(self, vocabulary: SkillVocabulary) -> int:
+        """
+        Bitset of `skills` over a taxonomy's vocabulary, memoized per vocabulary.
+        """
+        cached = self._skill_masks.get(id(vocabulary))
+        if cached is not None and cached[0] is vocabulary:
+            return cached[1]
+        mask = vocabulary.mask(self.skills)
+        self._skill_masks[id(vocabulary)] = (vocabulary, mask)
+        return mask
+
+    def tfidf_vector(self, vectorizer: Any):
+        """
+        1 x n_features sparse row from a fitted vectorizer, memoized per vectorizer.
+        """
+        cached = self._vectors.get(id(vectorizer))
+        if cached is not None and cached[0] is vectorizer:
+            return cached[1]
+        vec = vectorizer.transform([self.text])
+        self._vectors[id(vectorizer)] = (vectorizer, vec)
+        return vec
+
+
+class ResumeDocument(TextDocument):
+    def __init__(self, text: str):
+        super().__init__(text)
+        self._role_proba: Dict[Tuple[Path, int], Dict[str, float]] = {}
+
+    @cached_property
+    def contact(self) -> ContactInfo:
+        return extract_contact_info(self.text)
+
+    def _export_features(self) -> Dict[str, Any]:
+        features = super()._export_features()
+        c = self.contact
+        features["contact"] = {
+            "email": c.email,
+            "phones": c.phones,
+            "links": c.links,
+            "linkedin": c.linkedin,
+            "github": c.github,
+        }
+        return features
+
+    def _import_features(self, features: Dict[str, Any]) -> None:
+        super()._import_features(features)
+        if "contact" in features:
+            self.__dict__["contact"] = ContactInfo(**features["contact"])
+
+    def role_probabilities(self, predictor: "RolePredictor") -> Dict[str, float]:
+        """
+        label -> probability from the given predictor, memoized per model artifact
+        (path + mtime, so a model file replaced in place is not served stale results).
+        """
+        key = predictor.artifact_key
+        proba = self._role_proba.get(key)
+        if proba is None:
+            proba = predictor.predict_proba(self.text)
+            self._role_proba[key] = proba
+        return proba
+
+
+class JobDescription(TextDocument):
+    pass
+
+
+def resumes_from_sources(
+    sources: Sequence[DocumentSource],
+    cache: Optional[ParseCache] = None,
+    workers: int = 1,
+    budget: Optional[ExtractionBudget] = None,
+) -> List[Union[ResumeDocument, Exception]]:
+    """
+    Batch version of ResumeDocument.from_source, in input order. Cache hits are
+    restored directly; only the misses are parsed (in parallel when workers > 1).
+    A document that fails to parse yields its exception instead of a document.
+    """
+    if cache is None:
+        return [
+            outcome if isinstance(outcome, Exception) else ResumeDocument._parsed(*outcome)
+            for outcome in extract_many_with_reports(sources, workers=workers, budget=budget)
+        ]
+
+    variant = budget.deterministic_key if budget else ""
+    out: List[Union[ResumeDocument, Exception, None]] = [None] * len(sources)
+    misses: List[Tuple[int, str, bytes]] = []
+    for i, source in enumerate(sources):
+        try:
+            data = _read_bytes(source)
+        except Exception as e:
+            out[i] = e
+            continue
+        key = cache_key(data, variant)
+        entry = cache.get(key)
+        if entry is None:
+            misses.append((i, key, data))
+            continue
+        out[i] = ResumeDocument._cached(entry)
+
+    parsed = extract_many_with_reports([data for _, _, data in misses], workers=workers, budget=budget)
+    for (i, key, _), outcome in zip(misses, parsed):
+        if isinstance(outcome, Exception):
+            out[i] = outcome
+            continue
+        doc = ResumeDocument._parsed(*outcome)
+        doc._store(cache, key)
+        out[i] = doc
+
+    return out  # type: ignore[return-value]
+
+
+def _read_bytes(source: DocumentSource) -> bytes:
+    if is_path_source(source):
+        path = Path(source)
+        if not path.exists():
+            raise FileNotFoundError(f"Document not found: {path}")
+        return path.read_bytes()
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return bytes(source)
+    return source.read()
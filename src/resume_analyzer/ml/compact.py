@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import json
+import math
+import re
+import zipfile
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+COMPACT_FORMAT = "role-tfidf-linear/2"
+# /1 stored terms and stop words as fixed-width UTF-32 ("<U"); /2 as fixed-width UTF-8 bytes ("S")
+_READABLE_FORMATS = {"role-tfidf-linear/1", COMPACT_FORMAT}
+COMPACT_SUFFIX = ".npz"
+
+# npz members; every one is a plain (non-object) array so it can be memory-mapped
+_ARRAYS = ("terms", "idf", "coef", "intercept", "classes", "stop_words", "meta")
+
+
+def export_role_model(pipeline: Any, path: str | Path) -> Path:
+    """
+    Write a fitted TfidfVectorizer + linear classifier pipeline as an uncompressed
+    npz: sorted vocabulary, IDF weights, coefficients, intercepts, classes and
+    the analyzer settings. Needs numpy and scipy to load, no sklearn and no pickle.
+
+    Terms are stored as UTF-8 bytes, sorted, so lookups stay a vectorized
+    searchsorted over the mapped array. The file is still larger than the
+    joblib pickle (fixed-width terms and dense float64 coefficients, stored
+    uncompressed); what it buys is that worker processes share one mapped copy
+    instead of each unpickling its own.
+
+    Raises ValueError for pipelines whose preprocessing cannot be reproduced
+    (custom analyzer / tokenizer / preprocessor, accent stripping, binary tf)
+    and for classifiers whose predict_proba is not the softmax (multiclass) /
+    sigmoid (binary) of decision_function that CompactRoleModel applies, e.g.
+    one-vs-rest logistic regression.
+    """
+    import numpy as np
+
+    vectorizer, clf = pipeline.steps[0][1], pipeline.steps[-1][1]
+    if len(pipeline.steps) != 2 or not hasattr(vectorizer, "vocabulary_") or not hasattr(clf, "coef_"):
+        raise ValueError("Expected a (TfidfVectorizer, linear classifier) pipeline")
+    if vectorizer.analyzer != "word" or vectorizer.tokenizer or vectorizer.preprocessor:
+        raise ValueError("Only the default word analyzer can be exported")
+    if vectorizer.strip_accents or vectorizer.binary or vectorizer.norm not in ("l2", None):
+        raise ValueError("Unsupported vectorizer options (strip_accents / binary / norm)")
+
+    _check_link(clf, len(vectorizer.vocabulary_))
+
+    # sklearn sorts features alphabetically, but do not rely on it: the loader bisects.
+    # UTF-8 byte order is code point order, so sorting the str names sorts the bytes too.
+    names = list(vectorizer.get_feature_names_out())
+    order = sorted(range(len(names)), key=names.__getitem__)
+    terms = np.array([names[i].encode("utf-8") for i in order], dtype=bytes)
+    columns = np.array([vectorizer.vocabulary_[names[i]] for i in order])
+
+    idf = vectorizer.idf_[columns] if vectorizer.use_idf else np.ones(len(columns))
+    stop_words = sorted(vectorizer.get_stop_words() or ())
+    meta = {
+        "format": COMPACT_FORMAT,
+        "lowercase": bool(vectorizer.lowercase),
+        "token_pattern": vectorizer.token_pattern,
+        "ngram_range": list(vectorizer.ngram_range),
+        "sublinear_tf": bool(vectorizer.sublinear_tf),
+        "norm": vectorizer.norm,
+    }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(  # not savez_compressed: members must be stored as-is to be mapped
+        path,
+        terms=terms,
+        idf=np.ascontiguousarray(idf, dtype=np.float64),
+        coef=np.ascontiguousarray(clf.coef_[:, columns], dtype=np.float64),
+        intercept=np.ascontiguousarray(clf.intercept_, dtype=np.float64),
+        classes=np.array([str(c) for c in clf.classes_], dtype=str),
+        stop_words=np.array([w.encode("utf-8") for w in stop_words], dtype=bytes),
+        meta=np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+    )
+    return path
+
+
+def _link(scores: "np.ndarray") -> "np.ndarray":
+    """
+    LogisticRegression's link: softmax over classes, or sigmoid of the single binary score.
+    """
+    import numpy as np
+
+    if scores.ndim == 1 or scores.shape[1] == 1:
+        pos = 1.0 / (1.0 + np.exp(-scores.reshape(-1)))
+        return np.column_stack([1.0 - pos, pos])
+    scores = scores - scores.max(axis=1, keepdims=True)
+    exp = np.exp(scores)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+def _check_link(clf: Any, n_features: int) -> None:
+    """
+    Probe the classifier: its predict_proba must be _link(decision_function).
+    """
+    import numpy as np
+
+    if not hasattr(clf, "predict_proba") or not hasattr(clf, "decision_function"):
+        raise ValueError("Classifier needs predict_proba and decision_function")
+    rng = np.random.default_rng(0)
+    probe = np.vstack([np.zeros(n_features), np.eye(min(8, n_features), n_features), rng.random((4, n_features))])
+    if not np.allclose(clf.predict_proba(probe), _link(clf.decision_function(probe)), rtol=0, atol=1e-9):
+        raise ValueError(
+            f"{type(clf).__name__}.predict_proba is not the softmax / sigmoid of its decision_function"
+            " (e.g. one-vs-rest); it cannot be exported"
+        )
+
+
+def _mmap_npz(path: Path) -> Dict[str, "np.ndarray"]:
+    """
+    Memory-map every member of an uncompressed npz, so processes loading the
+    same file share its pages through the OS page cache.
+    """
+    import numpy as np
+    from numpy.lib import format as npy
+
+    arrays: Dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as f:
+        for info in zf.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path}: member {info.filename} is compressed and cannot be memory-mapped")
+            # Local file header: 30 fixed bytes, then name and extra field of their own lengths
+            f.seek(info.header_offset + 26)
+            name_len, extra_len = np.frombuffer(f.read(4), dtype="<u2")
+            f.seek(info.header_offset + 30 + int(name_len) + int(extra_len))
+            version = npy.read_magic(f)
+            read_header = npy.read_array_header_1_0 if version == (1, 0) else npy.read_array_header_2_0
+            shape, fortran, dtype = read_header(f)
+            if dtype.hasobject:
+                raise ValueError(f"{path}: member {info.filename} holds Python objects")
+            name = info.filename[: -len(".npy")]
+            if not math.prod(shape):
+                arrays[name] = np.empty(shape, dtype=dtype)
+                continue
+            arrays[name] = np.memmap(
+                path, dtype=dtype, mode="r", offset=f.tell(), shape=shape, order="F" if fortran else "C"
+            )
+    return arrays
+
+
+def _as_str(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+class CompactRoleModel:
+    """
+    sklearn-free stand-in for the (TfidfVectorizer, LogisticRegression) pipeline,
+    loaded from export_role_model's npz. Exposes the subset of the pipeline API
+    RolePredictor uses: classes_, predict_proba(texts) and predict(texts).
+
+    Tokenization mirrors sklearn's word analyzer (lowercase, token_pattern,
+    stop words, n-grams), terms are looked up by bisection in the mapped
+    vocabulary, and a batch is scored as one sparse matrix, so only the
+    columns of terms present in the texts are touched.
+    """
+
+    def __init__(self, path: str | Path):
+        import numpy as np
+
+        self.path = Path(path)
+        arrays = _mmap_npz(self.path)
+        missing = [name for name in _ARRAYS if name not in arrays]
+        if missing:
+            raise ValueError(f"{self.path}: not a compact role model (missing {', '.join(missing)})")
+
+        self.meta = json.loads(bytes(arrays["meta"]).decode("utf-8"))
+        if self.meta.get("format") not in _READABLE_FORMATS:
+            raise ValueError(f"{self.path}: unsupported format {self.meta.get('format')!r}")
+
+        self.terms = arrays["terms"]
+        self.idf = arrays["idf"]
+        self.coef = arrays["coef"]
+        self.intercept = arrays["intercept"]
+        self.classes_ = np.asarray(arrays["classes"])
+        self._stop_words = frozenset(_as_str(w) for w in arrays["stop_words"].tolist())
+        self._bytes_terms = self.terms.dtype.kind == "S"
+        self._token_re = re.compile(self.meta["token_pattern"])
+        self._ngram_range = tuple(self.meta["ngram_range"])
+
+    def _ngrams(self, text: str) -> List[str]:
+        if self.meta["lowercase"]:
+            text = text.lower()
+        tokens = [t for t in self._token_re.findall(text) if t not in self._stop_words]
+        lo, hi = self._ngram_range
+        if hi == 1:
+            return tokens
+        grams = list(tokens) if lo == 1 else []
+        for n in range(max(2, lo), hi + 1):
+            grams.extend(" ".join(tokens[i : i + n]) for i in range(len(tokens) - n + 1))
+        return grams
+
+    def _features(self, text: str) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        (column indices, tf-idf weights) of the in-vocabulary terms, L2-normalized.
+        """
+        import numpy as np
+
+        counts = Counter(self._ngrams(text))
+        if not counts:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+
+        grams = sorted(counts)
+        # Own width, so longer grams are never truncated into false hits
+        keys = np.array([g.encode("utf-8") for g in grams]) if self._bytes_terms else np.array(grams)
+        pos = np.minimum(np.searchsorted(self.terms, keys), len(self.terms) - 1)
+        known = self.terms[pos] == keys
+        cols = pos[known]
+        tf = np.array([counts[g] for g, k in zip(grams, known) if k], dtype=np.float64)
+        if self.meta["sublinear_tf"]:
+            tf = np.log(tf) + 1.0
+        weights = tf * self.idf[cols]
+        if self.meta["norm"] == "l2":
+            norm = np.sqrt(np.dot(weights, weights))
+            if norm:
+                weights = weights / norm
+        return cols, weights
+
+    def decision_function(self, texts: Sequence[str]) -> "np.ndarray":
+        """
+        One CSR matrix for the whole batch, one sparse x dense product with the coefficients.
+        """
+        import numpy as np
+        from scipy import sparse
+
+        features = [self._features(text) for text in texts]
+        indptr = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum([len(cols) for cols, _ in features], out=indptr[1:])
+        if features:
+            indices = np.concatenate([cols for cols, _ in features])
+            data = np.concatenate([weights for _, weights in features])
+        else:
+            indices, data = np.empty(0, dtype=np.intp), np.empty(0)
+
+        X = sparse.csr_matrix((data, indices, indptr), shape=(len(texts), len(self.terms)))
+        return np.asarray(X @ self.coef.T) + self.intercept
+
+    def predict_proba(self, texts: Sequence[str]) -> "np.ndarray":
+        """
+        Same link functions as LogisticRegression: softmax for multiclass, sigmoid for binary.
+        """
+        return _link(self.decision_function(texts))
+
+    def predict(self, texts: Sequence[str]) -> "np.ndarray":
+        return self.classes_[self.predict_proba(texts).argmax(axis=1)]
+
+
+def main() -> None:
+    """
+    Convert a joblib pipeline to the compact format and check it predicts the same.
+
+        python -m resume_analyzer.ml.compact models/role_pipeline.joblib [--out models/role_pipeline.npz]
+    """
+    import argparse
+
+    import joblib
+    import numpy as np
+
+    parser = argparse.ArgumentParser(description="Export a role pipeline to the compact npz format")
+    parser.add_argument("model", help="joblib pipeline to convert")
+    parser.add_argument("--out", help="Output path (default: same name with .npz)")
+    parser.add_argument("--check", action="append", default=[], help="Extra text to compare predictions on")
+    args = parser.parse_args()
+
+    pipeline = joblib.load(args.model)
+    out = export_role_model(pipeline, args.out or Path(args.model).with_suffix(COMPACT_SUFFIX))
+    compact = CompactRoleModel(out)
+
+    texts = args.check or ["kotlin android jetpack compose", "java spring boot kafka", "python pandas pytorch"]
+    if not np.allclose(compact.predict_proba(texts), pipeline.predict_proba(texts), rtol=0, atol=1e-9):
+        raise SystemExit(f"❌ Compact model predictions differ from {args.model}")
+    print(f"✅ Saved compact model: {out}")
+
+
+if __name__ == "__main__":
+    main()
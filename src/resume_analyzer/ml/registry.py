@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+from .role_predictor import (
+    DEFAULT_MODEL_PATH,
+    DEFAULT_MODEL_POINTER,
+    RolePredictor,
+    artifact_key as _artifact_key,
+    resolve_latest_model_path,
+)
+
+
+log = logging.getLogger(__name__)
+
+# (resolved path, mtime_ns) -> identifies one artifact on disk
+_ArtifactKey = Tuple[Path, int]
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of loaded model artifacts (RolePredictor by default).
+
+    - Each artifact is loaded once per process (keyed by path + mtime) and kept
+      in an LRU of at most `max_items` artifacts; the model the pointer refers
+      to is never evicted.
+    - The "latest" pointer file is re-checked at most every `check_interval` seconds.
+      When it points somewhere new, the new model is loaded and swapped in atomically:
+      callers already holding the previous model keep using it, and callers that
+      arrive while a reload is in progress are served the current model instead of waiting.
+    """
+
+    def __init__(
+        self,
+        pointer_path: str | Path = DEFAULT_MODEL_POINTER,
+        fallback_path: str | Path = DEFAULT_MODEL_PATH,
+        check_interval: float = 2.0,
+        loader: Callable[[Path], Any] = RolePredictor,
+        max_items: int = 4,
+    ):
+        self.pointer_path = Path(pointer_path)
+        self.fallback_path = Path(fallback_path)
+        self.check_interval = float(check_interval)
+        self.loader = loader
+        self.max_items = max(1, int(max_items))
+
+        self._lock = threading.Lock()
+        self._artifacts: "OrderedDict[_ArtifactKey, Any]" = OrderedDict()
+        self._current: Optional[Any] = None
+        self._current_key: Optional[_ArtifactKey] = None
+        self._last_check = 0.0
+
+    def load(self, model_path: str | Path) -> Any:
+        """
+        Return the model for an explicit artifact path, loading it only once.
+        """
+        path = Path(model_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Model not found: {path}")
+
+        key = _artifact_key(path)
+        model = self._artifacts.get(key)
+        if model is not None:
+            try:
+                self._artifacts.move_to_end(key)  # single C call, atomic under the GIL
+            except KeyError:
+                pass  # evicted meanwhile; the caller still gets the model
+            return model
+
+        with self._lock:
+            model = self._artifacts.get(key)
+            if model is None:
+                model = self.loader(path)
+            self._remember_locked(key, model)
+            return model
+
+    def _remember_locked(self, key: _ArtifactKey, model: Any) -> None:
+        self._artifacts[key] = model
+        self._artifacts.move_to_end(key)
+        for old in list(self._artifacts):
+            if len(self._artifacts) <= self.max_items:
+                break
+            if old != self._current_key:
+                del self._artifacts[old]
+
+    def get(self) -> Any:
+        """
+        Return the model the pointer file currently refers to.
+        """
+        current = self._current
+        if current is not None and time.monotonic() - self._last_check < self.check_interval:
+            return current
+
+        # Only one caller reloads; everyone else keeps being served the current model.
+        if not self._lock.acquire(blocking=current is None):
+            return current  # type: ignore[return-value]
+        try:
+            return self._refresh_locked()
+        finally:
+            self._lock.release()
+
+    def _refresh_locked(self) -> Any:
+        self._last_check = time.monotonic()
+        current = self._current
+
+        path = resolve_latest_model_path(self.pointer_path, self.fallback_path)
+        try:
+            key = _artifact_key(path)
+        except FileNotFoundError:
+            if current is not None:
+                log.warning("Model pointer targets missing file %s; keeping %s", path, self._current_key[0])
+                return current
+            raise FileNotFoundError(f"Model not found: {path}")
+
+        if current is not None and key == self._current_key:
+            return current
+
+        model = self._artifacts.get(key)
+        if model is None:
+            try:
+                model = self.loader(path)
+            except Exception:
+                if current is None:
+                    raise
+                log.exception("Failed to load model %s; keeping %s", path, self._current_key[0])
+                return current
+
+        # Publish the new model; drop the old artifact so it is freed once in-flight callers finish.
+        previous_key = self._current_key
+        if previous_key is not None and previous_key != key:
+            self._artifacts.pop(previous_key, None)
+        self._current, self._current_key = model, key
+        self._remember_locked(key, model)
+
+        if previous_key is not None:
+            log.info("Model swapped: %s -> %s", previous_key[0].name, path.name)
+        return model
+
+    def clear(self) -> None:
+        with self._lock:
+            self._artifacts.clear()
+            self._current = None
+            self._current_key = None
+            self._last_check = 0.0
+
+
+_default_registry: Optional[ModelRegistry] = None
+
+
+def get_model_registry() -> ModelRegistry:
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = ModelRegistry()
+    return _default_registry
+
+
+def get_role_predictor(model_path: str | Path | None = None) -> RolePredictor:
+    """
+    Shared predictor: the latest model (hot-reloaded) or a specific artifact when a path is given.
+    """
+    registry = get_model_registry()
+    if model_path is None:
+        return registry.get()
+    return registry.load(model_path)
@@ -2,9 +2,45 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Sequence, Tuple, Union
 
-import joblib
+from resume_analyzer.utils.topk import top_k_indices
+
+from .compact import COMPACT_SUFFIX, CompactRoleModel
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from resume_analyzer.document import ResumeDocument
+
+
+DEFAULT_MODEL_POINTER = Path("models/latest_role_model.txt")
+DEFAULT_MODEL_PATH = Path("models/role_pipeline.joblib")
+
+
+def artifact_key(path: str | Path) -> Tuple[Path, int]:
+    """
+    (resolved path, mtime_ns): identifies one artifact on disk, so a file
+    replaced in place counts as a new model.
+    """
+    resolved = Path(path).resolve()
+    return resolved, resolved.stat().st_mtime_ns
+
+
+def resolve_latest_model_path(
+    pointer_path: str | Path = DEFAULT_MODEL_POINTER,
+    fallback_path: str | Path = DEFAULT_MODEL_PATH,
+) -> Path:
+    """
+    Resolve the model path referenced by the "latest" pointer file.
+    Pointers written on Windows use backslashes; normalize them so they resolve anywhere.
+    """
+    pointer = Path(pointer_path)
+    if pointer.exists():
+        target = pointer.read_text(encoding="utf-8").strip().replace("\\", "/")
+        if target:
+            return Path(target)
+    return Path(fallback_path)
 
 
 @dataclass(frozen=True)
@@ -13,54 +49,135 @@ class RolePrediction:
     confidence: float
 
 
+class RoleTopK(NamedTuple):
+    """
+    Batch top-k as arrays: row i holds the k best class indices (into `classes`)
+    and their probabilities, best first. Empty texts get index -1 and 0.0.
+    """
+
+    indices: "np.ndarray"  # (n_texts, k) int
+    confidences: "np.ndarray"  # (n_texts, k) float
+    classes: List[str]
+
+    def to_predictions(self) -> List[List[RolePrediction]]:
+        out: List[List[RolePrediction]] = []
+        for idx_row, conf_row in zip(self.indices.tolist(), self.confidences.tolist()):
+            if not idx_row or idx_row[0] < 0:
+                out.append([RolePrediction(label="unknown", confidence=0.0)])
+                continue
+            out.append([RolePrediction(label=self.classes[i], confidence=c) for i, c in zip(idx_row, conf_row)])
+        return out
+
+
 class RolePredictor:
     def __init__(self, model_path: str | Path | None = None):
         """
         If model_path is None:
         - Try models/latest_role_model.txt
         - Fallback to models/role_pipeline.joblib
+
+        .npz artifacts (see ml.compact) load without sklearn; anything else is joblib.
         """
         if model_path is None:
-            latest = Path("models/latest_role_model.txt")
-            if latest.exists():
-                model_path = latest.read_text(encoding="utf-8").strip()
-            else:
-                model_path = "models/role_pipeline.joblib"
+            model_path = resolve_latest_model_path()
 
         self.model_path = Path(model_path)
         if not self.model_path.exists():
             raise FileNotFoundError(f"Role model not found: {self.model_path}")
+        self.artifact_key = artifact_key(self.model_path)
+
+        if self.model_path.suffix == COMPACT_SUFFIX:
+            # Memory-mapped arrays: workers loading the same file share its pages
+            self.pipeline = CompactRoleModel(self.model_path)
+        else:
+            import joblib  # pulls in sklearn when unpickling; keep it off the import path
 
-        self.pipeline = joblib.load(self.model_path)
+            self.pipeline = joblib.load(self.model_path)
+
+    @property
+    def model_version(self) -> str:
+        """
+        Version tag of the loaded artifact (file stem, e.g. role_pipeline_v20260115_1732).
+        """
+        return self.model_path.stem
 
-    def predict(self, text: str) -> RolePrediction:
+    def predict(self, text: Union[str, "ResumeDocument"]) -> RolePrediction:
         """
         Single best prediction.
         """
         top = self.predict_topk(text, k=1)
         return top[0] if top else RolePrediction(label="unknown", confidence=0.0)
 
-    def predict_topk(self, text: str, k: int = 3) -> list[RolePrediction]:
+    def predict_proba(self, text: str) -> Dict[str, float]:
         """
-        Top-k predictions with confidence using predict_proba (if available).
+        label -> probability. Pipelines without predict_proba give the hard label 1.0.
         """
-        if not text or not text.strip():
-            return [RolePrediction(label="unknown", confidence=0.0)]
-
-        # If pipeline doesn't support proba, fallback to hard prediction
         if not hasattr(self.pipeline, "predict_proba"):
-            label = str(self.pipeline.predict([text])[0])
-            return [RolePrediction(label=label, confidence=1.0)]
+            return {str(self.pipeline.predict([text])[0]): 1.0}
 
         proba = self.pipeline.predict_proba([text])[0]
         classes = list(self.pipeline.classes_)
+        return {str(classes[i]): float(proba[i]) for i in range(len(classes))}
 
-        pairs = sorted(
-            [(str(classes[i]), float(proba[i])) for i in range(len(classes))],
-            key=lambda x: x[1],
-            reverse=True,
-        )
+    def predict_topk(self, text: Union[str, "ResumeDocument"], k: int = 3) -> list[RolePrediction]:
+        """
+        Top-k predictions with confidence using predict_proba (if available).
+        A ResumeDocument reuses its memoized probabilities for this model.
+        """
+        if isinstance(text, str):
+            if not text or not text.strip():
+                return [RolePrediction(label="unknown", confidence=0.0)]
+            proba = self.predict_proba(text)
+        else:
+            if not text.text.strip():
+                return [RolePrediction(label="unknown", confidence=0.0)]
+            proba = text.role_probabilities(self)
+
+        pairs = sorted(proba.items(), key=lambda x: x[1], reverse=True)
 
         k = max(1, int(k))
         topk = pairs[:k]
         return [RolePrediction(label=lbl, confidence=conf) for lbl, conf in topk]
+
+    def predict_topk_batch(
+        self,
+        texts: Sequence[Union[str, "ResumeDocument"]],
+        k: int = 3,
+        as_arrays: bool = False,
+    ) -> Union[List[List[RolePrediction]], RoleTopK]:
+        """
+        Top-k for many texts at once: one predict_proba call over the whole batch
+        (a single sparse matrix), then a per-row partition instead of sorting
+        every class of every row.
+
+        Returns one list of RolePrediction per text (same results as predict_topk),
+        or a RoleTopK of arrays with as_arrays=True.
+        """
+        import numpy as np
+
+        classes = [str(c) for c in self.pipeline.classes_]
+        k = min(max(1, int(k)), len(classes))
+        n = len(texts)
+
+        raw = [t if isinstance(t, str) else t.text for t in texts]
+        rows = [i for i, t in enumerate(raw) if t and t.strip()]
+
+        proba = np.zeros((n, len(classes)))
+        if rows:
+            batch = [raw[i] for i in rows]
+            if hasattr(self.pipeline, "predict_proba"):
+                proba[rows] = self.pipeline.predict_proba(batch)
+            else:
+                hard = self.pipeline.predict(batch)
+                proba[rows, [classes.index(str(lbl)) for lbl in hard]] = 1.0
+
+        # Best first; ties keep class order at the cut too, like the stable sort in predict_topk
+        indices = top_k_indices(proba, k).astype(np.int32)
+        confidences = np.take_along_axis(proba, indices, axis=1)
+
+        empty = np.ones(n, dtype=bool)
+        empty[rows] = False
+        indices[empty] = -1
+
+        result = RoleTopK(indices=indices, confidences=confidences, classes=classes)
+        return result if as_arrays else result.to_predictions()
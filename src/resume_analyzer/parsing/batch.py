@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import List, Optional, Sequence, Tuple, Union
+
+from .budget import ExtractionBudget, ExtractionReport
+from .pool import get_pool, shutdown_pools  # noqa: F401  (re-exported for callers)
+from .resume import extract_resume_text
+from .source import DocumentSource, is_path_source
+
+
+ParseOutcome = Union[str, Exception]
+ReportedOutcome = Union[Tuple[str, ExtractionReport], Exception]
+
+
+def _picklable(source: DocumentSource) -> DocumentSource:
+    if is_path_source(source) or isinstance(source, bytes):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return bytes(source)
+    return source.read()
+
+
+def _extract_safe(source: DocumentSource, budget: Optional[ExtractionBudget] = None) -> ReportedOutcome:
+    report = ExtractionReport()
+    try:
+        return extract_resume_text(source, budget, report), report
+    except Exception as e:  # reported per document, never fails the batch
+        return e
+
+
+def extract_many_with_reports(
+    sources: Sequence[DocumentSource],
+    workers: int = 1,
+    budget: Optional[ExtractionBudget] = None,
+) -> List[ReportedOutcome]:
+    """
+    Parse many resumes, in input order. Each entry is (cleaned text, extraction
+    report) or the exception raised for that document.
+
+    With workers > 1 documents are parsed in parallel on a shared process pool
+    (pypdf is pure Python, so threads would not help).
+    """
+    if workers <= 1 or len(sources) < 2:
+        return [_extract_safe(s, budget) for s in sources]
+
+    pool = get_pool(int(workers))
+    return list(pool.map(partial(_extract_safe, budget=budget), [_picklable(s) for s in sources]))
+
+
+def extract_many(
+    sources: Sequence[DocumentSource],
+    workers: int = 1,
+    budget: Optional[ExtractionBudget] = None,
+) -> List[ParseOutcome]:
+    """
+    Same as extract_many_with_reports, keeping only the text.
+    """
+    return [
+        outcome if isinstance(outcome, Exception) else outcome[0]
+        for outcome in extract_many_with_reports(sources, workers=workers, budget=budget)
+    ]
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ExtractionBudget:
+    """
+    Limits for one document extraction. None means unlimited.
+    """
+    max_pages: Optional[int] = None
+    max_chars: Optional[int] = None
+    max_seconds: Optional[float] = None
+
+    @property
+    def deterministic_key(self) -> str:
+        """
+        Page/char limits change the output for the same bytes; the time limit does
+        not (timed-out results are simply not cached).
+        """
+        return f"pages={self.max_pages};chars={self.max_chars}"
+
+
+@dataclass
+class ExtractionReport:
+    """
+    Filled in while chunks stream out of an extractor.
+    """
+    pages_total: int = 0
+    pages_read: int = 0
+    chars: int = 0
+    truncated: bool = False
+    reason: Optional[str] = None  # "max_pages" | "max_chars" | "max_seconds"
+
+    def stop(self, reason: str) -> None:
+        self.truncated = True
+        self.reason = reason
+
+
+class BudgetTracker:
+    """
+    Shared budget bookkeeping for the streaming extractors.
+    """
+
+    def __init__(self, budget: Optional[ExtractionBudget], report: Optional[ExtractionReport]):
+        self.budget = budget or ExtractionBudget()
+        self.report = report if report is not None else ExtractionReport()
+        self._deadline = (
+            time.monotonic() + self.budget.max_seconds if self.budget.max_seconds is not None else None
+        )
+
+    def before_page(self) -> bool:
+        """
+        False (and the report marked truncated) when no further page may be read.
+        """
+        b = self.budget
+        if b.max_pages is not None and self.report.pages_read >= b.max_pages:
+            self.report.stop("max_pages")
+            return False
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self.report.stop("max_seconds")
+            return False
+        if b.max_chars is not None and self.report.chars >= b.max_chars:
+            self.report.stop("max_chars")
+            return False
+        return True
+
+    def remaining_seconds(self) -> Optional[float]:
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def take(self, text: str) -> str:
+        """
+        Account for one chunk, trimming it to the remaining character budget.
+        """
+        max_chars = self.budget.max_chars
+        if max_chars is not None:
+            remaining = max_chars - self.report.chars
+            if len(text) > remaining:
+                text = text[: max(0, remaining)]
+                self.report.stop("max_chars")
+        self.report.chars += len(text)
+        return text
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# Bump whenever extraction/cleaning output changes so stale entries stop matching.
+PARSER_VERSION = "1"
+
+
+@dataclass(frozen=True)
+class CachedParse:
+    text: str
+    features: Dict[str, Any] = field(default_factory=dict)
+    created_at: float = 0.0
+
+
+def cache_key(data: bytes, variant: str = "") -> str:
+    """
+    Content address: SHA-256 of parser version + variant + document bytes.
+    `variant` covers extraction options that change the output (e.g. budgets).
+    """
+    h = hashlib.sha256()
+    h.update(PARSER_VERSION.encode("ascii"))
+    h.update(b"\0")
+    if variant:
+        h.update(variant.encode("utf-8"))
+        h.update(b"\0")
+    h.update(data)
+    return h.hexdigest()
+
+
+class ParseCache:
+    """
+    Two-tier cache of parsed documents keyed by content hash.
+
+    - Memory: bounded LRU of the most recently used entries.
+    - Disk (optional): SQLite file, bounded by total payload bytes and entry age;
+      least recently accessed entries are evicted first. The byte total lives
+      in the database (kept by triggers), so every process sharing the file
+      (API workers, CLI pool) enforces one budget.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_memory_items: int = 256,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        max_age_seconds: float = 7 * 24 * 3600,
+    ):
+        self.path = Path(path) if path else None
+        self.max_memory_items = max(0, int(max_memory_items))
+        self.max_disk_bytes = max(0, int(max_disk_bytes))
+        self.max_age_seconds = float(max_age_seconds)
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, CachedParse]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS parses ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS parses_accessed ON parses (accessed_at)")
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS parses_size ("
+                    " id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL)"
+                )
+                # Seeded from the rows once (files written before the total existed), then kept by triggers
+                self._db.execute(
+                    "INSERT OR IGNORE INTO parses_size (id, bytes) SELECT 0, COALESCE(SUM(size), 0) FROM parses"
+                )
+                self._db.execute(
+                    "CREATE TRIGGER IF NOT EXISTS parses_size_insert AFTER INSERT ON parses"
+                    " BEGIN UPDATE parses_size SET bytes = bytes + NEW.size WHERE id = 0; END"
+                )
+                self._db.execute(
+                    "CREATE TRIGGER IF NOT EXISTS parses_size_delete AFTER DELETE ON parses"
+                    " BEGIN UPDATE parses_size SET bytes = bytes - OLD.size WHERE id = 0; END"
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.max_age_seconds > 0 and now - created_at > self.max_age_seconds
+
+    def _remember(self, key: str, entry: CachedParse) -> None:
+        if not self.max_memory_items:
+            return
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[CachedParse]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry.created_at, now):
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return entry
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, created_at FROM parses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    if self._expired(row[1], now):
+                        self._delete_locked(key)
+                    else:
+                        self._db.execute("UPDATE parses SET accessed_at = ? WHERE key = ?", (now, key))
+                        payload = json.loads(row[0])
+                        entry = CachedParse(text=payload["text"], features=payload["features"], created_at=row[1])
+                        self._remember(key, entry)
+                        self.disk_hits += 1
+                        return entry
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, text: str, features: Optional[Dict[str, Any]] = None) -> CachedParse:
+        now = time.time()
+        entry = CachedParse(text=text, features=dict(features or {}), created_at=now)
+
+        with self._lock:
+            self._remember(key, entry)
+
+            if self._db is not None:
+                value = json.dumps({"text": entry.text, "features": entry.features}, ensure_ascii=False)
+                size = len(value.encode("utf-8"))
+                if self.max_disk_bytes and size > self.max_disk_bytes:
+                    return entry
+
+                # One write transaction: processes sharing the file evict against the same total
+                self._db.execute("BEGIN IMMEDIATE")
+                try:
+                    self._delete_locked(key)
+                    self._db.execute(
+                        "INSERT INTO parses (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                        (key, value, size, now, now),
+                    )
+                    self._evict_locked(now)
+                    self._db.execute("COMMIT")
+                except Exception:
+                    self._db.execute("ROLLBACK")
+                    raise
+
+        return entry
+
+    def _delete_locked(self, key: str) -> None:
+        self._db.execute("DELETE FROM parses WHERE key = ?", (key,))
+
+    def _disk_bytes_locked(self) -> int:
+        return self._db.execute("SELECT bytes FROM parses_size WHERE id = 0").fetchone()[0]
+
+    def _evict_locked(self, now: float) -> None:
+        if self.max_age_seconds > 0:
+            self._db.execute("DELETE FROM parses WHERE created_at < ?", (now - self.max_age_seconds,))
+
+        total = self._disk_bytes_locked()
+        if not self.max_disk_bytes or total <= self.max_disk_bytes:
+            return
+
+        victims: list[str] = []
+        for key, size in self._db.execute("SELECT key, size FROM parses ORDER BY accessed_at ASC"):
+            if total <= self.max_disk_bytes:
+                break
+            victims.append(key)
+            total -= size
+        self._db.executemany("DELETE FROM parses WHERE key = ?", [(k,) for k in victims])
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            disk_items = disk_bytes = 0
+            if self._db is not None:
+                disk_items = self._db.execute("SELECT COUNT(*) FROM parses").fetchone()[0]
+                disk_bytes = self._disk_bytes_locked()
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_items": len(self._memory),
+                "disk_items": disk_items,
+                "disk_bytes": disk_bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM parses")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
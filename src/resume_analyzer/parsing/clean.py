@@ -1,22 +1,104 @@
+from __future__ import annotations
+
 import re
+from typing import Iterable, Iterator, List
+
+
+# Runs of spaces / tabs that need rewriting to one space (single spaces are left alone)
+_SPACE_RUN_RE = re.compile(r"[ \t]{2,}|\t")
 
 
 def clean_text(text: str) -> str:
     """
-    Light cleanup that keeps meaning but removes junk spacing.
+    Light cleanup that keeps meaning but removes junk spacing:
+
+    - normalize newlines (\\r\\n and \\r to \\n)
+    - collapse runs of spaces / tabs to one space
+    - collapse 3+ newlines to 2
+    - trim every line, then the whole text
     """
     if not text:
         return ""
+    cleaner = TextCleaner()
+    return cleaner.feed(text) + cleaner.finish()
 
-    # Normalize newlines
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
 
-    # Remove repeated spaces/tabs
-    text = re.sub(r"[ \t]+", " ", text)
+class TextCleaner:
+    """
+    clean_text for text that arrives in pieces (PDF pages, DOCX paragraphs):
+    feed() each piece and finish() at the end; the returned strings concatenate
+    to exactly clean_text of the whole text. clean_text is the one-piece case.
+
+    Works line by line in one pass, and only lines holding a tab or a double
+    space go through the regex. Only the unfinished last line (plus a "\\r"
+    that may be the first half of "\\r\\n") is kept between pieces, along with
+    the state the whole-text rules need across a boundary:
+
+    - runs of 3+ newlines collapse to 2: a line with no characters at all right
+      after another one is dropped (whitespace-only lines do not count);
+    - the final strip: empty lines are held back until a non-empty line
+      follows, so leading and trailing ones are never emitted.
+    """
 
-    # Collapse 3+ newlines to 2
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    def __init__(self) -> None:
+        self._tail = ""  # raw text after the last newline
+        self._blank = 0  # empty lines held back
+        self._prev_empty = False  # previous raw line had no characters
+        self._started = False  # a non-empty line has been emitted
 
-    # Trim lines
-    lines = [ln.strip() for ln in text.split("\n")]
-    return "\n".join(lines).strip()
+    def feed(self, chunk: str) -> str:
+        if not chunk:
+            return ""
+        text = self._tail + chunk
+        hold = ""
+        if text.endswith("\r"):
+            text, hold = text[:-1], "\r"
+        lines = self._split(text)
+        self._tail = lines.pop() + hold
+        return self._clean_lines(lines)
+
+    def finish(self) -> str:
+        text, self._tail = self._tail, ""
+        return self._clean_lines(self._split(text))
+
+    @staticmethod
+    def _split(text: str) -> List[str]:
+        return text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+
+    def _clean_lines(self, lines: List[str]) -> str:
+        out: List[str] = []
+        for raw in lines:
+            if not raw:
+                if not self._prev_empty:
+                    self._prev_empty = True
+                    self._blank += 1
+                continue
+            self._prev_empty = False
+            if "  " in raw or "\t" in raw:  # most lines have nothing to collapse
+                raw = _SPACE_RUN_RE.sub(" ", raw)
+            line = raw.strip()
+            if not line:
+                self._blank += 1
+                continue
+            if self._started:
+                out.append("\n" * (self._blank + 1))
+            self._started = True
+            self._blank = 0
+            out.append(line)
+        return "".join(out)
+
+
+def iter_clean_text(chunks: Iterable[str], sep: str = "\n") -> Iterator[str]:
+    """
+    Clean text pieces as they arrive: "".join(iter_clean_text(chunks, sep)) is
+    clean_text(sep.join(chunks)), but each chunk is cleaned (and its cleaned
+    text yielded) before the next one is read.
+    """
+    cleaner = TextCleaner()
+    for i, chunk in enumerate(chunks):
+        out = cleaner.feed(sep + chunk if i and sep else chunk)
+        if out:
+            yield out
+    out = cleaner.finish()
+    if out:
+        yield out
@@ -1,21 +1,54 @@
 from __future__ import annotations
 
 import re
+import string
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional, Tuple
 
 
-_EMAIL_RE = re.compile(r"\b[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}\b")
-# Loose but practical: handles +91, spaces, dashes, parentheses
-# Loose but practical: supports +91 98765 43210, (022) 2345-6789, +1 (415) 555-2671, etc.
-_PHONE_RE = re.compile(r"(?<!\w)(?:\+?\(?\d[\d\s\-()]{8,}\d)(?!\w)")
+# Contact tokens are found by three scanners that never backtrack, merged in
+# position order as if they were one pattern "url | profile | email | phone":
+# the leftmost token wins, ties go to the earlier kind, and a URL's path digits
+# are never read as a phone number. Each scanner is linear in the text, so no
+# input (tables of digits and dashes, long dotted runs) can make extraction
+# quadratic the way a single backtracking regex can.
+#
+# Links: every token starts after a non-word character; nothing follows the
+# open-ended [^\s)]+ so a failed position costs a few character checks. The
+# pattern opens with the set of possible first letters and checks the
+# character before it afterwards ((?<!\w.)), so the regex engine can skip
+# ahead on that set instead of trying the lookbehind at every position.
+_LINK_RE = re.compile(
+    r"[hHwWlLgG](?<!\w.)(?:"
+    r"(?P<url>(?<=[hH])(?i:ttps?://)[^\s)]+|(?<=[wW])(?i:ww\.)[^\s)]+)"
+    r"|(?P<profile>(?<=[lL])(?i:inkedin\.com/)[^\s)]+|(?<=[gG])(?i:ithub\.com/)[^\s)]+)"  # bare linkedin.com/in/...
+    r")"
+)
+_LINK_LOOKAHEAD = 16  # longest prefix that decides a link match ("linkedin.com/" + 1)
+
+# Emails: anchored on "@" (found with str.find), then the local part is walked
+# back and the domain forward, with the rules of
+# \b[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}\b
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_RE = re.compile(r"[a-zA-Z0-9.\-]+")
+_ASCII_LETTERS = frozenset(string.ascii_letters)
 
-_URL_RE = re.compile(
-    r"\bhttps?://[^\s)]+|\bwww\.[^\s)]+", re.IGNORECASE
+# Phones: optional "+" / "(", a digit, then the longest run of digits,
+# whitespace, dashes and parentheses, at least _PHONE_MIN_CHARS long so short
+# numbers (years, counts) are rejected without leaving the regex engine.
+# Nothing follows the run, so it never backtracks; _phone_end trims it. As
+# for links, the first character comes before the (?<!\w) check.
+_PHONE_MIN_CHARS = 10  # first digit to last digit, inclusive
+_PHONE_RUN_RE = re.compile(
+    r"[+(\d](?<!\w.)(?:(?<=\+)\(?\d|(?<=\()\d|(?<=\d))[\d\s\-()]{%d,}" % (_PHONE_MIN_CHARS - 1)
 )
+_PHONE_LOOKAHEAD = _PHONE_MIN_CHARS + 2
 
-_LINKEDIN_RE = re.compile(r"(https?://)?(www\.)?linkedin\.com/[^\s)]+", re.IGNORECASE)
-_GITHUB_RE = re.compile(r"(https?://)?(www\.)?github\.com/[^\s)]+", re.IGNORECASE)
+# Which URLs are LinkedIn / GitHub profiles
+_PROFILE_URL_RE = re.compile(r"(?:https?://)?(?:www\.)?(linkedin|github)\.com/", re.IGNORECASE)
+
+# (start, end, kind)
+_Token = Tuple[int, int, str]
 
 
 def _dedupe_keep_order(items: List[str]) -> List[str]:
@@ -52,6 +85,152 @@ def normalize_phone(phone: str) -> str:
 
 
 
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"  # same as the regex \w
+
+
+def _bounded_search(pattern: re.Pattern, text: str, pos: int, limit: int, lookahead: int) -> Optional[re.Match]:
+    """
+    First match of pattern starting in [pos, limit], with its full extent.
+    Only limit + lookahead characters are searched: enough to decide a match
+    start, which is then re-matched against the whole text.
+    """
+    m = pattern.search(text, pos, min(len(text), limit + lookahead))
+    if m is None or m.start() > limit:
+        return None
+    return pattern.match(text, m.start())
+
+
+def _find_link(text: str, pos: int, limit: int) -> Optional[_Token]:
+    m = _bounded_search(_LINK_RE, text, pos, limit, _LINK_LOOKAHEAD)
+    return (m.start(), m.end(), m.lastgroup) if m else None
+
+
+def _email_end(text: str, at: int) -> int:
+    """
+    End of the email whose "@" is at `at`, or -1: the domain ends after the
+    rightmost "." that is followed by 2+ letters and then a non-word character.
+    """
+    m = _EMAIL_DOMAIN_RE.match(text, at + 1)
+    if m is None:
+        return -1
+    first, last = at + 1, m.end()
+    dot = text.rfind(".", first + 1, last)
+    while dot >= 0:
+        end = dot + 1
+        while end < last and text[end] in _ASCII_LETTERS:
+            end += 1
+        if end - dot > 2 and (end == len(text) or not _is_word(text[end])):
+            return end
+        dot = text.rfind(".", first + 1, dot)
+    return -1
+
+
+def _find_email(text: str, pos: int, limit: int) -> Optional[_Token]:
+    """
+    First email starting at or after pos (limit is ignored: finding "@" is cheap).
+    Local parts and domains never contain "@", so every character is walked at
+    most once per "@".
+    """
+    at = text.find("@", pos)
+    while at >= 0:
+        start = at
+        while start > pos and text[start - 1] in _EMAIL_LOCAL_CHARS:
+            start -= 1
+        # Leftmost word-start in the local part, like \b with the (?<!\w) guard
+        for q in range(start, at):
+            if _is_word(text[q]) and (q == 0 or not _is_word(text[q - 1])):
+                end = _email_end(text, at)
+                if end >= 0:
+                    return q, end, "email"
+                break
+        at = text.find("@", at + 1)
+    return None
+
+
+def _phone_end(text: str, first_digit: int, run_end: int) -> int:
+    """
+    End of the phone number starting at first_digit within a candidate run, or -1.
+
+    The number ends at the last digit that is not followed by a word character:
+    the run's final digit group is dropped when a letter is glued to it, then
+    trailing separators are stripped. Each character is looked at most once.
+    """
+    end = run_end
+    if end < len(text) and _is_word(text[end]):
+        while end > first_digit and text[end - 1].isdecimal():
+            end -= 1
+    while end > first_digit and not text[end - 1].isdecimal():
+        end -= 1
+    return end if end - first_digit >= _PHONE_MIN_CHARS else -1
+
+
+def find_phone(text: str, pos: int = 0, limit: Optional[int] = None) -> Optional[Tuple[int, int]]:
+    """
+    (start, end) of the first phone-like token starting in [pos, limit], or None.
+
+    Matches exactly what the former pattern (?<!\\w)\\+?\\(?\\d[\\d\\s\\-()]{8,}\\d(?!\\w)
+    matched, in time linear in the text: each candidate run is matched without
+    backtracking and its end is fixed by one backwards walk. When a run holds
+    no phone, no later start inside it can hold one either (same run end,
+    stricter length), so the search resumes after the run.
+    """
+    limit = len(text) if limit is None else limit
+    while pos <= limit:
+        m = _bounded_search(_PHONE_RUN_RE, text, pos, limit, _PHONE_LOOKAHEAD)
+        if m is None:
+            return None
+        first_digit = m.start()
+        while not text[first_digit].isdecimal():  # skip the "+" / "("
+            first_digit += 1
+        end = _phone_end(text, first_digit, m.end())
+        if end >= 0:
+            return m.start(), end
+        pos = m.end()
+    return None
+
+
+def _find_phone(text: str, pos: int, limit: int) -> Optional[_Token]:
+    span = find_phone(text, pos, limit)
+    return (span[0], span[1], "phone") if span else None
+
+
+# In tie-break order: at the same start, a link beats an email beats a phone
+_SCANNERS: Tuple[Callable[[str, int, int], Optional[_Token]], ...] = (_find_link, _find_email, _find_phone)
+
+
+def _iter_contact_tokens(text: str) -> Iterator[Tuple[str, str]]:
+    """
+    (kind, token) pairs left to right: "url", "profile", "email" or "phone".
+
+    Each scanner only looks as far as the best candidate so far, so stopping
+    the iteration early (header_first) leaves the rest of the text unread.
+    A scanner's answer is reused while the scan has not passed it:
+    (searched from, searched up to, first token in that range or None).
+    """
+    n = len(text)
+    cache: List[Optional[Tuple[int, int, Optional[_Token]]]] = [None] * len(_SCANNERS)
+    pos = 0
+    while pos < n:
+        best: Optional[_Token] = None
+        for i, scan in enumerate(_SCANNERS):
+            limit = best[0] if best is not None else n
+            hit = cache[i]
+            if hit is not None and hit[0] <= pos and (
+                (hit[2] is not None and hit[2][0] >= pos) or (hit[2] is None and hit[1] >= limit)
+            ):
+                token = hit[2]
+            else:
+                token = scan(text, pos, limit)
+                cache[i] = (pos, n if scan is _find_email else limit, token)
+            if token is not None and token[0] <= limit and (best is None or token[0] < best[0]):
+                best = token
+        if best is None:
+            return
+        yield best[2], text[best[0] : best[1]]
+        pos = best[1]
+
+
 @dataclass(frozen=True)
 class ContactInfo:
     email: Optional[str]
@@ -61,28 +240,48 @@ class ContactInfo:
     github: Optional[str]
 
 
-def extract_contact_info(text: str) -> ContactInfo:
+def extract_contact_info(text: str, header_first: bool = False) -> ContactInfo:
+    """
+    Emails, phones, links and LinkedIn / GitHub profiles from one left-to-right scan.
+
+    header_first=True stops as soon as an email, a phone, a LinkedIn and a GitHub
+    profile have all been seen. Contact details sit at the top of a resume, so
+    this usually reads only the header; phones and links then hold what was
+    found up to that point rather than every occurrence in the document.
+    """
     if not text:
         return ContactInfo(email=None, phones=[], links=[], linkedin=None, github=None)
 
-    emails = _dedupe_keep_order(_EMAIL_RE.findall(text))
-    urls = _dedupe_keep_order([normalize_url(u) for u in _URL_RE.findall(text)])
-    phones_raw = _PHONE_RE.findall(text)
+    emails: List[str] = []
+    phones: List[str] = []
+    links: List[str] = []
+    profiles: dict = {"linkedin": [], "github": []}
 
-    phones_norm = []
-    for p in phones_raw:
-        np = normalize_phone(p)
-        if np:
-            phones_norm.append(np)
-    phones = _dedupe_keep_order(phones_norm)
+    for kind, token in _iter_contact_tokens(text):
+        if kind == "email":
+            emails.append(token)
+        elif kind == "phone":
+            phone = normalize_phone(token)
+            if phone:
+                phones.append(phone)
+        else:
+            url = normalize_url(token)
+            if kind == "url":
+                links.append(url)
+            site = _PROFILE_URL_RE.match(token)
+            if site:
+                profiles[site.group(1).lower()].append(url)
 
-    linkedin_matches = _dedupe_keep_order([normalize_url(m.group(0)) for m in _LINKEDIN_RE.finditer(text)])
-    github_matches = _dedupe_keep_order([normalize_url(m.group(0)) for m in _GITHUB_RE.finditer(text)])
+        if header_first and emails and phones and profiles["linkedin"] and profiles["github"]:
+            break
 
+    emails = _dedupe_keep_order(emails)
+    linkedin = _dedupe_keep_order(profiles["linkedin"])
+    github = _dedupe_keep_order(profiles["github"])
     return ContactInfo(
         email=emails[0] if emails else None,
-        phones=phones,
-        links=urls,
-        linkedin=linkedin_matches[0] if linkedin_matches else None,
-        github=github_matches[0] if github_matches else None,
+        phones=_dedupe_keep_order(phones),
+        links=_dedupe_keep_order(links),
+        linkedin=linkedin[0] if linkedin else None,
+        github=github[0] if github else None,
     )
@@ -1,23 +1,160 @@
 from __future__ import annotations
 
-from pathlib import Path
-from docx import Document
+import posixpath
+import zipfile
+from typing import IO, Iterator, List, Optional
+from xml.etree import ElementTree as ET
 
+from .budget import BudgetTracker, ExtractionBudget, ExtractionReport
+from .source import DocumentSource, open_source
 
-def extract_text_from_docx(file_path: str | Path) -> str:
+
+# Transitional (what Word writes) and Strict WordprocessingML namespaces
+_W_NAMESPACES = (
+    "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "http://purl.oclc.org/ooxml/wordprocessingml/main",
+)
+_MC = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+_RELS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _w(*names: str) -> frozenset:
+    return frozenset(f"{{{ns}}}{name}" for ns in _W_NAMESPACES for name in names)
+
+
+_P = _w("p")
+_T = _w("t")
+_TAB = _w("tab", "ptab")
+_BREAK = _w("br", "cr")
+_HYPHEN = _w("noBreakHyphen")
+_PPR = _w("pPr")  # paragraph properties hold tab stop definitions, also named w:tab
+_ROOTS = _w("body", "hdr", "ftr")  # block containers whose finished children are dropped
+_FALLBACK = _MC + "Fallback"  # legacy copy of an mc:Choice (e.g. a VML text box): skipped
+
+_MAIN_PART = "word/document.xml"
+
+
+def _rel_targets(zf: zipfile.ZipFile, part: str, rel_type: str) -> List[str]:
     """
-    Extract text from a DOCX file.
+    Zip member names of `part`'s relationships of one type, in document order.
     """
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"DOCX not found: {path}")
+    folder, name = posixpath.split(part)
+    rels = posixpath.join(folder, "_rels", name + ".rels")
+    if rels not in zf.NameToInfo:
+        return []
+    out: List[str] = []
+    for rel in ET.fromstring(zf.read(rels)).iter(_RELS + "Relationship"):
+        if rel.get("Type", "").rsplit("/", 1)[-1] != rel_type or rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target", "")
+        target = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join(folder, target))
+        if target in zf.NameToInfo and target not in out:
+            out.append(target)
+    return out
 
-    doc = Document(str(path))
-    parts: list[str] = []
 
-    for p in doc.paragraphs:
-        text = (p.text or "").strip()
-        if text:
-            parts.append(text)
+def _iter_part_paragraphs(stream: IO[bytes]) -> Iterator[str]:
+    """
+    Paragraph texts of one WordprocessingML part in document order, parsed
+    incrementally: body paragraphs, table cells, text boxes and content
+    controls alike. A text box's paragraphs come before the paragraph that
+    anchors it. Each top-level block is dropped once read, so memory stays
+    bounded by the largest paragraph or table, not the document.
+    """
+    stack: List[ET.Element] = []
+    texts: List[List[str]] = []  # one buffer per open paragraph (text boxes nest them)
+    in_ppr = 0
+    skip = 0
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            stack.append(elem)
+            if tag in _P:
+                texts.append([])
+            elif tag in _PPR:
+                in_ppr += 1
+            elif tag == _FALLBACK:
+                skip += 1
+            continue
+
+        stack.pop()
+        if tag in _P:
+            text = "".join(texts.pop())
+            if not skip:
+                yield text
+            elem.clear()
+        elif texts and not skip:
+            if tag in _T:
+                texts[-1].append(elem.text or "")
+            elif tag in _TAB:
+                if not in_ppr:
+                    texts[-1].append("\t")
+            elif tag in _BREAK:
+                texts[-1].append("\n")
+            elif tag in _HYPHEN:
+                texts[-1].append("-")
+        if tag in _PPR:
+            in_ppr -= 1
+        elif tag == _FALLBACK:
+            skip -= 1
+            elem.clear()
+        if stack and stack[-1].tag in _ROOTS:
+            del stack[-1][:]
 
-    return "\n".join(parts).strip()
+
+def iter_docx_paragraphs(
+    source: DocumentSource,
+    budget: Optional[ExtractionBudget] = None,
+    report: Optional[ExtractionReport] = None,
+) -> Iterator[str]:
+    """
+    Yield non-empty paragraphs, honouring the character and wall-clock budget
+    (DOCX has no pages, so max_pages does not apply).
+
+    Reads the zip directly and streams word/document.xml with an incremental
+    XML parser instead of building the python-docx object model. Reading
+    order is headers, body (with tables and text boxes), then footers; a
+    paragraph repeated across header / footer variants (first page, even
+    pages) is yielded once.
+    """
+    if budget is not None:
+        budget = ExtractionBudget(max_chars=budget.max_chars, max_seconds=budget.max_seconds)
+    tracker = BudgetTracker(budget, report)
+
+    with zipfile.ZipFile(open_source(source, "DOCX")) as zf:
+        if _MAIN_PART not in zf.NameToInfo:
+            raise ValueError("Not a DOCX document: word/document.xml is missing")
+        headers = _rel_targets(zf, _MAIN_PART, "header")
+        footers = _rel_targets(zf, _MAIN_PART, "footer")
+
+        seen_in_margins = set()
+        for part in headers + [_MAIN_PART] + footers:
+            margin = part != _MAIN_PART
+            with zf.open(part) as stream:
+                for text in _iter_part_paragraphs(stream):
+                    text = text.strip()
+                    if not text:
+                        continue
+                    if margin:
+                        if text in seen_in_margins:
+                            continue
+                        seen_in_margins.add(text)
+                    if not tracker.before_page():
+                        return
+                    text = tracker.take(text)
+                    if text:
+                        yield text
+                    if tracker.report.truncated:
+                        return
+
+
+def extract_text_from_docx(
+    source: DocumentSource,
+    budget: Optional[ExtractionBudget] = None,
+    report: Optional[ExtractionReport] = None,
+) -> str:
+    """
+    Extract text from a DOCX file.
+    Accepts a path, raw bytes / memoryview, or a binary stream.
+    """
+    return "\n".join(iter_docx_paragraphs(source, budget, report)).strip()
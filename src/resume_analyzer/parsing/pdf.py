@@ -1,24 +1,125 @@
 from __future__ import annotations
 
-from pathlib import Path
-from pypdf import PdfReader
+import math
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Iterator, List, Optional, Tuple, Union
 
+from .budget import BudgetTracker, ExtractionBudget, ExtractionReport
+from .pool import get_pool
+from .source import DocumentSource, open_source
 
-def extract_text_from_pdf(file_path: str | Path) -> str:
+
+# Below this many pages one process beats shipping the PDF to workers
+PARALLEL_MIN_PAGES = 24
+# Every shard re-opens the PDF, so keep shards from getting too small
+MIN_PAGES_PER_SHARD = 4
+
+
+def _extract_page_range(source: Union[str, bytes], start: int, stop: int) -> List[str]:
     """
-    Extract text from a text-based PDF using pypdf.
-    Note: Scanned image PDFs will produce little/empty text (OCR is separate).
+    Worker: text of pages [start, stop) of one PDF.
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(open_source(source, "PDF"))
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def page_shards(n_pages: int, workers: int) -> List[Tuple[int, int]]:
+    """
+    Contiguous page ranges, about two per worker so a slow shard does not idle the rest.
+    """
+    size = max(MIN_PAGES_PER_SHARD, math.ceil(n_pages / (workers * 2)))
+    return [(start, min(start + size, n_pages)) for start in range(0, n_pages, size)]
+
+
+def _iter_pages_parallel(
+    source: Union[str, bytes],
+    n_pages: int,
+    workers: int,
+    tracker: BudgetTracker,
+) -> Iterator[str]:
     """
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"PDF not found: {path}")
+    Page texts in document order, extracted shard by shard on the shared process pool.
+    """
+    pool = get_pool(workers)
+    futures = [pool.submit(_extract_page_range, source, a, b) for a, b in page_shards(n_pages, workers)]
+    try:
+        for fut in futures:
+            try:
+                pages = fut.result(timeout=tracker.remaining_seconds())
+            except FutureTimeout:
+                tracker.report.stop("max_seconds")
+                return
+            yield from pages
+    finally:
+        # Early stop (budget hit or consumer gone): drop shards not started yet
+        for fut in futures:
+            fut.cancel()
+
+
+def iter_pdf_pages(
+    source: DocumentSource,
+    budget: Optional[ExtractionBudget] = None,
+    report: Optional[ExtractionReport] = None,
+    workers: int = 1,
+) -> Iterator[str]:
+    """
+    Yield the text of each non-empty page, one page at a time.
+
+    Stops early (and marks `report` truncated) once the page, character or
+    wall-clock budget is used up; the last page is trimmed to the character limit.
+
+    With workers > 1 and at least PARALLEL_MIN_PAGES pages, page ranges are
+    extracted in parallel on a process pool and reassembled in order.
+    """
+    from pypdf import PdfReader  # imported on first PDF, not at module import
 
-    reader = PdfReader(str(path))
-    chunks: list[str] = []
+    stream = open_source(source, "PDF")
+    reader = PdfReader(stream)
+    tracker = BudgetTracker(budget, report)
+    n_pages = len(reader.pages)
+    tracker.report.pages_total = n_pages
 
-    for page in reader.pages:
-        txt = page.extract_text() or ""
-        if txt.strip():
-            chunks.append(txt)
+    if workers > 1 and n_pages >= PARALLEL_MIN_PAGES:
+        if isinstance(stream, str):
+            shipped: Union[str, bytes] = stream
+        else:
+            stream.seek(0)
+            shipped = stream.read()
+        max_pages = tracker.budget.max_pages
+        wanted = n_pages if max_pages is None else min(n_pages, max_pages)
+        pages: Iterator[str] = _iter_pages_parallel(shipped, wanted, int(workers), tracker)
+    else:
+        pages = (page.extract_text() or "" for page in reader.pages)
 
-    return "\n".join(chunks).strip()
+    try:
+        # Budget is checked before each page is pulled, so a stop never costs an extra page
+        while tracker.report.pages_read < n_pages and tracker.before_page():
+            txt = next(pages, None)
+            if txt is None:  # a parallel shard ran out of time
+                return
+            tracker.report.pages_read += 1
+            if not txt.strip():
+                continue
+            txt = tracker.take(txt)
+            if txt:
+                yield txt
+            if tracker.report.truncated:
+                return
+    finally:
+        pages.close()
+
+
+def extract_text_from_pdf(
+    source: DocumentSource,
+    budget: Optional[ExtractionBudget] = None,
+    report: Optional[ExtractionReport] = None,
+    workers: int = 1,
+) -> str:
+    """
+    Extract text from a text-based PDF using pypdf.
+    Accepts a path, raw bytes / memoryview, or a binary stream.
+    Note: Scanned image PDFs will produce little/empty text (OCR is separate).
+    """
+    return "\n".join(iter_pdf_pages(source, budget, report, workers)).strip()
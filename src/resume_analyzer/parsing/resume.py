@@ -1,28 +1,59 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterator, Optional
 
-from .clean import clean_text
-from .docx import extract_text_from_docx
-from .pdf import extract_text_from_pdf
+from .budget import ExtractionBudget, ExtractionReport
+from .clean import iter_clean_text
+from .docx import iter_docx_paragraphs
+from .pdf import iter_pdf_pages
+from .source import DocumentSource, is_path_source, open_source, sniff_document_type
 
 
 SUPPORTED_EXTS = {".pdf", ".docx"}
 
 
-def extract_resume_text(file_path: str | Path) -> str:
+def iter_resume_chunks(
+    source: DocumentSource,
+    budget: Optional[ExtractionBudget] = None,
+    report: Optional[ExtractionReport] = None,
+    page_workers: int = 1,
+) -> Iterator[str]:
     """
-    Extract and clean resume text from supported formats.
-    """
-    path = Path(file_path)
-    ext = path.suffix.lower()
+    Stream raw (uncleaned) text chunks: PDF pages or DOCX paragraphs.
 
-    if ext not in SUPPORTED_EXTS:
-        raise ValueError(f"Unsupported resume type: {ext}. Use PDF or DOCX.")
+    `source` may be a path (type taken from the extension) or in-memory
+    bytes / memoryview / binary stream (type sniffed from magic bytes).
+    `page_workers` > 1 opts large PDFs into parallel page extraction.
+    """
+    if is_path_source(source):
+        ext = Path(source).suffix.lower()
+        if ext not in SUPPORTED_EXTS:
+            raise ValueError(f"Unsupported resume type: {ext}. Use PDF or DOCX.")
+    else:
+        source = open_source(source, "resume")
+        ext = sniff_document_type(source)
+        if ext is None:
+            raise ValueError("Unsupported resume content: not a PDF or DOCX document.")
 
     if ext == ".pdf":
-        raw = extract_text_from_pdf(path)
-    else:
-        raw = extract_text_from_docx(path)
+        return iter_pdf_pages(source, budget, report, workers=page_workers)
+    return iter_docx_paragraphs(source, budget, report)
+
 
-    return clean_text(raw)
+def extract_resume_text(
+    source: DocumentSource,
+    budget: Optional[ExtractionBudget] = None,
+    report: Optional[ExtractionReport] = None,
+    page_workers: int = 1,
+) -> str:
+    """
+    Extract and clean resume text from supported formats.
+
+    With a budget, extraction stops at the page / character / time limit and
+    `report` records whether (and why) the text was truncated.
+
+    Each page / paragraph is cleaned as soon as it is extracted, so the raw
+    document text is never assembled in full.
+    """
+    return "".join(iter_clean_text(iter_resume_chunks(source, budget, report, page_workers)))
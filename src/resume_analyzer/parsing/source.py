@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+
+# Anything the parsers accept: a filesystem path, raw bytes, or a binary stream.
+DocumentSource = Union[str, Path, bytes, bytearray, memoryview, BinaryIO]
+
+_PDF_MAGIC = b"%PDF-"
+_ZIP_MAGIC = b"PK\x03\x04"  # DOCX is a zip container
+_SNIFF_BYTES = 1024  # PDF spec allows junk before the header within the first 1 KB
+
+
+def is_path_source(source: DocumentSource) -> bool:
+    return isinstance(source, (str, Path))
+
+
+def open_source(source: DocumentSource, kind: str) -> str | BinaryIO:
+    """
+    Normalize a source into something pypdf / python-docx can open:
+    a path string (checked to exist) or a seekable binary stream.
+    """
+    if is_path_source(source):
+        path = Path(source)
+        if not path.exists():
+            raise FileNotFoundError(f"{kind} not found: {path}")
+        return str(path)
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+
+    if hasattr(source, "read"):
+        if hasattr(source, "seekable") and source.seekable():
+            return source
+        return io.BytesIO(source.read())
+
+    raise TypeError(f"Unsupported {kind} source type: {type(source).__name__}")
+
+
+def sniff_document_type(source: DocumentSource) -> Optional[str]:
+    """
+    Detect the document type from magic bytes. Returns ".pdf", ".docx" or None.
+    Streams are peeked and rewound to where they were.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        head = bytes(source[:_SNIFF_BYTES])
+    elif hasattr(source, "read") and hasattr(source, "seek"):
+        pos = source.tell()
+        head = source.read(_SNIFF_BYTES)
+        source.seek(pos)
+    else:
+        return None
+
+    if head.startswith(_ZIP_MAGIC):
+        return ".docx"
+    if _PDF_MAGIC in head:
+        return ".pdf"
+    return None
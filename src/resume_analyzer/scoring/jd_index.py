@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple
+
+from resume_analyzer.document import JobDescription
+from resume_analyzer.scoring.match import MatchResult, ResumeInput, _as_resume, normalize_weights
+from resume_analyzer.scoring.similarity import SimilarityModel, get_similarity_model
+from resume_analyzer.skills.bitset import SkillVocabulary
+from resume_analyzer.skills.extract import get_default_extractor
+from resume_analyzer.utils.topk import top_k_indices
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StoredJD:
+    id: str
+    title: Optional[str]
+    skills: List[str]
+    created_at: float
+
+
+@dataclass(frozen=True)
+class JobMatch:
+    jd_id: str
+    title: Optional[str]
+    result: MatchResult
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """
+    Everything match() needs, built from the stored rows; never mutated, so
+    readers use it without locking while a newer one is being built.
+    """
+    key: Tuple[int, Optional[str], str]  # (store version, similarity model version, taxonomy fingerprint)
+    ids: List[str]
+    titles: List[Optional[str]]
+    vocabulary: SkillVocabulary
+    masks: List[int]
+    skills: "np.ndarray"  # n_jds x n_skills float32 0/1
+    sizes: "np.ndarray"  # skills per JD
+    vectorizer: Any  # transforms the resume; None when no JD has any vocabulary
+    vectors: Any  # n_jds x n_features sparse TF-IDF rows (L2-normalized), or None
+
+
+def _pack_vector(row) -> bytes:
+    """
+    One 1 x n sparse row as int32 column indices followed by float64 values.
+    """
+    return row.indices.astype("<i4").tobytes() + row.data.astype("<f8").tobytes()
+
+
+def _unpack_vector(blob: bytes) -> Tuple["np.ndarray", "np.ndarray"]:
+    import numpy as np
+
+    nnz = len(blob) // 12
+    return np.frombuffer(blob, dtype="<i4", count=nnz), np.frombuffer(blob, dtype="<f8", offset=4 * nnz)
+
+
+class JDIndex:
+    """
+    Stored job descriptions, with each JD's skill set and TF-IDF vector computed
+    once when it is registered, so matching one resume against all of them is
+    one sparse matrix-vector product plus one skill coverage product.
+
+    Rows live in SQLite and survive restarts. A version row bumped by every
+    add / remove keys the in-memory matrices, so several instances (or worker
+    processes) on one file see each other's changes. Stored skills are tied
+    to the taxonomy fingerprint and vectors to the similarity model version
+    that produced them; rows from another taxonomy or model are recomputed
+    from their text (and written back) the next time the matrices are built.
+    Without a corpus similarity model (the default, see get_similarity_model),
+    a vectorizer is fitted over the stored JDs themselves.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        similarity: Callable[[], Optional[SimilarityModel]] = get_similarity_model,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._similarity = similarity
+
+        self._lock = threading.Lock()  # database
+        self._build_lock = threading.Lock()  # one snapshot build at a time
+        self._snapshot: Optional[_Snapshot] = None
+
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jds ("
+            " position INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT NOT NULL UNIQUE, title TEXT,"
+            " text TEXT NOT NULL, skills TEXT NOT NULL, taxonomy TEXT NOT NULL,"
+            " vector BLOB, vector_model TEXT, created_at REAL NOT NULL)"
+        )
+        # Bumped by every add / remove, by any process: snapshots are keyed on it
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jds_version (id INTEGER PRIMARY KEY CHECK (id = 0), version INTEGER NOT NULL)"
+        )
+        self._db.execute("INSERT OR IGNORE INTO jds_version (id, version) VALUES (0, 0)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM jds").fetchone()[0]
+
+    def add(self, text: str, title: Optional[str] = None, jd_id: Optional[str] = None) -> StoredJD:
+        return self.add_many([text], [title], [jd_id])[0]
+
+    def add_many(
+        self,
+        texts: Sequence[str],
+        titles: Optional[Sequence[Optional[str]]] = None,
+        ids: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[StoredJD]:
+        """
+        Register JDs (an existing id is replaced). Skills are extracted and
+        vectors computed here, once, in one vectorizer call for the batch.
+        Raises ValueError for an empty JD.
+        """
+        titles = list(titles) if titles is not None else [None] * len(texts)
+        ids = list(ids) if ids is not None else [None] * len(texts)
+        if not len(texts) == len(titles) == len(ids):
+            raise ValueError("texts, titles and ids must have the same length")
+
+        docs = [JobDescription(t) for t in texts]
+        for i, doc in enumerate(docs):
+            if not doc.text.strip():
+                raise ValueError(f"Job description {ids[i] or i} is empty.")
+
+        taxonomy = get_default_extractor().fingerprint
+        model = self._similarity()
+        vectors: List[Optional[bytes]] = [None] * len(docs)
+        if model is not None and docs:
+            X = model.transform([d.text for d in docs])
+            vectors = [_pack_vector(X[i]) for i in range(len(docs))]
+
+        now = time.time()
+        stored = [
+            StoredJD(id=jd_id or uuid.uuid4().hex, title=title, skills=sorted(doc.skills), created_at=now)
+            for doc, title, jd_id in zip(docs, titles, ids)
+        ]
+        rows = [
+            (s.id, s.title, doc.text, json.dumps(s.skills), taxonomy, vec, model.model_version if model else None, now)
+            for s, doc, vec in zip(stored, docs, vectors)
+        ]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                # Replacing deletes first, so the new version also moves to the end of the order
+                self._db.executemany("DELETE FROM jds WHERE id = ?", [(s.id,) for s in stored])
+                self._db.executemany(
+                    "INSERT INTO jds (id, title, text, skills, taxonomy, vector, vector_model, created_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._db.execute("UPDATE jds_version SET version = version + 1")
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return stored
+
+    def get(self, jd_id: str) -> Optional[StoredJD]:
+        with self._lock:
+            row = self._db.execute("SELECT id, title, skills, created_at FROM jds WHERE id = ?", (jd_id,)).fetchone()
+        if row is None:
+            return None
+        return StoredJD(id=row[0], title=row[1], skills=json.loads(row[2]), created_at=row[3])
+
+    def remove(self, jd_id: str) -> bool:
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                removed = self._db.execute("DELETE FROM jds WHERE id = ?", (jd_id,)).rowcount > 0
+                if removed:
+                    self._db.execute("UPDATE jds_version SET version = version + 1")
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    # ---------------------------------------------------------------
+    # Matching
+    # ---------------------------------------------------------------
+
+    def _current(self) -> _Snapshot:
+        model = self._similarity()
+        key = (self._version(), model.model_version if model is not None else None, get_default_extractor().fingerprint)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.key == key:
+            return snapshot
+        with self._build_lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.key != key:
+                snapshot = self._snapshot = self._build(key, model)
+            return snapshot
+
+    def _version(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT version FROM jds_version").fetchone()[0]
+
+    def _build(self, key: Tuple[int, Optional[str], str], model: Optional[SimilarityModel]) -> _Snapshot:
+        import numpy as np
+        from scipy import sparse
+
+        # Rows and version from one read transaction, so the snapshot is labelled with what it holds
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                version = self._db.execute("SELECT version FROM jds_version").fetchone()[0]
+                rows = self._db.execute(
+                    "SELECT id, title, text, skills, taxonomy, vector, vector_model FROM jds ORDER BY position"
+                ).fetchall()
+            finally:
+                self._db.execute("COMMIT")
+
+        _, model_version, taxonomy = key
+        key = (version, model_version, taxonomy)
+        extractor = get_default_extractor()
+        vocabulary = extractor.vocabulary
+
+        # Rows computed with another taxonomy / model: recompute from the text and store
+        stale_skills = [i for i, r in enumerate(rows) if r[4] != taxonomy]
+        stale_vectors = [i for i, r in enumerate(rows) if model is not None and r[6] != model_version]
+        skills = [json.loads(r[3]) for r in rows]
+        for i in stale_skills:
+            skills[i] = sorted(extractor.extract(rows[i][2]))
+        blobs: List[Optional[bytes]] = [r[5] for r in rows]
+        if stale_vectors:
+            X = model.transform([rows[i][2] for i in stale_vectors])  # type: ignore[union-attr]
+            for j, i in enumerate(stale_vectors):
+                blobs[i] = _pack_vector(X[j])
+        if stale_skills or stale_vectors:
+            log.info("JD index: refreshed %d skill sets and %d vectors", len(stale_skills), len(stale_vectors))
+            with self._lock:
+                self._db.executemany(
+                    "UPDATE jds SET skills = ?, taxonomy = ? WHERE id = ?",
+                    [(json.dumps(skills[i]), taxonomy, rows[i][0]) for i in stale_skills],
+                )
+                self._db.executemany(
+                    "UPDATE jds SET vector = ?, vector_model = ? WHERE id = ?",
+                    [(blobs[i], model_version, rows[i][0]) for i in stale_vectors],
+                )
+
+        masks = [vocabulary.mask(s) for s in skills]
+        skill_matrix = vocabulary.to_matrix(masks).astype(np.float32)
+
+        vectorizer, vectors = None, None
+        if model is not None:
+            vectorizer = model.vectorizer
+            parts = [_unpack_vector(b) for b in blobs]  # type: ignore[arg-type]
+            indptr = np.cumsum([0] + [p[0].size for p in parts], dtype=np.int64)
+            vectors = sparse.csr_matrix(
+                (
+                    np.concatenate([p[1] for p in parts]) if parts else np.zeros(0),
+                    np.concatenate([p[0] for p in parts]) if parts else np.zeros(0, dtype=np.int32),
+                    indptr,
+                ),
+                shape=(len(rows), len(vectorizer.idf_)),
+            )
+        elif rows:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+
+            fitted = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), min_df=1)
+            try:
+                vectors = fitted.fit_transform([r[2] for r in rows])
+                vectorizer = fitted
+            except ValueError:  # only stop words everywhere: empty vocabulary
+                pass
+
+        return _Snapshot(
+            key=key,
+            ids=[r[0] for r in rows],
+            titles=[r[1] for r in rows],
+            vocabulary=vocabulary,
+            masks=masks,
+            skills=skill_matrix,
+            sizes=skill_matrix.sum(axis=1, dtype=np.float64),
+            vectorizer=vectorizer,
+            vectors=vectors,
+        )
+
+    def match(
+        self,
+        resume: ResumeInput,
+        top_k: int = 10,
+        weight_similarity: float = 0.6,
+        weight_skill: float = 0.4,
+    ) -> List[JobMatch]:
+        """
+        Score one resume against every stored JD and return the top-k, best first.
+
+        All similarities come from one sparse matrix-vector product and all
+        coverages from one dense one; MatchResult objects are only built for
+        the JDs that make the cut. Coverage always equals match_resume_to_jd's.
+        Similarity equals it only with a corpus similarity model loaded; without
+        one, IDF weights come from the stored JDs instead of from each pair.
+        """
+        import numpy as np
+
+        snap = self._current()
+        n = len(snap.ids)
+        if n == 0:
+            return []
+        doc = _as_resume(resume)
+
+        sims = np.zeros(n, dtype=float)
+        if snap.vectors is not None and doc.text.strip():
+            sims = np.clip((snap.vectors @ doc.tfidf_vector(snap.vectorizer).T).toarray().ravel(), 0.0, 1.0)
+
+        vocabulary = snap.vocabulary
+        resume_skills = doc.skill_mask(vocabulary)
+        have = vocabulary.to_matrix([resume_skills])[0].astype(np.float32)
+        matched = (snap.skills @ have).astype(np.float64)  # exact: counts stay far below float32's 2**24
+        coverage = np.divide(matched, snap.sizes, out=np.zeros(n), where=snap.sizes > 0)
+
+        w_sim, w_skill = normalize_weights(weight_similarity, weight_skill)
+        final = np.clip(w_sim * sims + w_skill * coverage, 0.0, 1.0)
+
+        # Best first; ties keep registration order, also at the top-k cut
+        top = top_k_indices(final, max(1, int(top_k))).tolist()
+
+        resume_names = vocabulary.names_of(resume_skills)
+        out: List[JobMatch] = []
+        for i in top:
+            jd_skills = snap.masks[i]
+            out.append(
+                JobMatch(
+                    jd_id=snap.ids[i],
+                    title=snap.titles[i],
+                    result=MatchResult(
+                        similarity_score=float(sims[i]),
+                        skill_coverage=float(coverage[i]),
+                        final_score=float(final[i]),
+                        resume_skills=resume_names,
+                        jd_skills=vocabulary.names_of(jd_skills),
+                        matched_skills=vocabulary.names_of(jd_skills & resume_skills),
+                        missing_skills=vocabulary.names_of(jd_skills & ~resume_skills),
+                    ),
+                )
+            )
+        return out
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Set, Tuple
+from typing import List, Optional, Set, Tuple, Union
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from resume_analyzer.document import JobDescription, ResumeDocument
+from resume_analyzer.scoring.similarity import SimilarityModel, get_similarity_model
+from resume_analyzer.skills.extract import get_default_extractor
 
-from resume_analyzer.skills.extract import extract_skills
+
+ResumeInput = Union[str, ResumeDocument]
+JobInput = Union[str, JobDescription]
+
+
+def _as_resume(resume: ResumeInput) -> ResumeDocument:
+    return resume if isinstance(resume, ResumeDocument) else ResumeDocument(resume)
+
+
+def _as_jd(jd: JobInput) -> JobDescription:
+    return jd if isinstance(jd, JobDescription) else JobDescription(jd)
 
 
 @dataclass(frozen=True)
@@ -29,9 +40,50 @@ def _safe_round(x: float) -> float:
     return float(x)
 
 
-def compute_text_similarity(resume_text: str, jd_text: str) -> float:
+def normalize_weights(weight_similarity: float, weight_skill: float) -> Tuple[float, float]:
+    """
+    Scale the two weights to sum to 1 (falls back to 0.6 / 0.4 when they don't sum to > 0).
+    """
+    total_w = weight_similarity + weight_skill
+    if total_w <= 0:
+        weight_similarity, weight_skill = 0.6, 0.4
+        total_w = 1.0
+
+    return weight_similarity / total_w, weight_skill / total_w
+
+
+def _cosine(a, b) -> float:
+    """
+    Cosine of two 1 x n L2-normalized sparse rows.
+    """
+    return _safe_round(float((a @ b.T).toarray()[0, 0]))
+
+
+def _fit_pair_similarity(resume_text: str, jd_text: str) -> float:
+    """
+    Legacy path used when no pre-fitted similarity model is available.
+    """
+    # sklearn is heavy to import; only this fallback needs it directly
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    vect = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), min_df=1)
+    X = vect.fit_transform([resume_text, jd_text])
+    sim = cosine_similarity(X[0], X[1])[0][0]
+    return _safe_round(sim)
+
+
+def compute_text_similarity(
+    resume_text: str,
+    jd_text: str,
+    model: Optional[SimilarityModel] = None,
+) -> float:
     """
     TF-IDF cosine similarity baseline.
+
+    Uses the pre-fitted corpus vectorizer (only `transform` at request time), so
+    scores are comparable across requests. Falls back to fitting on the pair when
+    no similarity model has been trained.
     """
     resume_text = resume_text or ""
     jd_text = jd_text or ""
@@ -39,52 +91,75 @@ def compute_text_similarity(resume_text: str, jd_text: str) -> float:
     if not resume_text.strip() or not jd_text.strip():
         return 0.0
 
-    vect = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), min_df=1)
-    X = vect.fit_transform([resume_text, jd_text])
-    sim = cosine_similarity(X[0], X[1])[0][0]
-    return _safe_round(sim)
+    model = model if model is not None else get_similarity_model()
+    if model is None:
+        return _fit_pair_similarity(resume_text, jd_text)
+
+    X = model.transform([resume_text, jd_text])
+    return _cosine(X[0], X[1])
 
 
-def compute_skill_gap(resume_text: str, jd_text: str) -> Tuple[Set[str], Set[str], Set[str]]:
+def compute_document_similarity(
+    resume: ResumeDocument,
+    jd: JobDescription,
+    model: Optional[SimilarityModel] = None,
+) -> float:
+    """
+    Same as compute_text_similarity, reusing each document's memoized TF-IDF vector.
+    """
+    if not resume.text.strip() or not jd.text.strip():
+        return 0.0
+
+    model = model if model is not None else get_similarity_model()
+    if model is None:
+        return _fit_pair_similarity(resume.text, jd.text)
+
+    return _cosine(resume.tfidf_vector(model.vectorizer), jd.tfidf_vector(model.vectorizer))
+
+
+def compute_skill_gap(resume: ResumeInput, jd: JobInput) -> Tuple[Set[str], Set[str], Set[str]]:
     """
     Returns (resume_skills, jd_skills, missing_skills)
     missing = jd - resume
+    Documents reuse their memoized skills.
     """
-    resume_skills = extract_skills(resume_text)
-    jd_skills = extract_skills(jd_text)
+    resume_skills = set(_as_resume(resume).skills)
+    jd_skills = set(_as_jd(jd).skills)
     missing = jd_skills - resume_skills
     return resume_skills, jd_skills, missing
 
 
 def match_resume_to_jd(
-    resume_text: str,
-    jd_text: str,
+    resume: ResumeInput,
+    jd: JobInput,
     weight_similarity: float = 0.6,
     weight_skill: float = 0.4,
 ) -> MatchResult:
     """
     Combine TF-IDF similarity + skill coverage.
+    Accepts raw strings or ResumeDocument / JobDescription objects; with documents,
+    features already computed by earlier stages (e.g. resume skills) are reused.
     """
-    sim = compute_text_similarity(resume_text, jd_text)
+    resume_doc = _as_resume(resume)
+    jd_doc = _as_jd(jd)
+
+    sim = compute_document_similarity(resume_doc, jd_doc)
 
-    resume_skills, jd_skills, missing = compute_skill_gap(resume_text, jd_text)
+    # Skill sets as bitsets over the taxonomy: names only come back for the result
+    vocabulary = get_default_extractor().vocabulary
+    resume_skills = resume_doc.skill_mask(vocabulary)
+    jd_skills = jd_doc.skill_mask(vocabulary)
     matched = jd_skills & resume_skills
 
-    if jd_skills:
-        coverage = len(matched) / len(jd_skills)
+    jd_count = jd_skills.bit_count()
+    if jd_count:
+        coverage = matched.bit_count() / jd_count
     else:
         coverage = 0.0
 
     coverage = _safe_round(coverage)
 
-    # Normalize weights just in case
-    total_w = weight_similarity + weight_skill
-    if total_w <= 0:
-        weight_similarity, weight_skill = 0.6, 0.4
-        total_w = 1.0
-
-    w_sim = weight_similarity / total_w
-    w_skill = weight_skill / total_w
+    w_sim, w_skill = normalize_weights(weight_similarity, weight_skill)
 
     final = _safe_round((w_sim * sim) + (w_skill * coverage))
 
@@ -92,9 +167,8 @@ def match_resume_to_jd(
         similarity_score=sim,
         skill_coverage=coverage,
         final_score=final,
-        resume_skills=sorted(resume_skills),
-        jd_skills=sorted(jd_skills),
-        matched_skills=sorted(matched),
-        missing_skills=sorted(missing),
+        resume_skills=vocabulary.names_of(resume_skills),
+        jd_skills=vocabulary.names_of(jd_skills),
+        matched_skills=vocabulary.names_of(matched),
+        missing_skills=vocabulary.names_of(jd_skills & ~resume_skills),
     )
-
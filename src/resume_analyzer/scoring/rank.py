@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+from resume_analyzer.scoring.match import (
+    JobInput,
+    MatchResult,
+    ResumeInput,
+    _as_jd,
+    _as_resume,
+    _safe_round,
+    normalize_weights,
+)
+from resume_analyzer.scoring.similarity import SimilarityModel, get_similarity_model
+from resume_analyzer.skills.bitset import coverage_matrix
+from resume_analyzer.skills.extract import get_default_extractor
+from resume_analyzer.utils.topk import top_k_indices
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@dataclass(frozen=True)
+class RankedMatch:
+    index: int  # position of the resume in the input sequence
+    result: MatchResult
+
+
+def compute_text_similarities(
+    jd_text: str,
+    resume_texts: Sequence[str],
+    model: Optional[SimilarityModel] = None,
+) -> np.ndarray:
+    """
+    TF-IDF cosine similarity of one JD against many resumes, equal to
+    compute_text_similarity for every (resume, JD) pair.
+
+    With the pre-fitted similarity model, all texts are transformed at once
+    and every similarity comes out of a single sparse matrix-vector product.
+    Without one, see _pair_similarities: each pair keeps its own two-document
+    IDF, so a score never depends on which other resumes are in the batch.
+    """
+    import numpy as np
+
+    sims = np.zeros(len(resume_texts), dtype=float)
+    if not jd_text.strip() or not resume_texts:
+        return sims
+
+    nonempty = [i for i, t in enumerate(resume_texts) if t.strip()]
+    if not nonempty:
+        return sims
+
+    model = model if model is not None else get_similarity_model()
+    if model is None:
+        sims[nonempty] = _pair_similarities(jd_text, [resume_texts[i] for i in nonempty])
+        return np.clip(sims, 0.0, 1.0)
+
+    X = model.transform([jd_text] + [resume_texts[i] for i in nonempty])
+    sims[nonempty] = (X[1:] @ X[0].T).toarray().ravel()
+    return np.clip(sims, 0.0, 1.0)
+
+
+def _pair_similarities(jd_text: str, resume_texts: Sequence[str]) -> np.ndarray:
+    """
+    What fitting match's pair vectorizer on each (resume, JD) pair gives, from
+    one count matrix over the batch.
+
+    With two documents and smoothed IDF, a term has idf1 = ln(3/2) + 1 when it
+    occurs in one of them and idf2 = 1 when it occurs in both. The cosine is
+    then idf2² * <r, j> / (|r|_w |j|_w), where each weighted squared norm is
+    idf1² * (sum of all squared counts) + (idf2² - idf1²) * (sum over shared terms),
+    all of which are sparse products over raw counts.
+    """
+    import numpy as np
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    vect = CountVectorizer(stop_words="english", ngram_range=(1, 2), min_df=1)
+    try:
+        counts = vect.fit_transform([jd_text, *resume_texts]).astype(np.float64).tocsr()
+    except ValueError:
+        # Only stop words everywhere: empty vocabulary
+        return np.zeros(len(resume_texts))
+
+    jd, resumes = counts[0], counts[1:]
+    jd_sq, resumes_sq = jd.multiply(jd), resumes.multiply(resumes)
+    jd_has, resumes_has = (jd > 0).astype(np.float64), (resumes > 0).astype(np.float64)
+
+    idf1_sq, idf2_sq = (np.log(1.5) + 1.0) ** 2, 1.0
+    dot = (resumes @ jd.T).toarray().ravel()
+    jd_norm = idf1_sq * jd_sq.sum() + (idf2_sq - idf1_sq) * (resumes_has @ jd_sq.T).toarray().ravel()
+    resume_norm = (
+        idf1_sq * np.asarray(resumes_sq.sum(axis=1)).ravel()
+        + (idf2_sq - idf1_sq) * (resumes_sq @ jd_has.T).toarray().ravel()
+    )
+    denom = np.sqrt(jd_norm * resume_norm)
+    return np.divide(idf2_sq * dot, denom, out=np.zeros(len(resume_texts)), where=denom > 0)
+
+
+def rank_resumes(
+    jd: JobInput,
+    resumes: Sequence[ResumeInput],
+    top_k: int = 10,
+    weight_similarity: float = 0.6,
+    weight_skill: float = 0.4,
+) -> List[RankedMatch]:
+    """
+    Score one JD against many resumes and return the top-k, best first.
+
+    Same scoring as match_resume_to_jd, but similarities and coverages are
+    computed for the whole batch at once and MatchResult objects are only
+    built for the resumes that make the cut.
+    """
+    import numpy as np
+
+    jd_doc = _as_jd(jd)
+    docs = [_as_resume(r) for r in resumes]
+    if not docs:
+        return []
+
+    sims = compute_text_similarities(jd_doc.text, [d.text for d in docs])
+
+    vocabulary = get_default_extractor().vocabulary
+    jd_skills = jd_doc.skill_mask(vocabulary)
+    resume_skills = [d.skill_mask(vocabulary) for d in docs]
+    coverage = coverage_matrix(resume_skills, [jd_skills], vocabulary)[:, 0]
+
+    w_sim, w_skill = normalize_weights(weight_similarity, weight_skill)
+    final = np.clip(w_sim * sims + w_skill * coverage, 0.0, 1.0)
+
+    # Best first; ties keep input order, also at the top-k cut
+    top = top_k_indices(final, max(1, int(top_k))).tolist()
+
+    jd_names = vocabulary.names_of(jd_skills)
+    ranked: List[RankedMatch] = []
+    for i in top:
+        ranked.append(
+            RankedMatch(
+                index=i,
+                result=MatchResult(
+                    similarity_score=_safe_round(float(sims[i])),
+                    skill_coverage=_safe_round(float(coverage[i])),
+                    final_score=_safe_round(float(final[i])),
+                    resume_skills=vocabulary.names_of(resume_skills[i]),
+                    jd_skills=jd_names,
+                    matched_skills=vocabulary.names_of(jd_skills & resume_skills[i]),
+                    missing_skills=vocabulary.names_of(jd_skills & ~resume_skills[i]),
+                ),
+            )
+        )
+    return ranked
+
+
+def skill_coverage_matrix(resumes: Sequence[ResumeInput], jds: Sequence[JobInput]) -> np.ndarray:
+    """
+    len(resumes) x len(jds) skill coverage (the skill_coverage of every
+    match_resume_to_jd pair), from one matrix product over skill bitsets.
+    """
+    vocabulary = get_default_extractor().vocabulary
+    return coverage_matrix(
+        [_as_resume(r).skill_mask(vocabulary) for r in resumes],
+        [_as_jd(j).skill_mask(vocabulary) for j in jds],
+        vocabulary,
+    )
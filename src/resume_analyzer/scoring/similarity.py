@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Optional, Sequence
+
+from resume_analyzer.ml.registry import ModelRegistry
+
+
+DEFAULT_SIMILARITY_POINTER = Path("models/latest_similarity_model.txt")
+DEFAULT_SIMILARITY_PATH = Path("models/similarity_tfidf.joblib")
+
+# A corpus model only replaces the per-pair fit when its vocabulary is this large:
+# words it never saw weigh nothing, so a small (e.g. tech-only) corpus scores
+# every out-of-domain pair 0.
+MIN_VOCABULARY = 20_000
+
+log = logging.getLogger(__name__)
+
+
+class SimilarityModel:
+    """
+    TF-IDF vectorizer fitted offline on a reference corpus
+    (training/train_similarity_model.py). Request-time code only calls transform,
+    so IDF weights, and therefore scores, are the same for every request.
+    """
+
+    def __init__(self, model_path: str | Path):
+        self.model_path = Path(model_path)
+        if not self.model_path.exists():
+            raise FileNotFoundError(f"Similarity model not found: {self.model_path}")
+
+        import joblib  # pulls in sklearn when unpickling; keep it off the import path
+
+        self.vectorizer = joblib.load(self.model_path)
+
+    @property
+    def model_version(self) -> str:
+        return self.model_path.stem
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self.vectorizer.vocabulary_)
+
+    def transform(self, texts: Sequence[str]):
+        """
+        L2-normalized sparse rows: row dot products are cosine similarities.
+        """
+        return self.vectorizer.transform(list(texts))
+
+
+_similarity_registry: Optional[ModelRegistry] = None
+_rejected: set[str] = set()  # versions already warned about
+
+
+def get_similarity_model(
+    model_path: str | Path | None = None,
+    min_vocabulary: int = MIN_VOCABULARY,
+) -> Optional[SimilarityModel]:
+    """
+    Shared, hot-reloaded similarity model (or a specific artifact when a path is
+    given). Returns None when no artifact has been trained, or when the one the
+    pointer names has fewer than `min_vocabulary` terms; callers then fall back
+    to fitting TF-IDF per pair.
+    """
+    global _similarity_registry
+    if _similarity_registry is None:
+        _similarity_registry = ModelRegistry(
+            pointer_path=DEFAULT_SIMILARITY_POINTER,
+            fallback_path=DEFAULT_SIMILARITY_PATH,
+            loader=SimilarityModel,
+        )
+
+    if model_path is not None:
+        return _similarity_registry.load(model_path)
+    try:
+        model = _similarity_registry.get()
+    except FileNotFoundError:
+        return None
+    if model.vocabulary_size < min_vocabulary:
+        if model.model_version not in _rejected:
+            _rejected.add(model.model_version)
+            log.warning(
+                "Ignoring similarity model %s: %d terms, need %d; using per-pair TF-IDF",
+                model.model_path, model.vocabulary_size, min_vocabulary,
+            )
+        return None
+    return model
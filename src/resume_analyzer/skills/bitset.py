@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class SkillVocabulary:
+    """
+    Dense integer ids for a taxonomy's canonical skills, so a skill set is a
+    bitset: a Python int with bit i set when names[i] is present.
+
+    Ids follow sorted name order, so names_of() returns names already sorted
+    and intersection / difference / counting are single int operations
+    (&, & ~, bit_count). to_matrix() turns many bitsets into one numpy bool
+    matrix for bulk work (see coverage_matrix).
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names: Tuple[str, ...] = tuple(sorted(set(names)))
+        self.ids: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self._bits: Dict[str, int] = {name: 1 << i for i, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Width of one bitset in bytes.
+        """
+        return (len(self.names) + 7) // 8
+
+    def mask(self, skills: Iterable[str]) -> int:
+        """
+        Bitset of the given canonical names; names outside the vocabulary are ignored.
+        """
+        bits = self._bits
+        mask = 0
+        for name in skills:
+            mask |= bits.get(name, 0)
+        return mask
+
+    def names_of(self, mask: int) -> List[str]:
+        """
+        Canonical names of the set bits, in sorted order.
+        """
+        names = self.names
+        out: List[str] = []
+        while mask:
+            low = mask & -mask
+            out.append(names[low.bit_length() - 1])
+            mask ^= low
+        return out
+
+    def to_matrix(self, masks: Sequence[int]) -> "np.ndarray":
+        """
+        len(masks) x len(self) bool matrix, one row per bitset.
+        """
+        import numpy as np
+
+        width = self.nbytes
+        packed = np.frombuffer(b"".join(m.to_bytes(width, "little") for m in masks), dtype=np.uint8)
+        bits = np.unpackbits(packed.reshape(len(masks), width), axis=1, bitorder="little")
+        return bits[:, : len(self.names)].astype(bool)
+
+
+def coverage_matrix(resume_masks: Sequence[int], jd_masks: Sequence[int], vocabulary: SkillVocabulary) -> "np.ndarray":
+    """
+    N resumes x M JDs skill coverage: |resume & jd| / |jd| (0 for a JD without
+    skills), the matched counts of every pair coming from one matrix product.
+    """
+    import numpy as np
+
+    resumes = vocabulary.to_matrix(resume_masks).astype(np.float32)
+    jds = vocabulary.to_matrix(jd_masks).astype(np.float32)
+    matched = (resumes @ jds.T).astype(np.float64)  # exact: counts stay far below float32's 2**24
+    sizes = jds.sum(axis=1, dtype=np.float64)
+    return np.divide(matched, sizes, out=np.zeros_like(matched), where=sizes > 0)
@@ -1,51 +1,127 @@
 from __future__ import annotations
 
-import re
+import hashlib
+import logging
+import marshal
+import os
 from pathlib import Path
-from typing import Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .bitset import SkillVocabulary
+from .matcher import AliasMatcher, SkillMatch
+from .taxonomy import SkillsTaxonomy, parse_taxonomy
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = "data/skills_taxonomy.json"
+
+COMPILED_FORMAT = "alias-matcher/1"
+COMPILED_SUFFIX = ".matcher"  # skills_taxonomy.json -> skills_taxonomy.json.matcher
+
+
+def compiled_cache_path(taxonomy_path: str | Path) -> Path:
+    p = Path(taxonomy_path)
+    return p.with_name(p.name + COMPILED_SUFFIX)
+
+
+def _load_compiled(path: Path, digest: str) -> Optional[Tuple[SkillsTaxonomy, AliasMatcher]]:
+    """
+    Taxonomy and matcher from the compiled cache, or None when it is missing,
+    unreadable or was built from other taxonomy contents.
+    """
+    try:
+        data = marshal.loads(path.read_bytes())
+        if data.get("format") != COMPILED_FORMAT or data.get("sha256") != digest:
+            return None
+        taxonomy = SkillsTaxonomy(
+            canonical_to_aliases=data["canonical_to_aliases"],
+            alias_to_canonical=data["alias_to_canonical"],
+        )
+        return taxonomy, AliasMatcher.from_state(data["matcher"])
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # truncated / foreign / other Python version: just rebuild
+        log.warning("Ignoring compiled taxonomy cache %s: %s", path, e)
+        return None
+
+
+def _save_compiled(path: Path, digest: str, taxonomy: SkillsTaxonomy, matcher: AliasMatcher) -> None:
+    data = {
+        "format": COMPILED_FORMAT,
+        "sha256": digest,
+        "canonical_to_aliases": taxonomy.canonical_to_aliases,
+        "alias_to_canonical": taxonomy.alias_to_canonical,
+        "matcher": matcher.to_state(),
+    }
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(marshal.dumps(data))
+        os.replace(tmp, path)  # readers never see a half-written file
+    except OSError as e:  # read-only data dir: work without the cache
+        log.info("Could not write compiled taxonomy cache %s: %s", path, e)
+        tmp.unlink(missing_ok=True)
 
-from .taxonomy import SkillsTaxonomy, load_taxonomy
 
+class SkillsExtractor:
+    """
+    Skill matcher for one taxonomy file.
+
+    With cache=True the compiled alias automaton is read from (or written to)
+    compiled_cache_path(taxonomy_path), so only the first process to see a
+    given taxonomy pays for compiling it. The cache is keyed by the SHA-256 of
+    the taxonomy contents; a stale or unreadable one is simply rebuilt.
+    """
+
+    def __init__(self, taxonomy_path: str | Path, cache: bool = False):
+        self.path = Path(taxonomy_path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Skills taxonomy not found: {self.path}")
+        raw = self.path.read_bytes()
+        self.sha256 = digest = hashlib.sha256(raw).hexdigest()
+        # Content hash of the taxonomy file: identifies which taxonomy produced a skill set
+        self.fingerprint = digest[:16]
+
+        compiled = _load_compiled(compiled_cache_path(self.path), digest) if cache else None
+        self.from_cache = compiled is not None
+        if compiled is not None:
+            self.taxonomy, self.matcher = compiled
+        else:
+            self.taxonomy = parse_taxonomy(raw)
+            # One automaton over all aliases: a single pass over the text per call
+            self.matcher = AliasMatcher(self.taxonomy.alias_to_canonical)
+            if cache:
+                _save_compiled(compiled_cache_path(self.path), digest, self.taxonomy, self.matcher)
+        # Dense ids of the canonical skills, for bitset skill sets
+        self.vocabulary = SkillVocabulary(self.taxonomy.canonical_to_aliases)
 
-_WORD_BOUNDARY = r"(?<![A-Za-z0-9]){alias}(?![A-Za-z0-9])"
-
-
-def _compile_patterns(tax: SkillsTaxonomy) -> list[tuple[re.Pattern, str]]:
-    patterns: list[tuple[re.Pattern, str]] = []
-
-    for alias, canonical in tax.alias_to_canonical.items():
-        # Escape alias for regex, keep dots etc literal
-        esc = re.escape(alias)
-        pattern = re.compile(_WORD_BOUNDARY.format(alias=esc), re.IGNORECASE)
-        patterns.append((pattern, canonical))
-
-    # Prefer longer aliases first (e.g., "spring boot" before "boot")
-    patterns.sort(key=lambda x: len(x[0].pattern), reverse=True)
-    return patterns
+    def extract(self, text: str) -> Set[str]:
+        return self.matcher.extract(text)
 
+    def extract_stream(self, chunks: Iterable[str]) -> Set[str]:
+        """
+        Skills from streamed text chunks (e.g. PDF pages) without joining them.
+        """
+        return self.matcher.extract_stream(chunks)
 
-class SkillsExtractor:
-    def __init__(self, taxonomy_path: str | Path):
-        self.taxonomy = load_taxonomy(taxonomy_path)
-        self.patterns = _compile_patterns(self.taxonomy)
+    def extract_matches(self, text: str, overlapping: bool = False) -> List[SkillMatch]:
+        """
+        Skill occurrences with character offsets (longest alias wins on overlap).
+        """
+        return self.matcher.find_all(text, overlapping=overlapping)
 
-    def extract(self, text: str) -> Set[str]:
-        if not text:
-            return set()
+    def count(self, text: str) -> Dict[str, int]:
+        return self.matcher.count(text)
 
-        found: Set[str] = set()
-        for pat, canonical in self.patterns:
-            if pat.search(text):
-                found.add(canonical)
-        return found
 
+def get_default_extractor(taxonomy_path: str | Path = DEFAULT_TAXONOMY_PATH) -> SkillsExtractor:
+    """
+    Shared extractor for a taxonomy file, reloaded when the file changes.
+    """
+    from .registry import get_taxonomy_registry
 
-# Convenience function (simple usage)
-_default_extractor: Optional[SkillsExtractor] = None
+    return get_taxonomy_registry().get(taxonomy_path)
 
 
-def extract_skills(text: str, taxonomy_path: str | Path = "data/skills_taxonomy.json") -> Set[str]:
-    global _default_extractor
-    if _default_extractor is None:
-        _default_extractor = SkillsExtractor(taxonomy_path)
-    return _default_extractor.extract(text)
+def extract_skills(text: str, taxonomy_path: str | Path = DEFAULT_TAXONOMY_PATH) -> Set[str]:
+    return get_default_extractor(taxonomy_path).extract(text)
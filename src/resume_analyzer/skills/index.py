@@ -0,0 +1,493 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+INDEX_FORMAT = "skill-index/1"
+
+# npz members, all plain (non-object) arrays: loading needs numpy only, never pickle
+_ARRAYS = ("names", "doc_freq", "posting_offsets", "postings", "key_offsets", "keys", "meta")
+
+
+# -------------------------------------------------------------------
+# Posting lists: sorted doc ids -> delta gaps -> variable-byte codes
+# -------------------------------------------------------------------
+
+def encode_postings(ids: "np.ndarray") -> "np.ndarray":
+    """
+    VByte-encode sorted, distinct doc ids as uint8: each gap to the previous id
+    is written 7 bits per byte, low group first, with the high bit set on the
+    last byte of a gap. Dense lists cost about one byte per posting.
+    """
+    import numpy as np
+
+    ids = np.asarray(ids, dtype=np.int64)
+    if ids.size == 0:
+        return np.zeros(0, dtype=np.uint8)
+    gaps = np.diff(ids, prepend=0).astype(np.uint64)
+    widths = np.ones(gaps.size, dtype=np.int64)
+    for shift in range(7, 64, 7):
+        widths += gaps >= np.uint64(1 << shift)
+    ends = np.cumsum(widths)
+    value = np.repeat(np.arange(gaps.size), widths)
+    group = np.arange(int(ends[-1])) - np.repeat(ends - widths, widths)
+    out = ((gaps[value] >> (group * 7).astype(np.uint64)) & np.uint64(0x7F)).astype(np.uint8)
+    out[ends - 1] |= 0x80
+    return out
+
+
+def decode_postings(data: "np.ndarray") -> "np.ndarray":
+    """
+    Inverse of encode_postings: the doc ids as int64.
+    """
+    import numpy as np
+
+    data = np.asarray(data, dtype=np.uint8)
+    ends = np.flatnonzero(data & 0x80)
+    if ends.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    group = np.arange(data.size) - np.repeat(starts, ends - starts + 1)
+    groups = (data & 0x7F).astype(np.uint64) << (group * 7).astype(np.uint64)
+    return np.cumsum(np.add.reduceat(groups, starts)).astype(np.int64)
+
+
+# -------------------------------------------------------------------
+# Boolean queries: "python AND (kafka OR spark) AND NOT java"
+# -------------------------------------------------------------------
+
+# Parentheses, "quoted skill names" and bare words; adjacent bare words form one skill ("machine learning")
+_TOKEN_RE = re.compile(r'\s*(?:(?P<paren>[()])|"(?P<quoted>[^"]*)"|(?P<word>[^\s()"]+))')
+_OPERATORS = {"AND", "OR", "NOT"}
+
+# ("skill", name) | ("not", node) | ("and", [nodes]) | ("or", [nodes])
+QueryNode = Tuple[str, object]
+
+
+def _tokenize(query: str) -> List[Tuple[str, str]]:
+    tokens: List[Tuple[str, str]] = []
+    pos = 0
+    query = query.rstrip()
+    while pos < len(query):
+        m = _TOKEN_RE.match(query, pos)
+        if m is None:  # only a lone '"' fails to match
+            raise ValueError("Unbalanced quote in query")
+        pos = m.end()
+        if m.group("paren"):
+            tokens.append((m.group("paren"), m.group("paren")))
+        elif m.group("quoted") is not None:
+            tokens.append(("term", m.group("quoted")))
+        elif m.group("word").upper() in _OPERATORS:
+            tokens.append((m.group("word").upper(), m.group("word")))
+        elif tokens and tokens[-1][0] == "word":
+            tokens[-1] = ("word", f"{tokens[-1][1]} {m.group('word')}")
+        else:
+            tokens.append(("word", m.group("word")))
+    return [("term", text) if kind == "word" else (kind, text) for kind, text in tokens]
+
+
+def parse_query(query: str, resolve: Callable[[str], str]) -> QueryNode:
+    """
+    Parse a boolean skill query into a tree. NOT binds tighter than AND, AND
+    tighter than OR; operators are case-insensitive. resolve(term) maps a
+    query term to a canonical skill name (or raises ValueError).
+    """
+    tokens = _tokenize(query or "")
+    if not tokens:
+        raise ValueError("Empty query")
+    pos = 0
+
+    def peek() -> Optional[str]:
+        return tokens[pos][0] if pos < len(tokens) else None
+
+    def expect_operand() -> None:
+        if peek() in (None, ")", "AND", "OR"):
+            got = "end of query" if peek() is None else repr(tokens[pos][1])
+            raise ValueError(f"Expected a skill, got {got}")
+
+    def parse_or() -> QueryNode:
+        nonlocal pos
+        nodes = [parse_and()]
+        while peek() == "OR":
+            pos += 1
+            nodes.append(parse_and())
+        return nodes[0] if len(nodes) == 1 else ("or", nodes)
+
+    def parse_and() -> QueryNode:
+        nonlocal pos
+        nodes = [parse_not()]
+        while peek() == "AND":
+            pos += 1
+            nodes.append(parse_not())
+        return nodes[0] if len(nodes) == 1 else ("and", nodes)
+
+    def parse_not() -> QueryNode:
+        nonlocal pos
+        expect_operand()
+        kind, text = tokens[pos]
+        pos += 1
+        if kind == "NOT":
+            return ("not", parse_not())
+        if kind == "(":
+            node = parse_or()
+            if peek() != ")":
+                raise ValueError("Missing closing parenthesis")
+            pos += 1
+            return node
+        return ("skill", resolve(text))
+
+    node = parse_or()
+    if pos < len(tokens):
+        raise ValueError(f"Unexpected {tokens[pos][1]!r}; join terms with AND / OR")
+    return node
+
+
+def positive_skills(node: QueryNode, negated: bool = False) -> List[str]:
+    """
+    Skills the query asks for (not under an odd number of NOTs), in query order.
+    """
+    kind, arg = node
+    if kind == "skill":
+        return [] if negated else [arg]  # type: ignore[list-item]
+    if kind == "not":
+        return positive_skills(arg, not negated)  # type: ignore[arg-type]
+    out: List[str] = []
+    for child in arg:  # type: ignore[union-attr]
+        out.extend(s for s in positive_skills(child, negated) if s not in out)
+    return out
+
+
+# -------------------------------------------------------------------
+# Index
+# -------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class SearchHit:
+    doc_id: int
+    key: str  # what the document was indexed under, e.g. the resume path
+    score: float  # share of the query's (non-negated) skills the document has
+    matched_skills: List[str]
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    total: int
+    skills: List[str]  # the query's non-negated skills: what score is measured against
+    hits: List[SearchHit]
+
+
+class SkillIndex:
+    """
+    Inverted index over a resume corpus: canonical skill -> ids of the
+    documents that have it.
+
+    Documents get dense ids in the order they were added. Each posting list is
+    stored VByte-encoded (see encode_postings) and decoded on first use into a
+    packed bitmap of n_docs bits, so a boolean query is a few bytewise
+    AND / OR / NOT passes over n_docs / 8 bytes regardless of how common its
+    skills are. Only the matching page of results is materialized.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        doc_freq: "np.ndarray",
+        posting_offsets: "np.ndarray",
+        postings: "np.ndarray",
+        key_offsets: "np.ndarray",
+        keys: "np.ndarray",
+        meta: Dict,
+    ):
+        self.names: Tuple[str, ...] = tuple(names)
+        self.ids: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.doc_freq = doc_freq
+        self.n_docs: int = int(meta["n_docs"])
+        self.taxonomy: Optional[str] = meta.get("taxonomy")  # fingerprint of the taxonomy used, if known
+        self.created_at: float = float(meta.get("created_at") or 0.0)
+        self._posting_offsets = posting_offsets
+        self._postings = postings
+        self._key_offsets = key_offsets
+        self._keys = keys
+        self._bitmaps: Dict[str, "np.ndarray"] = {}
+        self._everything: Optional["np.ndarray"] = None
+
+    def __len__(self) -> int:
+        return self.n_docs
+
+    @classmethod
+    def build(
+        cls,
+        docs: Iterable[Tuple[str, Iterable[str]]],
+        taxonomy: Optional[str] = None,
+    ) -> "SkillIndex":
+        """
+        Index (key, canonical skills) pairs; keys are returned with search hits.
+        """
+        keys: List[str] = []
+        lists: Dict[str, List[int]] = {}
+        for doc_id, (key, skills) in enumerate(docs):
+            keys.append(str(key))
+            for name in set(skills):
+                lists.setdefault(name, []).append(doc_id)
+        return cls.from_postings(keys, lists, taxonomy=taxonomy)
+
+    @classmethod
+    def from_postings(
+        cls,
+        keys: Sequence[str],
+        postings: Mapping[str, Union[Sequence[int], "np.ndarray"]],
+        taxonomy: Optional[str] = None,
+    ) -> "SkillIndex":
+        """
+        Index from ready posting lists: skill -> ascending ids into keys.
+        """
+        import numpy as np
+
+        names = sorted(postings)
+        ids = [np.asarray(postings[n], dtype=np.int64) for n in names]
+        if any(a.size and (a[0] < 0 or a[-1] >= len(keys) or (np.diff(a) <= 0).any()) for a in ids):
+            raise ValueError("Posting lists must be ascending, distinct ids below len(keys)")
+        encoded = [encode_postings(a) for a in ids]
+        raw_keys = [k.encode("utf-8") for k in keys]
+        meta = {"format": INDEX_FORMAT, "n_docs": len(keys), "taxonomy": taxonomy, "created_at": time.time()}
+        return cls(
+            names=names,
+            doc_freq=np.array([a.size for a in ids], dtype=np.int64),
+            posting_offsets=np.cumsum([0] + [e.size for e in encoded], dtype=np.int64),
+            postings=np.concatenate(encoded) if encoded else np.zeros(0, dtype=np.uint8),
+            key_offsets=np.cumsum([0] + [len(k) for k in raw_keys], dtype=np.int64),
+            keys=np.frombuffer(b"".join(raw_keys), dtype=np.uint8),
+            meta=meta,
+        )
+
+    # ---------------------------------------------------------------
+    # Persistence
+    # ---------------------------------------------------------------
+
+    def save(self, path: str | Path) -> Path:
+        """
+        Write the index as an uncompressed npz (postings are already compact).
+        The file is replaced atomically, so a serving process never reads a half-written index.
+        """
+        import numpy as np
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {"format": INDEX_FORMAT, "n_docs": self.n_docs, "taxonomy": self.taxonomy, "created_at": self.created_at}
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as fh:
+                np.savez(
+                    fh,
+                    names=np.array(self.names, dtype=str),
+                    doc_freq=self.doc_freq,
+                    posting_offsets=self._posting_offsets,
+                    postings=self._postings,
+                    key_offsets=self._key_offsets,
+                    keys=self._keys,
+                    meta=np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+                )
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SkillIndex":
+        import numpy as np
+
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Skill index not found: {path}")
+        with np.load(path, allow_pickle=False) as npz:
+            missing = [a for a in _ARRAYS if a not in npz.files]
+            if missing:
+                raise ValueError(f"Not a skill index (missing {', '.join(missing)}): {path}")
+            arrays = {a: npz[a] for a in _ARRAYS}
+        meta = json.loads(arrays.pop("meta").tobytes().decode("utf-8"))
+        if meta.get("format") != INDEX_FORMAT:
+            raise ValueError(f"Unsupported skill index format {meta.get('format')!r}: {path}")
+        return cls(names=[str(n) for n in arrays.pop("names")], meta=meta, **arrays)
+
+    # ---------------------------------------------------------------
+    # Lookups
+    # ---------------------------------------------------------------
+
+    def key(self, doc_id: int) -> str:
+        start, end = self._key_offsets[doc_id], self._key_offsets[doc_id + 1]
+        return self._keys[start:end].tobytes().decode("utf-8")
+
+    def doc_ids(self, skill: str) -> "np.ndarray":
+        """
+        Sorted ids of the documents with a canonical skill (empty when unknown).
+        """
+        import numpy as np
+
+        i = self.ids.get(skill)
+        if i is None:
+            return np.zeros(0, dtype=np.int64)
+        return decode_postings(self._postings[self._posting_offsets[i] : self._posting_offsets[i + 1]])
+
+    def _bitmap(self, skill: str) -> "np.ndarray":
+        import numpy as np
+
+        bitmap = self._bitmaps.get(skill)
+        if bitmap is None:
+            bits = np.zeros(self.n_docs, dtype=bool)
+            bits[self.doc_ids(skill)] = True
+            bitmap = self._bitmaps[skill] = np.packbits(bits, bitorder="little")
+        return bitmap
+
+    def _all(self) -> "np.ndarray":
+        """
+        Bitmap of every document (padding bits of the last byte clear).
+        """
+        if self._everything is None:
+            self._everything = _packed_range(self.n_docs)
+        return self._everything
+
+    def _evaluate(self, node: QueryNode) -> "np.ndarray":
+        import numpy as np
+
+        kind, arg = node
+        if kind == "skill":
+            return self._bitmap(arg)  # type: ignore[arg-type]
+        if kind == "not":
+            return np.bitwise_and(np.invert(self._evaluate(arg)), self._all())  # type: ignore[arg-type]
+        children = list(arg)  # type: ignore[call-overload]
+        if kind == "and":
+            # Rarest skills first: the running result can only shrink
+            children.sort(key=lambda c: self._doc_freq_of(c))
+            op = np.bitwise_and
+        else:
+            op = np.bitwise_or
+        out = self._evaluate(children[0]).copy()
+        for child in children[1:]:
+            op(out, self._evaluate(child), out=out)
+        return out
+
+    def _doc_freq_of(self, node: QueryNode) -> int:
+        if node[0] == "skill":
+            i = self.ids.get(node[1])  # type: ignore[arg-type]
+            return 0 if i is None else int(self.doc_freq[i])
+        return self.n_docs
+
+    def resolver(self, aliases: Optional[Mapping[str, str]] = None) -> Callable[[str], str]:
+        """
+        Query term -> canonical skill: an indexed name as-is, else through the
+        taxonomy's alias map (the default taxonomy when none is given).
+        """
+        def resolve(term: str) -> str:
+            norm = " ".join(term.lower().split())
+            if norm in self.ids:
+                return norm
+            nonlocal aliases
+            if aliases is None:
+                from .extract import get_default_extractor
+
+                aliases = get_default_extractor().taxonomy.alias_to_canonical
+            canonical = aliases.get(norm)
+            if canonical is None:
+                raise ValueError(f"Unknown skill: {term!r}")
+            return canonical
+
+        return resolve
+
+    def search(
+        self,
+        query: Union[str, QueryNode],
+        limit: int = 20,
+        offset: int = 0,
+        aliases: Optional[Mapping[str, str]] = None,
+    ) -> SearchResult:
+        """
+        Documents matching a boolean skill query, best first: by the share of
+        the query's (non-negated) skills they have, then in index order.
+        Raises ValueError for a malformed query or an unknown skill.
+        """
+        import numpy as np
+
+        node = parse_query(query, self.resolver(aliases)) if isinstance(query, str) else query
+        wanted = positive_skills(node)
+        ids = _set_bits(self._evaluate(node))
+
+        matched = np.zeros(ids.size, dtype=np.int16)
+        byte, bit = ids >> 3, (ids & 7).astype(np.uint8)
+        for skill in wanted:
+            matched += (self._bitmap(skill)[byte] >> bit) & 1
+        # Stable sort keeps index order within a score; small ints sort in linear time
+        page = np.argsort(-matched, kind="stable")[offset : offset + max(0, limit)]
+
+        hits: List[SearchHit] = []
+        for i in page:
+            doc_id = int(ids[i])
+            have = [s for s in wanted if (self._bitmap(s)[doc_id >> 3] >> (doc_id & 7)) & 1]
+            hits.append(
+                SearchHit(
+                    doc_id=doc_id,
+                    key=self.key(doc_id),
+                    score=len(have) / len(wanted) if wanted else 1.0,
+                    matched_skills=sorted(have),
+                )
+            )
+        return SearchResult(total=int(ids.size), skills=sorted(wanted), hits=hits)
+
+
+def _packed_range(n: int) -> "np.ndarray":
+    import numpy as np
+
+    bitmap = np.full((n + 7) // 8, 0xFF, dtype=np.uint8)
+    if n % 8:
+        bitmap[-1] = (1 << (n % 8)) - 1
+    return bitmap
+
+
+def _set_bits(bitmap: "np.ndarray") -> "np.ndarray":
+    """
+    Positions of the set bits of a packed (little bit order) bitmap, ascending.
+    Only the non-zero bytes are unpacked, so sparse results stay cheap.
+    """
+    import numpy as np
+
+    nz = np.flatnonzero(bitmap)
+    bits = np.unpackbits(bitmap[nz][:, None], axis=1, bitorder="little").astype(bool)
+    return (nz[:, None] * 8 + np.arange(8))[bits]
+
+
+# -------------------------------------------------------------------
+# Shared, reloading instance (API)
+# -------------------------------------------------------------------
+
+_lock = threading.Lock()
+_loaded: Dict[Path, Tuple[Tuple[int, int], SkillIndex]] = {}
+
+
+def get_skill_index(path: str | Path) -> SkillIndex:
+    """
+    Process-wide SkillIndex for a file, reloaded when the file is replaced
+    (mtime or size changed). Raises FileNotFoundError when it does not exist.
+    """
+    path = Path(path)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Skill index not found: {path}")
+    stat = (st.st_mtime_ns, st.st_size)
+    cached = _loaded.get(path)
+    if cached is not None and cached[0] == stat:
+        return cached[1]
+    with _lock:
+        cached = _loaded.get(path)
+        if cached is None or cached[0] != stat:
+            cached = _loaded[path] = (stat, SkillIndex.load(path))
+        return cached[1]
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Set, Tuple
+
+
+# Same boundary rule as the old per-alias regex: (?<![A-Za-z0-9]) alias (?![A-Za-z0-9])
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+
+
+@dataclass(frozen=True)
+class SkillMatch:
+    canonical: str
+    alias: str
+    start: int
+    end: int  # exclusive
+
+
+def _fold(text: str) -> str:
+    """
+    Lowercase while keeping offsets aligned with the original text.
+    A few characters change length when lowercased (e.g. "İ"); keep those as-is.
+    """
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return "".join(low if len(low) == 1 else ch for ch, low in ((c, c.lower()) for c in text))
+
+
+class AliasMatcher:
+    """
+    Aho-Corasick automaton over case-folded aliases.
+
+    The text is scanned once regardless of how many aliases the taxonomy has;
+    each hit is then checked against the word-boundary rule.
+    """
+
+    def __init__(self, alias_to_canonical: Mapping[str, str]):
+        self.aliases: List[str] = []
+        self.canonicals: List[str] = []
+        self.max_alias_len = 0
+
+        # Trie: state -> {char: next_state}; state 0 is the root
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+
+        for alias, canonical in alias_to_canonical.items():
+            key = _fold(alias)
+            if not key:
+                continue
+            self._add(key, len(self.aliases))
+            self.aliases.append(key)
+            self.canonicals.append(canonical)
+            self.max_alias_len = max(self.max_alias_len, len(key))
+
+        self._build_links()
+
+    def __len__(self) -> int:
+        return len(self.aliases)
+
+    def to_state(self) -> Tuple[Any, ...]:
+        """
+        The compiled automaton as plain lists, dicts, tuples and strings
+        (marshal / JSON friendly); from_state rebuilds it without recompiling.
+        """
+        return (self.aliases, self.canonicals, self.max_alias_len, self._goto, self._fail, self._out)
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "AliasMatcher":
+        aliases, canonicals, max_alias_len, goto, fail, out = state
+        if not (len(aliases) == len(canonicals) and len(goto) == len(fail) == len(out)):
+            raise ValueError("Inconsistent alias matcher state")
+        matcher = cls.__new__(cls)
+        matcher.aliases, matcher.canonicals, matcher.max_alias_len = list(aliases), list(canonicals), int(max_alias_len)
+        matcher._goto, matcher._fail, matcher._out = list(goto), list(fail), [tuple(o) for o in out]
+        return matcher
+
+    def _add(self, key: str, alias_id: int) -> None:
+        state = 0
+        for ch in key:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][ch] = nxt
+            state = nxt
+        self._out[state] = self._out[state] + (alias_id,)
+
+    def _build_links(self) -> None:
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                link = goto[f].get(ch, 0)
+                fail[nxt] = link if link != nxt else 0
+                # Merge outputs along the suffix link so the scan never walks the chain
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+
+    def _scan(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yield (alias_id, start, end) for every alias occurrence respecting word boundaries.
+        """
+        folded = _fold(text)
+        n = len(folded)
+        goto, fail, out = self._goto, self._fail, self._out
+        aliases = self.aliases
+
+        state = 0
+        for i, ch in enumerate(folded):
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt or 0
+
+            hits = out[state]
+            if not hits:
+                continue
+
+            end = i + 1
+            if end < n and folded[end] in _WORD_CHARS:
+                continue
+            for alias_id in hits:
+                start = end - len(aliases[alias_id])
+                if start > 0 and folded[start - 1] in _WORD_CHARS:
+                    continue
+                yield alias_id, start, end
+
+    def extract(self, text: str) -> Set[str]:
+        """
+        Canonical skills with at least one alias occurrence anywhere in the text.
+        """
+        if not text:
+            return set()
+        canonicals = self.canonicals
+        return {canonicals[alias_id] for alias_id, _, _ in self._scan(text)}
+
+    def extract_stream(self, chunks: Iterable[str]) -> Set[str]:
+        """
+        Same result as extract("".join(chunks)), without ever joining the chunks.
+
+        Automaton state carries across chunk boundaries; only the last
+        max_alias_len + 1 characters are kept for the start-boundary check, and a
+        hit ending exactly at a chunk boundary waits for the next chunk's first
+        character before its end boundary is decided.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        aliases, canonicals = self.aliases, self.canonicals
+        keep = self.max_alias_len + 1
+
+        found: Set[str] = set()
+        pending: List[int] = []  # alias ids whose end-boundary check needs the next char
+        tail = ""
+        state = 0
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+            folded = _fold(chunk)
+            if pending:
+                if folded[0] not in _WORD_CHARS:
+                    found.update(canonicals[a] for a in pending)
+                pending = []
+
+            window = tail + folded
+            base = len(tail)
+            n = len(window)
+            for i in range(base, n):
+                ch = window[i]
+                nxt = goto[state].get(ch)
+                while nxt is None and state:
+                    state = fail[state]
+                    nxt = goto[state].get(ch)
+                state = nxt or 0
+
+                hits = out[state]
+                if not hits:
+                    continue
+
+                end = i + 1
+                at_chunk_end = end == n
+                if not at_chunk_end and window[end] in _WORD_CHARS:
+                    continue
+                for alias_id in hits:
+                    start = end - len(aliases[alias_id])
+                    if start > 0 and window[start - 1] in _WORD_CHARS:
+                        continue
+                    if at_chunk_end:
+                        pending.append(alias_id)
+                    else:
+                        found.add(canonicals[alias_id])
+
+            tail = window[-keep:]
+
+        # End of stream counts as a boundary
+        found.update(canonicals[a] for a in pending)
+        return found
+
+    def find_all(self, text: str, overlapping: bool = False) -> List[SkillMatch]:
+        """
+        Alias occurrences with offsets, ordered by position.
+
+        With overlapping=False, overlaps are resolved leftmost-longest, so
+        "spring boot" wins over "boot" inside the same span.
+        """
+        if not text:
+            return []
+
+        hits = sorted(self._scan(text), key=lambda h: (h[1], -(h[2] - h[1])))
+        matches: List[SkillMatch] = []
+        last_end = -1
+        for alias_id, start, end in hits:
+            if not overlapping and start < last_end:
+                continue
+            matches.append(SkillMatch(self.canonicals[alias_id], self.aliases[alias_id], start, end))
+            last_end = max(last_end, end)
+        return matches
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Non-overlapping occurrence counts per canonical skill.
+        """
+        counts: Dict[str, int] = {}
+        for m in self.find_all(text):
+            counts[m.canonical] = counts.get(m.canonical, 0) + 1
+        return counts
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from .extract import DEFAULT_TAXONOMY_PATH, SkillsExtractor
+
+
+log = logging.getLogger(__name__)
+
+# (resolved taxonomy path, SHA-256 of its contents) -> identifies one compiled taxonomy
+_TaxonomyKey = Tuple[Path, str]
+
+
+@dataclass
+class _Current:
+    extractor: SkillsExtractor
+    key: _TaxonomyKey
+    stat: Tuple[int, int]  # (mtime_ns, size) when last checked
+    checked_at: float
+
+
+class TaxonomyRegistry:
+    """
+    Process-wide cache of SkillsExtractor objects, one current extractor per
+    taxonomy path.
+
+    - Compiled extractors are kept in an LRU keyed by (path, content hash), at
+      most `max_items` of them; switching back to a recent taxonomy is free.
+    - Each path's file is re-checked at most every `check_interval` seconds
+      (stat first, hash only when mtime or size moved). A changed taxonomy is
+      compiled and swapped in atomically: callers already holding the previous
+      extractor keep using it, and callers that arrive while a reload is in
+      progress are served the current one instead of waiting. A taxonomy that
+      fails to load is logged and the previous one stays in service.
+    """
+
+    def __init__(
+        self,
+        max_items: int = 4,
+        check_interval: float = 2.0,
+        cache: bool = True,
+        loader: Optional[Callable[[Path], SkillsExtractor]] = None,
+    ):
+        self.max_items = max(1, int(max_items))
+        self.check_interval = float(check_interval)
+        self.loader = loader or (lambda path: SkillsExtractor(path, cache=cache))
+
+        self._lock = threading.Lock()
+        self._extractors: "OrderedDict[_TaxonomyKey, SkillsExtractor]" = OrderedDict()
+        self._current: Dict[Path, _Current] = {}
+
+    def get(self, taxonomy_path: str | Path = DEFAULT_TAXONOMY_PATH) -> SkillsExtractor:
+        """
+        Return the extractor for the taxonomy file's current contents.
+        """
+        path = Path(taxonomy_path)
+        current = self._current.get(path)
+        if current is not None and time.monotonic() - current.checked_at < self.check_interval:
+            return current.extractor
+
+        # Only one caller reloads; everyone else keeps being served the current extractor.
+        if not self._lock.acquire(blocking=current is None):
+            return current.extractor  # type: ignore[union-attr]
+        try:
+            return self._refresh_locked(path)
+        finally:
+            self._lock.release()
+
+    def _refresh_locked(self, path: Path) -> SkillsExtractor:
+        current = self._current.get(path)
+        now = time.monotonic()
+        try:
+            st = path.stat()
+            stat = (st.st_mtime_ns, st.st_size)
+            if current is not None and stat == current.stat:
+                current.checked_at = now
+                return current.extractor
+            resolved = path.resolve()
+            key = (resolved, hashlib.sha256(resolved.read_bytes()).hexdigest())
+        except FileNotFoundError:
+            if current is None:
+                raise FileNotFoundError(f"Skills taxonomy not found: {path}")
+            log.warning("Skills taxonomy %s is missing; keeping the loaded one", path)
+            current.checked_at = now
+            return current.extractor
+
+        extractor = self._extractors.get(key)
+        if extractor is None:
+            try:
+                extractor = self.loader(path)
+            except Exception:
+                if current is None:
+                    raise
+                log.exception("Failed to reload skills taxonomy %s; keeping the loaded one", path)
+                current.checked_at = now
+                return current.extractor
+            key = (resolved, extractor.sha256)  # what was actually read, should the file move again
+
+        self._extractors[key] = extractor
+        self._extractors.move_to_end(key)
+        while len(self._extractors) > self.max_items:
+            self._extractors.popitem(last=False)
+
+        # Publish. `stat` was taken before reading, so an edit landing after it is
+        # picked up on the next check.
+        if current is not None and current.key != key:
+            log.info("Skills taxonomy reloaded: %s (%s -> %s)", path, current.key[1][:12], key[1][:12])
+        self._current[path] = _Current(extractor, key, stat, now)
+        return extractor
+
+    def clear(self) -> None:
+        with self._lock:
+            self._extractors.clear()
+            self._current.clear()
+
+
+_default_registry: Optional[TaxonomyRegistry] = None
+
+
+def get_taxonomy_registry() -> TaxonomyRegistry:
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = TaxonomyRegistry()
+    return _default_registry
@@ -16,8 +16,14 @@ def load_taxonomy(path: str | Path) -> SkillsTaxonomy:
     p = Path(path)
     if not p.exists():
         raise FileNotFoundError(f"Skills taxonomy not found: {p}")
+    return parse_taxonomy(p.read_bytes())
 
-    data = json.loads(p.read_text(encoding="utf-8"))
+
+def parse_taxonomy(raw: bytes | str) -> SkillsTaxonomy:
+    """
+    Build a taxonomy from the contents of a skills_taxonomy.json file.
+    """
+    data = json.loads(raw.decode("utf-8") if isinstance(raw, bytes) else raw)
     if not isinstance(data, dict):
         raise ValueError("skills_taxonomy.json must be a JSON object")
 
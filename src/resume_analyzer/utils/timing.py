@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+
+class DocumentStats(NamedTuple):
+    pages: int
+    chars: int
+    cache_hit: Optional[bool]  # None when no cache was used
+    truncated: bool
+
+
+class StageTimer:
+    """
+    Wall-clock time per pipeline stage plus size stats of the documents parsed
+    for one request.
+
+    Plain data only, so a timer filled in a worker process pickles back to the
+    caller together with the result.
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}  # stage -> seconds, in first-seen order
+        self.documents: List[DocumentStats] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - t0
+
+    def document(self, doc) -> None:
+        """
+        Record one parsed TextDocument (pages read, text length, cache hit, truncation).
+        """
+        report = doc.extraction
+        self.documents.append(
+            DocumentStats(
+                pages=report.pages_read if report is not None else 0,
+                chars=len(doc.text),
+                cache_hit=doc.from_cache,
+                truncated=doc.truncated,
+            )
+        )
+
+    def server_timing(self, total_seconds: float | None = None) -> str:
+        """
+        Server-Timing header value, durations in milliseconds.
+        """
+        parts = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in self.stages.items()]
+        if total_seconds is not None:
+            parts.append(f"total;dur={total_seconds * 1000:.1f}")
+        return ", ".join(parts)
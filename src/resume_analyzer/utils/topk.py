@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def top_k_indices(scores: "np.ndarray", k: int) -> "np.ndarray":
+    """
+    Indices of the k largest scores along the last axis (1-D or 2-D), best first.
+
+    Same result as a stable sort on -scores cut at k, including at the cut:
+    everything above the k-th largest value is kept, then the earliest
+    indices tied with it. Only the k survivors are sorted, not every score.
+    """
+    import numpy as np
+
+    scores = np.asarray(scores)
+    rows = np.atleast_2d(scores)
+    n, m = rows.shape
+    k = min(max(0, int(k)), m)
+
+    if k < m:
+        kth = -np.partition(-rows, k - 1, axis=1)[:, k - 1 : k] if k else np.full((n, 1), np.inf)
+        above = rows > kth
+        tied = rows == kth
+        need = k - above.sum(axis=1, keepdims=True)
+        chosen = above | (tied & (np.cumsum(tied, axis=1) <= need))
+        top = np.nonzero(chosen)[1].reshape(n, k)
+    else:
+        top = np.broadcast_to(np.arange(m), (n, m))
+
+    # Best first; ties keep index order
+    order = np.lexsort((top, -np.take_along_axis(rows, top, axis=1)), axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+    return top[0] if scores.ndim == 1 else top
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import importlib
+import io
+import logging
+import time
+import zipfile
+from typing import Any, Callable, Dict
+
+
+log = logging.getLogger("resume_analyzer.warmup")
+
+# Small but realistic: exercises contact, skills, role prediction and matching
+WARMUP_RESUME = [
+    "Jane Doe",
+    "jane.doe@example.com | +1 (555) 010-0000 | linkedin.com/in/janedoe | github.com/janedoe",
+    "Android developer: Kotlin, Java, Jetpack Compose, Retrofit, Room, Git, CI/CD.",
+    "Built REST API integrations and Firebase features for apps with 1M+ installs.",
+]
+WARMUP_JD = "Android developer with Kotlin, Jetpack Compose, REST APIs and Git."
+
+
+def _dummy_docx() -> bytes:
+    """
+    Smallest DOCX the extractor reads: a zip with word/document.xml. Built by
+    hand so warming up does not import python-docx, which serving never needs.
+    """
+    from xml.sax.saxutils import escape
+
+    body = "".join(f"<w:p><w:r><w:t>{escape(line)}</w:t></w:r></w:p>" for line in WARMUP_RESUME)
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr(
+            "word/document.xml",
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f"<w:body>{body}</w:body></w:document>",
+        )
+    return buf.getvalue()
+
+
+def _dummy_analysis() -> None:
+    from resume_analyzer.document import JobDescription, ResumeDocument
+    from resume_analyzer.ml.registry import get_role_predictor
+    from resume_analyzer.scoring.match import match_resume_to_jd
+
+    doc = ResumeDocument.from_source(_dummy_docx())
+    _ = doc.contact, doc.skills
+    try:
+        get_role_predictor().predict(doc)
+    except Exception:  # optional, like in the pipeline; its own step reports the error
+        pass
+    match_resume_to_jd(doc, JobDescription(WARMUP_JD))
+
+
+def _load_taxonomy() -> None:
+    from resume_analyzer.skills.extract import get_default_extractor
+
+    get_default_extractor()
+
+
+def _load_role_model() -> None:
+    from resume_analyzer.ml.registry import get_role_predictor
+
+    get_role_predictor()
+
+
+def _load_similarity_model() -> None:
+    from resume_analyzer.scoring.similarity import get_similarity_model
+
+    get_similarity_model()
+
+
+def _import_heavy() -> None:
+    for name in ("numpy", "scipy.sparse", "sklearn.feature_extraction.text", "joblib", "pypdf"):
+        importlib.import_module(name)
+
+
+WARMUP_STEPS: Dict[str, Callable[[], None]] = {
+    "imports": _import_heavy,
+    "taxonomy": _load_taxonomy,
+    "role_model": _load_role_model,
+    "similarity_model": _load_similarity_model,
+    "dummy_analysis": _dummy_analysis,
+}
+
+
+def warm_up() -> Dict[str, Any]:
+    """
+    Pay every lazy cost up front: heavy imports, compiled taxonomy, models, and
+    one end-to-end analysis of an in-memory DOCX. A failing step is reported
+    but does not stop the rest (the role model, for one, is optional).
+    """
+    steps_ms: Dict[str, float] = {}
+    errors: Dict[str, str] = {}
+    for name, step in WARMUP_STEPS.items():
+        t0 = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            errors[name] = str(e) or type(e).__name__
+            log.warning("Warm-up step %s failed: %s", name, e)
+        steps_ms[name] = round((time.perf_counter() - t0) * 1000, 1)
+    log.info("Warm-up done in %.0f ms", sum(steps_ms.values()))
+    return {"steps_ms": steps_ms, "errors": errors}
@@ -0,0 +1,41 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# One synthetic PDF / DOCX writer for tests and benchmarks
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+from corpus import build_docx, build_pdf_pages  # noqa: E402
+
+
+def build_pdf(pages: list[str]) -> bytes:
+    """
+    One PDF page per string; newlines start a new line of text.
+    """
+    return build_pdf_pages([page.split("\n") for page in pages])
+
+
+@pytest.fixture(autouse=True)
+def _state_paths(monkeypatch, tmp_path):
+    """
+    Keep every on-disk store the API writes (parse cache, stored JDs, jobs,
+    skill index) under the test's tmp_path instead of the working tree's .cache/.
+    """
+    from resume_analyzer.api import main
+    from resume_analyzer.api.config import settings
+
+    monkeypatch.setattr(settings, "PARSE_CACHE_PATH", str(tmp_path / "parse_cache.sqlite3"))
+    monkeypatch.setattr(settings, "JDS_DB_PATH", str(tmp_path / "jds.sqlite3"))
+    monkeypatch.setattr(settings, "JOBS_DB_PATH", str(tmp_path / "jobs.sqlite3"))
+    monkeypatch.setattr(settings, "SKILL_INDEX_PATH", str(tmp_path / "skill_index.npz"))
+    monkeypatch.setattr(main, "_parse_cache", None)
+
+
+@pytest.fixture
+def make_pdf():
+    return build_pdf
+
+
+@pytest.fixture
+def make_docx():
+    return build_docx
@@ -1,8 +1,239 @@
+import time
+
 from fastapi.testclient import TestClient
+from resume_analyzer.api.config import settings
 from resume_analyzer.api.main import create_app
+from resume_analyzer.skills.index import SkillIndex
 
 def test_health():
     client = TestClient(create_app())
     r = client.get("/health")
     assert r.status_code == 200
     assert r.json()["status"] == "ok"
+
+
+def test_health_reports_pipeline_gauges():
+    client = TestClient(create_app())
+    pipeline = client.get("/health").json()["pipeline"]
+    assert pipeline["in_flight"] == 0
+    assert pipeline["queue_depth"] == 0
+
+
+def test_analyze_docx_in_memory(monkeypatch, make_docx):
+    monkeypatch.setattr(settings, "RESUME_API_KEY", "test-key")
+    resume = make_docx(["Jane Doe jane@example.com", "Kotlin Android Jetpack Git"])
+
+    with TestClient(create_app()) as client:
+        r = client.post(
+            "/analyze",
+            files={"resume": ("resume.docx", resume)},
+            data={"jd_text": "Kotlin and Java developer"},
+            headers={"X-API-Key": "test-key"},
+        )
+
+    assert r.status_code == 200
+    body = r.json()
+    assert body["contact"]["email"] == "jane@example.com"
+    assert "kotlin" in body["skills"]
+    assert body["match"]["missing_skills"] == ["java"]
+
+
+def test_rank_endpoint(monkeypatch, make_docx):
+    monkeypatch.setattr(settings, "RESUME_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "RANK_PARSE_WORKERS", 1)
+    files = [
+        ("resumes", ("flutter.docx", make_docx(["Flutter Dart Firebase"]))),
+        ("resumes", ("java.docx", make_docx(["Java Spring Boot Kafka Docker"]))),
+        ("resumes", ("broken.docx", b"not a docx")),
+    ]
+
+    with TestClient(create_app()) as client:
+        r = client.post(
+            "/rank",
+            files=files,
+            data={"jd_text": "Java Spring Boot Kafka", "top_k": "1"},
+            headers={"X-API-Key": "test-key"},
+        )
+
+    assert r.status_code == 200
+    body = r.json()
+    assert body["total_resumes"] == 3
+    assert [x["resume_filename"] for x in body["results"]] == ["java.docx"]
+    assert body["results"][0]["role_prediction"][0]["label"] == "backend_java"
+    assert [e["resume_filename"] for e in body["errors"]] == ["broken.docx"]
+
+
+def test_analyze_server_timing_and_metrics(monkeypatch, make_docx):
+    monkeypatch.setattr(settings, "RESUME_API_KEY", "test-key")
+    resume = make_docx(["jane@example.com", "Kotlin Android"])
+
+    with TestClient(create_app()) as client:
+        r = client.post(
+            "/analyze",
+            files={"resume": ("resume.docx", resume)},
+            data={"jd_text": "Kotlin developer"},
+            headers={"X-API-Key": "test-key"},
+        )
+        rejected = client.post(
+            "/analyze",
+            files={"resume": ("resume.docx", b"not a docx")},
+            headers={"X-API-Key": "test-key"},
+        )
+        metrics = client.get("/metrics").text
+
+    assert r.status_code == 200
+    stages = [part.split(";")[0] for part in r.headers["Server-Timing"].split(", ")]
+    assert stages[0] == "parse" and "match" in stages and stages[-1] == "total"
+
+    assert rejected.status_code == 400
+    assert 'resume_analyzer_requests_total{endpoint="analyze",status="200"} 1' in metrics
+    assert 'resume_analyzer_requests_total{endpoint="analyze",status="400"} 1' in metrics
+    assert 'resume_analyzer_stage_seconds_count{endpoint="analyze",stage="parse"} 1' in metrics
+    assert 'resume_analyzer_stage_seconds_bucket{endpoint="analyze",stage="skills",le="+Inf"} 1' in metrics
+    assert "resume_analyzer_documents_total 1" in metrics
+    assert "resume_analyzer_pipeline_in_flight 0" in metrics
+
+
+def test_jobs_analyze_runs_in_background(monkeypatch, make_docx):
+    monkeypatch.setattr(settings, "RESUME_API_KEY", "test-key")
+    headers = {"X-API-Key": "test-key"}
+
+    with TestClient(create_app()) as client:
+        r = client.post(
+            "/jobs",
+            files={"resumes": ("resume.docx", make_docx(["jane@example.com", "Kotlin Android"]))},
+            data={"jd_text": "Kotlin and Java developer"},
+            headers=headers,
+        )
+        assert r.status_code == 202
+        job_url = r.json()["status_url"]
+
+        deadline = time.monotonic() + 30
+        job = client.get(job_url, headers=headers).json()
+        while job["status"] in ("queued", "running") and time.monotonic() < deadline:
+            time.sleep(0.05)
+            job = client.get(job_url, headers=headers).json()
+
+        assert client.get("/jobs/missing", headers=headers).status_code == 404
+
+        monkeypatch.setattr(settings, "JOBS_MAX_TOTAL_BYTES", 10)
+        too_big = client.post(
+            "/jobs",
+            files=[("resumes", ("a.docx", b"x" * 6)), ("resumes", ("b.docx", b"y" * 6))],
+            data={"kind": "rank", "jd_text": "Python"},
+            headers=headers,
+        )
+        assert too_big.status_code == 413
+
+    assert job["status"] == "done", job
+    assert job["result"]["contact"]["email"] == "jane@example.com"
+    assert job["result"]["match"]["missing_skills"] == ["java"]
+
+
+def test_ready_after_warm_up(monkeypatch):
+    monkeypatch.setattr(settings, "WARMUP_ON_STARTUP", True)
+
+    with TestClient(create_app()) as client:
+        deadline = time.time() + 60
+        r = client.get("/ready")
+        while r.status_code == 503 and time.time() < deadline:
+            assert r.json()["ready"] is False
+            time.sleep(0.1)
+            r = client.get("/ready")
+
+    assert r.status_code == 200
+    body = r.json()
+    assert body["ready"] is True
+    assert "dummy_analysis" in body["warmup"]["steps_ms"]
+    assert "dummy_analysis" not in body["warmup"]["errors"]
+
+
+def test_ready_immediately_without_warm_up(monkeypatch):
+    monkeypatch.setattr(settings, "WARMUP_ON_STARTUP", False)
+
+    with TestClient(create_app()) as client:
+        r = client.get("/ready")
+
+    assert r.status_code == 200
+    assert r.json() == {"ready": True, "warmup": None}
+
+
+def test_search_endpoint(monkeypatch):
+    monkeypatch.setattr(settings, "RESUME_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "WARMUP_ON_STARTUP", False)
+    headers = {"X-API-Key": "test-key"}
+
+    with TestClient(create_app()) as client:
+        missing = client.get("/search", params={"q": "python"}, headers=headers)
+
+        SkillIndex.build([
+            ("a.pdf", ["python", "kafka"]),
+            ("b.pdf", ["python", "kafka", "java"]),
+            ("c.pdf", ["python"]),
+        ]).save(settings.SKILL_INDEX_PATH)
+        r = client.get("/search", params={"q": "python AND kafka AND NOT java"}, headers=headers)
+        ranked = client.get("/search", params={"q": "python OR kafka", "limit": 1, "offset": 1}, headers=headers)
+        bad = client.get("/search", params={"q": "python AND"}, headers=headers)
+
+    assert missing.status_code == 503
+    assert r.status_code == 200
+    body = r.json()
+    assert body["total"] == 1 and body["indexed_resumes"] == 3
+    assert body["results"] == [{"resume": "a.pdf", "score": 1.0, "matched_skills": ["kafka", "python"]}]
+    assert ranked.json()["total"] == 3
+    assert [h["resume"] for h in ranked.json()["results"]] == ["b.pdf"]
+    assert bad.status_code == 400
+
+
+def test_register_jds_and_match_resume_against_them(monkeypatch, make_docx):
+    monkeypatch.setattr(settings, "RESUME_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "WARMUP_ON_STARTUP", False)
+    headers = {"X-API-Key": "test-key"}
+    resume = make_docx(["Jane Doe", "Java Spring Boot Kafka Docker"])
+
+    with TestClient(create_app()) as client:
+        empty = client.post("/match/jobs", files={"resume": ("r.docx", resume)}, headers=headers)
+        r = client.post(
+            "/jds",
+            json={"jds": [
+                {"id": "backend", "title": "Backend engineer", "text": "Java, Spring Boot, Kafka, PostgreSQL"},
+                {"id": "mobile", "text": "Flutter, Dart, Firebase"},
+                {"text": "Python, pandas, SQL"},
+            ]},
+            headers=headers,
+        )
+        blank = client.post("/jds", json={"jds": [{"text": "   "}]}, headers=headers)
+        with monkeypatch.context() as m:
+            m.setattr(settings, "MAX_TEXT_CHARS", 40)
+            long = client.post(
+                "/jds", json={"jds": [{"id": "long", "text": "Go developer. " + "Rust " * 20 + "Kubernetes"}]},
+                headers=headers,
+            )
+        client.delete("/jds/long", headers=headers)
+        matched = client.post(
+            "/match/jobs", files={"resume": ("r.docx", resume)}, data={"top_k": "2"}, headers=headers
+        )
+        deleted = client.delete("/jds/mobile", headers=headers)
+        missing = client.delete("/jds/mobile", headers=headers)
+
+    assert empty.status_code == 200 and empty.json()["results"] == []
+    assert r.status_code == 201
+    body = r.json()
+    assert body["total_jds"] == 3
+    assert body["registered"][0] == {
+        "id": "backend", "title": "Backend engineer", "skills": ["java", "kafka", "postgresql", "spring boot"],
+        "truncated": False,
+    }
+    assert blank.status_code == 400
+    assert long.json()["registered"][0]["truncated"] is True
+    assert "kubernetes" not in long.json()["registered"][0]["skills"]
+    assert "register;dur=" in long.headers["Server-Timing"]
+
+    assert matched.status_code == 200
+    body = matched.json()
+    assert body["total_jds"] == 3
+    assert [x["jd_id"] for x in body["results"]][0] == "backend"
+    assert len(body["results"]) == 2
+    assert body["results"][0]["match"]["missing_skills"] == ["postgresql"]
+    assert "match;dur=" in matched.headers["Server-Timing"]
+    assert deleted.status_code == 204 and missing.status_code == 404
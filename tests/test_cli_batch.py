@@ -0,0 +1,95 @@
+import json
+
+from resume_analyzer.cli import collect_resume_paths, main
+from resume_analyzer.skills.index import SkillIndex
+
+
+JD = "Android developer with Kotlin and Jetpack Compose"
+
+
+def _write_resumes(tmp_path, make_docx, names):
+    for name in names:
+        (tmp_path / "resumes" / name).write_bytes(make_docx([f"{name} Kotlin developer"]))
+
+
+def _rows(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_collect_resume_paths_dir_glob_manifest(tmp_path, make_docx):
+    (tmp_path / "resumes" / "nested").mkdir(parents=True)
+    _write_resumes(tmp_path, make_docx, ["a.docx", "nested/b.docx"])
+    (tmp_path / "resumes" / "notes.txt").write_text("skip me")
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text(f"# comment\n{tmp_path / 'resumes' / 'a.docx'}\n\n")
+
+    paths = collect_resume_paths(
+        str(tmp_path / "resumes"), [str(tmp_path / "resumes" / "*.docx")], str(manifest)
+    )
+    assert [p.rsplit("/", 1)[-1] for p in paths] == ["a.docx", "b.docx"]
+
+
+def test_batch_streams_jsonl_and_resumes_from_checkpoint(tmp_path, make_docx):
+    (tmp_path / "resumes").mkdir()
+    _write_resumes(tmp_path, make_docx, ["a.docx", "b.docx"])
+    (tmp_path / "resumes" / "broken.pdf").write_bytes(b"not a pdf")
+    out = tmp_path / "out.jsonl"
+    common = [
+        "batch", "--resume-dir", str(tmp_path / "resumes"), "--jd-text", JD,
+        "--out", str(out), "--cache-path", str(tmp_path / "cache.sqlite3"),
+    ]
+
+    main(common)
+    rows = _rows(out)
+    assert len(rows) == 3
+    assert sum("error" in r for r in rows) == 1
+    assert all("match" in r for r in rows if "error" not in r)
+
+    # Interrupted-run shape: a new resume appears, analyzed ones are skipped, failed ones retried
+    _write_resumes(tmp_path, make_docx, ["c.docx"])
+    main(common + ["--workers", "2"])
+    rows = _rows(out)
+    assert len(rows) == 5
+    assert sorted(r["resume_file"].rsplit("/", 1)[-1] for r in rows[3:]) == ["broken.pdf", "c.docx"]
+    assert "error" in next(r for r in rows[3:] if r["resume_file"].endswith("broken.pdf"))
+
+    main(common + ["--restart"])
+    assert len(_rows(out)) == 4
+
+
+def test_batch_chunks_keep_order_and_predict_roles(tmp_path, make_docx):
+    (tmp_path / "resumes").mkdir()
+    names = ["a.docx", "b.docx", "broken.docx", "c.docx", "d.docx"]
+    _write_resumes(tmp_path, make_docx, [n for n in names if n != "broken.docx"])
+    (tmp_path / "resumes" / "broken.docx").write_bytes(b"not a docx")
+    out = tmp_path / "out.jsonl"
+
+    main(["batch", "--resume-dir", str(tmp_path / "resumes"), "--out", str(out), "--chunk-size", "2", "--no-cache"])
+
+    rows = _rows(out)
+    assert [r["resume_file"].rsplit("/", 1)[-1] for r in rows] == names
+    assert "error" in rows[2]
+    assert all(r["role_prediction"][0]["label"] == "android_developer" for r in rows if "error" not in r)
+
+
+def test_index_from_resumes_and_from_batch_output(tmp_path, make_docx):
+    (tmp_path / "resumes").mkdir()
+    (tmp_path / "resumes" / "java.docx").write_bytes(make_docx(["Java Spring Boot Kafka"]))
+    (tmp_path / "resumes" / "py.docx").write_bytes(make_docx(["Python Kafka Docker"]))
+    (tmp_path / "resumes" / "broken.docx").write_bytes(b"not a docx")
+    cache = ["--cache-path", str(tmp_path / "cache.sqlite3")]
+
+    direct = tmp_path / "direct.npz"
+    main(["index", "--resume-dir", str(tmp_path / "resumes"), "--out", str(direct)] + cache)
+    index = SkillIndex.load(direct)
+    assert len(index) == 2
+    assert index.taxonomy is not None
+    assert [h.key.rsplit("/", 1)[-1] for h in index.search("kafka AND NOT java").hits] == ["py.docx"]
+
+    batch = tmp_path / "batch.jsonl"
+    main(["batch", "--resume-dir", str(tmp_path / "resumes"), "--out", str(batch)] + cache)
+    from_jsonl = tmp_path / "from_jsonl.npz"
+    main(["index", "--from-jsonl", str(batch), "--out", str(from_jsonl)])
+    index2 = SkillIndex.load(from_jsonl)
+    assert sorted(index2.names) == sorted(index.names)
+    assert sorted(h.key for h in index2.search("kafka").hits) == sorted(h.key for h in index.search("kafka").hits)
@@ -1,4 +1,8 @@
-from resume_analyzer.parsing.contact import extract_contact_info, normalize_phone, normalize_url
+import random
+import re
+import time
+
+from resume_analyzer.parsing.contact import extract_contact_info, find_phone, normalize_phone, normalize_url
 
 
 def test_normalize_url_www():
@@ -27,3 +31,57 @@ def test_extract_contact_info():
     assert c.github and "github.com/testuser" in c.github
     assert c.linkedin and "linkedin.com/in/test-user" in c.linkedin
     assert any("example.com" in u for u in c.links)
+
+
+def test_single_scan_classifies_each_token_once():
+    c = extract_contact_info(
+        "Profile: linkedin.com/in/jane (github.com/jane) https://example.com/p/12345678901 +1 (415) 555-2671"
+    )
+    assert c.linkedin == "linkedin.com/in/jane"
+    assert c.github == "github.com/jane"
+    assert c.links == ["https://example.com/p/12345678901"]
+    assert c.phones == ["+14155552671"]  # digits inside the URL are not a phone
+
+
+def test_header_first_stops_once_all_fields_found():
+    header = "jane@example.com | +91 98765 43210 | linkedin.com/in/jane | github.com/jane\n"
+    body = "Projects: https://example.com/demo, contact alt: other@example.com, 98765 00000 11\n"
+
+    full = extract_contact_info(header + body)
+    fast = extract_contact_info(header + body, header_first=True)
+
+    assert (fast.email, fast.linkedin, fast.github) == (full.email, full.linkedin, full.github)
+    assert fast.phones == ["+919876543210"]
+    assert fast.links == []
+    assert full.links == ["https://example.com/demo"]
+
+
+def test_find_phone_matches_previous_pattern():
+    pattern = re.compile(r"(?<!\w)\+?\(?\d[\d\s\-()]{8,}\d(?!\w)")
+    rng = random.Random(3)
+    for _ in range(3000):
+        text = "".join(rng.choice("12 -()+ax\n_") for _ in range(rng.randint(0, 40)))
+        spans, pos = [], 0
+        while (span := find_phone(text, pos)) is not None:
+            spans.append(span)
+            pos = span[1]
+        assert spans == [m.span() for m in pattern.finditer(text)], text
+
+
+def test_contact_edge_cases():
+    c = extract_contact_info("x_jane@mail.example.co.uk, id12345678901 and (022) 2345-6789x (022) 2345-6789")
+    assert c.email == "x_jane@mail.example.co.uk"
+    assert c.phones == ["02223456789"]  # glued to a word on either side: not a phone
+
+    c = extract_contact_info("mail:jane@example.c0m www.Example.org/a(b) HTTPS://GitHub.com/jane")
+    assert c.email is None
+    assert c.links == ["https://www.Example.org/a(b", "HTTPS://GitHub.com/jane"]
+    assert c.github == "HTTPS://GitHub.com/jane"
+
+
+def test_backtracking_prone_inputs_scan_in_linear_time():
+    for unit in ("a-", "1-", "1 ", "x@" + "a." * 8, "(12) 34-", "a@"):
+        text = unit * (200_000 // len(unit))
+        t0 = time.perf_counter()
+        extract_contact_info(text)
+        assert time.perf_counter() - t0 < 2.0, unit
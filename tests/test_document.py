@@ -0,0 +1,77 @@
+import os
+import shutil
+
+import pytest
+
+import resume_analyzer.document as document
+from resume_analyzer.document import JobDescription, ResumeDocument
+from resume_analyzer.ml.role_predictor import RolePredictor
+from resume_analyzer.scoring.match import match_resume_to_jd
+from resume_analyzer.skills.extract import get_default_extractor
+
+
+def test_document_features_are_memoized(monkeypatch):
+    calls = []
+    real = document.extract_skills
+
+    def counting_extract(text):
+        calls.append(text)
+        return real(text)
+
+    monkeypatch.setattr(document, "extract_skills", counting_extract)
+
+    resume = ResumeDocument("Skills:   Python, Flutter,\tGit\r\n")
+    jd = JobDescription("We need Python, FastAPI, Git")
+
+    assert resume.text == "Skills: Python, Flutter, Git"
+    assert resume.skills == {"python", "flutter", "git"}
+    match_resume_to_jd(resume, jd)
+    match_resume_to_jd(resume, jd)
+
+    assert len(calls) == 2  # once per document, not per stage / call
+
+
+def test_parsed_document_skills_come_from_the_page_stream(monkeypatch, make_pdf):
+    monkeypatch.setattr(document, "extract_skills", lambda text: pytest.fail("skills re-extracted from text"))
+    pages = ["Jane Doe\nSkills: Python, Dock", "er and Kotlin", "Android, Git"]
+
+    doc = ResumeDocument.from_source(make_pdf(pages))
+
+    assert doc.skills == get_default_extractor().extract(doc.text)
+    assert {"python", "kotlin", "android", "git"} <= doc.skills
+
+
+def test_match_with_documents_equals_match_with_strings():
+    resume = "Skills: Python, Flutter, Git"
+    jd = "We need Python, FastAPI, Git"
+    assert match_resume_to_jd(ResumeDocument(resume), JobDescription(jd)) == match_resume_to_jd(resume, jd)
+
+
+def test_role_probabilities_memoized_per_model():
+    predictor = RolePredictor("models/role_pipeline.joblib")
+    doc = ResumeDocument("Kotlin Android Jetpack Retrofit Room")
+
+    top = predictor.predict_topk(doc, k=2)
+    assert top == predictor.predict_topk(doc.text, k=2)
+    assert doc.role_probabilities(predictor) is doc.role_probabilities(predictor)
+
+
+def test_role_probabilities_keyed_on_artifact_version(tmp_path):
+    path = tmp_path / "role_pipeline.joblib"
+    shutil.copyfile("models/role_pipeline.joblib", path)
+    doc = ResumeDocument("Kotlin Android Jetpack Retrofit Room")
+
+    before = doc.role_probabilities(RolePredictor(path))
+    # Same path, new file contents (mtime): a fresh predictor must not get the old entry
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = RolePredictor(path)
+
+    assert doc.role_probabilities(reloaded) is not before
+    assert doc.role_probabilities(reloaded) == before
+
+
+def test_parsed_documents_are_not_cleaned_twice(monkeypatch, make_docx):
+    monkeypatch.setattr(document, "clean_text", lambda text: pytest.fail("text cleaned again"))
+    doc = ResumeDocument.from_source(make_docx(["Skills:   Python,\tGit"]))
+    assert doc.text == "Skills: Python, Git"
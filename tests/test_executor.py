@@ -0,0 +1,48 @@
+import asyncio
+import threading
+
+import pytest
+
+from resume_analyzer.api.executor import PipelineExecutor, PipelineSaturated
+
+
+def test_executor_runs_off_event_loop():
+    ex = PipelineExecutor(max_workers=2, max_queue=0)
+
+    async def main():
+        return await ex.run(threading.get_ident)
+
+    try:
+        assert asyncio.run(main()) != threading.get_ident()
+    finally:
+        ex.shutdown()
+
+
+def test_executor_rejects_when_saturated():
+    ex = PipelineExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def main():
+        first = asyncio.ensure_future(ex.run(release.wait))
+        second = asyncio.ensure_future(ex.run(release.wait))
+        await asyncio.sleep(0.05)
+
+        assert ex.in_flight == 1
+        assert ex.queue_depth == 1
+        with pytest.raises(PipelineSaturated):
+            await ex.run(release.wait)
+
+        release.set()
+        await asyncio.gather(first, second)
+
+    try:
+        asyncio.run(main())
+        assert ex.stats()["in_flight"] == 0
+        assert ex.stats()["queue_depth"] == 0
+    finally:
+        ex.shutdown()
+
+
+def test_executor_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        PipelineExecutor(kind="fiber")
@@ -0,0 +1,60 @@
+import threading
+
+from resume_analyzer.api.executor import PipelineExecutor
+from resume_analyzer.api.jobs import DONE, FAILED, QUEUED, RUNNING, JobFile, JobRunner, JobStore
+
+
+def test_store_survives_restart_and_requeues_running(tmp_path):
+    path = tmp_path / "jobs.sqlite3"
+    store = JobStore(path)
+    first = store.submit("analyze", {"jd_text": None}, [JobFile("resume", "a.docx", b"A")])
+    second = store.submit("analyze", {}, [JobFile("resume", "b.docx", b"B")])
+
+    claimed = store.claim()
+    assert claimed.id == first and claimed.files[0].data == b"A"
+    store.close()
+
+    # Process died mid-job: the new store requeues it ahead of the later job
+    store = JobStore(path)
+    assert store.get(first).status == RUNNING
+    assert store.requeue_running() == 1
+    assert store.get(first).status == QUEUED
+    assert store.claim().id == first
+    assert store.claim().id == second
+    assert store.claim() is None
+
+
+def test_runner_records_results_and_failures(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    runner = JobRunner(store, {"echo": lambda job: {"size": len(job.files[0].data)}})
+    ok = store.submit("echo", {}, [JobFile("resume", None, b"abc")])
+    bad = store.submit("nope", {}, [])
+
+    assert runner.run_one() == (ok, DONE)
+    assert runner.run_one() == (bad, FAILED)
+    assert runner.run_one() is None
+
+    assert store.get(ok).result == {"size": 3}
+    assert "Unknown job kind" in store.get(bad).error
+    assert store.counts()[DONE] == 1
+
+
+def test_runner_uses_pipeline_slots_and_waits_when_saturated(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    pipeline = PipelineExecutor(max_workers=1, max_queue=0)
+    runner = JobRunner(store, {"where": lambda job: {"thread": threading.current_thread().name}}, executor=pipeline)
+    job_id = store.submit("where", {}, [])
+
+    gate = threading.Event()
+    busy = pipeline.submit(gate.wait)
+    try:
+        # No free slot: the job goes back to the queue instead of running beside the pipeline
+        assert runner.run_one() is None
+        assert store.get(job_id).status == QUEUED
+    finally:
+        gate.set()
+        busy.result()
+
+    assert runner.run_one() == (job_id, DONE)
+    assert store.get(job_id).result["thread"].startswith("pipeline")
+    pipeline.shutdown()
@@ -1,4 +1,12 @@
-from resume_analyzer.scoring.match import compute_text_similarity, match_resume_to_jd
+import joblib
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+import resume_analyzer.scoring.match as match
+import resume_analyzer.scoring.similarity as similarity
+from resume_analyzer.document import JobDescription, ResumeDocument
+from resume_analyzer.scoring.match import compute_document_similarity, compute_text_similarity, match_resume_to_jd
+from resume_analyzer.ml.registry import ModelRegistry
+from resume_analyzer.scoring.similarity import SimilarityModel
 
 
 def test_compute_text_similarity_basic():
@@ -22,3 +30,52 @@ def test_match_resume_to_jd_skill_gap_correct():
 
     # coverage should be 2/3
     assert abs(result.skill_coverage - (2 / 3)) < 1e-6
+
+
+def _fit_model(tmp_path, corpus):
+    vect = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), min_df=1).fit(corpus)
+    path = tmp_path / "similarity_tfidf_vtest.joblib"
+    joblib.dump(vect, path)
+    return SimilarityModel(path)
+
+
+def test_similarity_uses_prefitted_model_without_refitting(tmp_path):
+    model = _fit_model(tmp_path, ["python flask developer", "java spring boot", "react typescript"])
+    resume = ResumeDocument("Python and Flask developer")
+    jd = JobDescription("Python Flask")
+
+    sim = compute_text_similarity(resume.text, jd.text, model=model)
+    assert 0.1 < sim <= 1.0
+    assert compute_document_similarity(resume, jd, model=model) == sim
+    assert model.model_version == "similarity_tfidf_vtest"
+
+
+def test_similarity_falls_back_to_pair_fit_without_model(monkeypatch):
+    monkeypatch.setattr(match, "get_similarity_model", lambda: None)
+    resume = "I have experience with Python and Flask."
+    jd = "Looking for a Python developer with Flask experience."
+    assert compute_text_similarity(resume, jd) == match._fit_pair_similarity(resume, jd)
+
+
+ICU_RESUME = (
+    "Registered nurse with six years in intensive care. Ventilator management, sedation titration, "
+    "hemodynamic monitoring and patient family education in a busy ICU."
+)
+ICU_JD = "ICU registered nurse: ventilator management, hemodynamic monitoring, sedation titration."
+
+
+def test_small_corpus_model_is_not_used_by_default(monkeypatch, tmp_path):
+    model = _fit_model(tmp_path, ["python flask developer", "java spring boot", "react typescript"])
+    pointer = tmp_path / "latest_similarity_model.txt"
+    pointer.write_text(str(model.model_path), encoding="utf-8")
+    monkeypatch.setattr(
+        similarity,
+        "_similarity_registry",
+        ModelRegistry(pointer_path=pointer, fallback_path=tmp_path / "none.joblib", loader=SimilarityModel),
+    )
+
+    # A tech-only vocabulary scores every non-tech pair 0: the pointer is ignored
+    assert compute_text_similarity(ICU_RESUME, ICU_JD, model=model) == 0.0
+    assert similarity.get_similarity_model() is None
+    assert similarity.get_similarity_model(min_vocabulary=1) is not None
+    assert compute_text_similarity(ICU_RESUME, ICU_JD) == match._fit_pair_similarity(ICU_RESUME, ICU_JD) > 0.3
@@ -0,0 +1,35 @@
+from resume_analyzer.api.metrics import Histogram, PipelineMetrics
+from resume_analyzer.utils.timing import StageTimer
+
+
+def test_histogram_buckets_are_cumulative():
+    h = Histogram("latency_seconds", "Latency.", ["stage"], buckets=(0.1, 1.0))
+    for v in (0.05, 0.1, 0.5, 3.0):
+        h.observe(v, "parse")
+
+    lines = h.render()
+    assert 'latency_seconds_bucket{stage="parse",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{stage="parse",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{stage="parse",le="+Inf"} 4' in lines
+    assert 'latency_seconds_count{stage="parse"} 4' in lines
+    assert 'latency_seconds_sum{stage="parse"} 3.65' in lines
+
+
+def test_track_records_status_and_stages():
+    metrics = PipelineMetrics()
+    timer = StageTimer()
+    with timer.stage("parse"):
+        pass
+
+    with metrics.track("analyze") as req:
+        req.timer = timer
+    try:
+        with metrics.track("analyze"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert metrics.requests.value("analyze", "200") == 1
+    assert metrics.requests.value("analyze", "500") == 1
+    assert metrics.stage_seconds.count("analyze", "parse") == 1
+    assert req.server_timing().startswith("parse;dur=")
@@ -0,0 +1,117 @@
+import sqlite3
+import time
+
+import resume_analyzer.document as document
+from resume_analyzer.document import ResumeDocument, resumes_from_sources
+from resume_analyzer.parsing.budget import ExtractionBudget
+from resume_analyzer.parsing.cache import ParseCache, cache_key
+
+
+def test_memory_lru_bound():
+    cache = ParseCache(max_memory_items=2)
+    for k in ("a", "b", "c"):
+        cache.put(k, k.upper())
+
+    assert cache.get("a") is None
+    assert cache.get("c").text == "C"
+    assert cache.stats()["memory_items"] == 2
+    assert cache.stats()["memory_hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    ParseCache(path).put("k", "text", {"skills": ["python"]})
+
+    cache = ParseCache(path)
+    entry = cache.get("k")
+    assert entry.text == "text"
+    assert entry.features == {"skills": ["python"]}
+    assert cache.stats()["disk_hits"] == 1
+
+    cache.get("k")
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_disk_size_and_age_eviction(tmp_path):
+    cache = ParseCache(tmp_path / "cache.sqlite3", max_memory_items=0, max_disk_bytes=200)
+    cache.put("old", "x" * 100)
+    cache.put("new", "y" * 100)
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
+    assert cache.stats()["disk_bytes"] <= 200
+
+    aged = ParseCache(tmp_path / "aged.sqlite3", max_age_seconds=0.01)
+    aged.put("k", "text")
+    time.sleep(0.02)
+    assert aged.get("k") is None
+
+
+def test_disk_budget_is_shared_by_caches_on_one_file(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    caches = [ParseCache(path, max_memory_items=0, max_disk_bytes=300) for _ in range(3)]
+    for i in range(12):
+        caches[i % 3].put(f"k{i}", "x" * 100)
+
+    sizes = [row[0] for row in sqlite3.connect(path).execute("SELECT size FROM parses")]
+    assert sum(sizes) <= 300
+    assert all(c.stats()["disk_bytes"] == sum(sizes) for c in caches)
+    assert caches[0].get("k11") is not None and caches[0].get("k0") is None
+
+    # One process aging rows out is seen by the others
+    caches[1].max_age_seconds = 1e-9
+    caches[1].put("late", "y")
+    late_size = sqlite3.connect(path).execute("SELECT size FROM parses WHERE key = 'late'").fetchone()[0]
+    assert caches[2].stats()["disk_items"] == 1
+    assert caches[2].stats()["disk_bytes"] == late_size
+
+
+def test_document_from_source_skips_parsing_on_hit(monkeypatch, make_docx):
+    calls = []
+    real = document.iter_resume_chunks
+
+    def counting_extract(source, *args):
+        calls.append(1)
+        return real(source, *args)
+
+    monkeypatch.setattr(document, "iter_resume_chunks", counting_extract)
+
+    data = make_docx(["jane@example.com", "Kotlin Android"])
+    cache = ParseCache()
+    first = ResumeDocument.from_source(data, cache=cache)
+    second = ResumeDocument.from_source(data, cache=cache)
+
+    assert len(calls) == 1
+    assert second.text == first.text
+    assert second.__dict__["skills"] == first.skills  # restored, not recomputed
+    assert second.contact == first.contact
+    assert cache_key(data) != cache_key(data + b" ")
+
+
+def test_resumes_from_sources_parses_only_misses(make_docx):
+    cache = ParseCache()
+    a, b = make_docx(["Kotlin"]), make_docx(["Java"])
+    ResumeDocument.from_source(a, cache=cache)
+
+    docs = resumes_from_sources([a, b, b"junk"], cache=cache)
+    assert [d.text for d in docs[:2]] == ["Kotlin", "Java"]
+    assert isinstance(docs[2], ValueError)
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_budget_is_part_of_the_key_and_timeouts_are_not_cached(make_pdf):
+    data = make_pdf(["Kotlin developer", "Java and Spring Boot"])
+    cache = ParseCache()
+
+    full = ResumeDocument.from_source(data, cache=cache)
+    first_page = ResumeDocument.from_source(data, cache=cache, budget=ExtractionBudget(max_pages=1))
+    assert "Java" in full.text and "Java" not in first_page.text
+    assert first_page.truncated and first_page.extraction.reason == "max_pages"
+
+    restored = ResumeDocument.from_source(data, cache=cache, budget=ExtractionBudget(max_pages=1))
+    assert cache.memory_hits == 1
+    assert restored.truncated and restored.extraction.pages_read == 1
+
+    timed_out = ResumeDocument.from_source(data, cache=cache, budget=ExtractionBudget(max_seconds=0))
+    assert timed_out.extraction.reason == "max_seconds"
+    assert cache.stats()["memory_items"] == 2
@@ -1,9 +1,17 @@
+import io
+import random
+import re
+import zipfile
 from pathlib import Path
 
 import pytest
 
-from resume_analyzer.parsing.clean import clean_text
+from resume_analyzer.parsing.budget import ExtractionBudget, ExtractionReport
+from resume_analyzer.parsing.clean import TextCleaner, clean_text, iter_clean_text
+from resume_analyzer.parsing.docx import iter_docx_paragraphs
+from resume_analyzer.parsing.pdf import PARALLEL_MIN_PAGES, iter_pdf_pages, page_shards
 from resume_analyzer.parsing.resume import extract_resume_text
+from resume_analyzer.parsing.source import sniff_document_type
 
 
 def test_clean_text_basic():
@@ -14,6 +22,37 @@ def test_clean_text_basic():
     assert "\t" not in cleaned
 
 
+def _reference_clean_text(text):
+    # The original multi-pass implementation
+    if not text:
+        return ""
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return "\n".join(ln.strip() for ln in text.split("\n")).strip()
+
+
+def test_clean_text_matches_reference_on_any_chunking():
+    rng = random.Random(11)
+    for _ in range(3000):
+        text = "".join(rng.choice("ab \t\r\n\n\x0c\xa0") for _ in range(rng.randint(0, 30)))
+        cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 4))))
+        chunks = [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+        expected = _reference_clean_text(text)
+        assert clean_text(text) == expected, repr(text)
+        assert "".join(iter_clean_text(chunks, sep="")) == expected, repr(chunks)
+        assert "".join(iter_clean_text(chunks)) == _reference_clean_text("\n".join(chunks)), repr(chunks)
+
+
+def test_text_cleaner_carries_state_across_chunks():
+    cleaner = TextCleaner()
+    assert cleaner.feed("  Jane   Doe\r") == ""  # the "\r" may be half of "\r\n"
+    assert cleaner.feed("\n\n\n") == "Jane Doe"  # blank lines held back
+    assert cleaner.feed("\n\tPython") == ""  # unfinished line
+    assert cleaner.feed(" dev\n \n") == "\n\nPython dev"
+    assert cleaner.finish() == ""
+
+
 def test_extract_resume_text_file_not_found():
     with pytest.raises(FileNotFoundError):
         extract_resume_text("no_such_file.pdf")
@@ -24,3 +63,117 @@ def test_extract_resume_text_unsupported_extension(tmp_path: Path):
     f.write_text("hi", encoding="utf-8")
     with pytest.raises(ValueError):
         extract_resume_text(f)
+
+
+def test_extract_resume_text_from_pdf_bytes(make_pdf):
+    data = make_pdf(["Jane Doe\nPython   Developer", "Second page"])
+    text = extract_resume_text(data)
+    assert "Python Developer" in text
+    assert "Second page" in text
+
+
+def test_extract_resume_text_from_docx_bytes_memoryview_and_stream(make_docx):
+    data = make_docx(["Jane Doe", "Kotlin Android"])
+    expected = "Jane Doe\nKotlin Android"
+    assert extract_resume_text(data) == expected
+    assert extract_resume_text(memoryview(data)) == expected
+    assert extract_resume_text(io.BytesIO(data)) == expected
+
+
+def test_extract_resume_text_unknown_bytes():
+    with pytest.raises(ValueError):
+        extract_resume_text(b"just some plain text")
+
+
+def test_sniff_document_type(make_pdf, make_docx):
+    assert sniff_document_type(make_pdf(["x"])) == ".pdf"
+    assert sniff_document_type(make_docx(["x"])) == ".docx"
+    assert sniff_document_type(b"hello") is None
+
+
+def test_pdf_pages_stream_under_page_and_char_budget(make_pdf):
+    data = make_pdf(["page one", "page two", "page three"])
+
+    assert list(iter_pdf_pages(data)) == ["page one", "page two", "page three"]
+
+    report = ExtractionReport()
+    text = extract_resume_text(data, ExtractionBudget(max_pages=2), report)
+    assert text == "page one\npage two"
+    assert (report.pages_total, report.pages_read, report.truncated, report.reason) == (3, 2, True, "max_pages")
+
+    report = ExtractionReport()
+    text = extract_resume_text(data, ExtractionBudget(max_chars=12), report)
+    assert text == "page one\npage"
+    assert report.reason == "max_chars" and report.pages_read == 2
+
+    report = ExtractionReport()
+    extract_resume_text(data, ExtractionBudget(max_pages=3, max_chars=1000), report)
+    assert not report.truncated
+
+
+def test_docx_budget_ignores_pages(make_docx):
+    report = ExtractionReport()
+    text = extract_resume_text(make_docx(["alpha", "beta"]), ExtractionBudget(max_pages=1), report)
+    assert text == "alpha\nbeta"
+    assert not report.truncated
+
+
+def test_docx_reads_headers_tables_and_footers():
+    from docx import Document
+
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = "Jane Doe | jane@example.com"
+    doc.sections[0].footer.paragraphs[0].text = "github.com/jane"
+    p = doc.add_paragraph("Summary")
+    p.add_run().add_break()
+    p.add_run("Android\tdeveloper")
+    table = doc.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "Skills"
+    table.cell(0, 1).text = "Kotlin, Java"
+    buf = io.BytesIO()
+    doc.save(buf)
+
+    assert list(iter_docx_paragraphs(buf.getvalue())) == [
+        "Jane Doe | jane@example.com",
+        "Summary\nAndroid\tdeveloper",
+        "Skills",
+        "Kotlin, Java",
+        "github.com/jane",
+    ]
+
+
+def test_docx_text_box_read_once_and_tab_stops_ignored():
+    w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    mc = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+    box = "<w:txbxContent><w:p><w:r><w:t>{}</w:t></w:r></w:p></w:txbxContent>"
+    xml = (
+        f'<w:document xmlns:w="{w}" xmlns:mc="{mc}"><w:body>'
+        '<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>'
+        "<w:r><w:t>Contact:</w:t></w:r>"
+        f"<w:r><mc:AlternateContent><mc:Choice Requires=\"wps\">{box.format('+1 415 555 2671')}</mc:Choice>"
+        f"<mc:Fallback>{box.format('+1 415 555 2671')}</mc:Fallback></mc:AlternateContent></w:r>"
+        "<w:r><w:noBreakHyphen/><w:t>end</w:t></w:r></w:p>"
+        "</w:body></w:document>"
+    )
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("word/document.xml", xml)
+
+    assert list(iter_docx_paragraphs(buf.getvalue())) == ["+1 415 555 2671", "Contact:-end"]
+
+
+def test_page_shards_cover_every_page_once():
+    for n_pages, workers in [(1, 4), (24, 2), (100, 16), (101, 3)]:
+        shards = page_shards(n_pages, workers)
+        assert [p for a, b in shards for p in range(a, b)] == list(range(n_pages))
+
+
+def test_parallel_pdf_pages_match_sequential(make_pdf):
+    data = make_pdf([f"page {i} Kotlin" for i in range(PARALLEL_MIN_PAGES + 6)])
+
+    assert list(iter_pdf_pages(data, workers=2)) == list(iter_pdf_pages(data))
+
+    report = ExtractionReport()
+    pages = list(iter_pdf_pages(data, ExtractionBudget(max_pages=PARALLEL_MIN_PAGES + 1), report, workers=2))
+    assert len(pages) == PARALLEL_MIN_PAGES + 1
+    assert report.reason == "max_pages"
@@ -0,0 +1,183 @@
+import json
+import math
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from resume_analyzer.cli import main
+from resume_analyzer.parsing.batch import extract_many
+from resume_analyzer.scoring.jd_index import JDIndex
+import resume_analyzer.scoring.match as match
+from resume_analyzer.scoring.match import match_resume_to_jd
+from resume_analyzer.scoring.similarity import SimilarityModel
+from resume_analyzer.scoring.rank import rank_resumes, skill_coverage_matrix
+from resume_analyzer.utils.topk import top_k_indices
+
+
+JD = "Backend engineer: Java, Spring Boot, Kafka, Docker, PostgreSQL"
+RESUMES = [
+    "Flutter Dart Firebase mobile apps",
+    "Java Spring Boot microservices with Kafka, Docker and PostgreSQL",
+    "Java developer, some Docker",
+]
+
+
+def test_rank_resumes_orders_best_first():
+    ranked = rank_resumes(JD, RESUMES, top_k=2)
+    assert [r.index for r in ranked] == [1, 2]
+    assert ranked[0].result.final_score >= ranked[1].result.final_score
+
+
+def test_rank_resumes_scores_match_pairwise():
+    # No corpus model: each pair keeps its own IDF, so the batch does not shift scores
+    for batch in (RESUMES, RESUMES[1:2]):
+        for r in rank_resumes(JD, batch, top_k=10):
+            pair = match_resume_to_jd(batch[r.index], JD)
+            assert r.result.similarity_score == pytest.approx(pair.similarity_score, abs=1e-12)
+            assert r.result.final_score == pytest.approx(pair.final_score, abs=1e-12)
+
+    for r in rank_resumes(JD, RESUMES, top_k=10):
+        pair = match_resume_to_jd(RESUMES[r.index], JD)
+        assert r.result.skill_coverage == pair.skill_coverage
+        assert r.result.missing_skills == pair.missing_skills
+        for score in (r.result.similarity_score, r.result.skill_coverage, r.result.final_score):
+            assert type(score) is float and 0.0 <= score <= 1.0
+
+
+def test_skill_coverage_matrix_matches_pairwise():
+    jds = [JD, "Mobile developer: Flutter, Dart, Firebase, Kotlin", "No listed skills here"]
+    coverage = skill_coverage_matrix(RESUMES, jds)
+
+    assert coverage.shape == (len(RESUMES), len(jds))
+    for i, resume in enumerate(RESUMES):
+        for j, jd in enumerate(jds):
+            assert coverage[i, j] == match_resume_to_jd(resume, jd).skill_coverage
+    assert not coverage[:, 2].any()
+
+
+JDS = [
+    JD,
+    "Mobile developer: Flutter, Dart, Firebase, Kotlin",
+    "Data scientist: Python, pandas, scikit-learn, SQL",
+    "No listed skills here",
+]
+
+
+def _corpus_model(tmp_path) -> SimilarityModel:
+    path = tmp_path / "similarity_tfidf_vtest.joblib"
+    joblib.dump(TfidfVectorizer(stop_words="english", ngram_range=(1, 2)).fit(JDS + RESUMES), path)
+    return SimilarityModel(path)
+
+
+def test_jd_index_matches_pairwise_and_persists(tmp_path, monkeypatch):
+    model = _corpus_model(tmp_path)
+    monkeypatch.setattr(match, "get_similarity_model", lambda: model)  # what match_resume_to_jd compares with
+    index = JDIndex(tmp_path / "jds.sqlite3", similarity=lambda: model)
+    stored = index.add_many(JDS, titles=["backend", "mobile", "data", None], ids=["b", "m", "d", "x"])
+    assert stored[0].skills == sorted(match_resume_to_jd("", JD).jd_skills)
+
+    for resume in RESUMES:
+        found = index.match(resume, top_k=10)
+        assert [m.result.final_score for m in found] == sorted((m.result.final_score for m in found), reverse=True)
+        for m in found:
+            pair = match_resume_to_jd(resume, JDS["bmdx".index(m.jd_id)])
+            assert math.isclose(m.result.final_score, pair.final_score, abs_tol=1e-9)
+            assert m.result.skill_coverage == pair.skill_coverage
+            assert m.result.missing_skills == pair.missing_skills
+    assert [m.jd_id for m in index.match(RESUMES[0], top_k=1)] == ["m"]
+
+    # Replace / remove, then reopen: rows and precomputed vectors come back from disk
+    index.add("Mobile developer: Flutter and Dart only", title="mobile v2", jd_id="m")
+    assert index.remove("x") and not index.remove("x")
+    index.close()
+    reopened = JDIndex(tmp_path / "jds.sqlite3", similarity=lambda: model)
+    assert len(reopened) == 3
+    assert reopened.get("m").title == "mobile v2"
+    assert reopened.match(RESUMES[0], top_k=1)[0].result.skill_coverage == 1.0
+
+
+def test_jd_index_refreshes_rows_from_another_taxonomy_or_model(tmp_path, monkeypatch):
+    index = JDIndex(tmp_path / "jds.sqlite3", similarity=lambda: None)
+    index.add_many(JDS[:3], ids=["b", "m", "d"])
+    index._db.execute("UPDATE jds SET skills = '[]', taxonomy = 'old'")
+
+    # No similarity model: a vectorizer is fitted over the stored JDs; stale skills are recomputed
+    found = index.match(RESUMES[1], top_k=3)
+    assert found[0].jd_id == "b" and found[0].result.similarity_score > 0
+    assert found[0].result.skill_coverage == match_resume_to_jd(RESUMES[1], JD).skill_coverage
+    assert index.get("b").skills == found[0].result.jd_skills
+
+    # Rows registered without a model get vectors once one is available
+    model = _corpus_model(tmp_path)
+    monkeypatch.setattr(match, "get_similarity_model", lambda: model)
+    with_model = JDIndex(tmp_path / "jds.sqlite3", similarity=lambda: model)
+    m = with_model.match(RESUMES[1], top_k=1)[0]
+    assert math.isclose(m.result.final_score, match_resume_to_jd(RESUMES[1], JD).final_score, abs_tol=1e-9)
+    assert with_model._db.execute("SELECT COUNT(*) FROM jds WHERE vector IS NULL").fetchone()[0] == 0
+
+
+def test_extract_many_reports_errors_per_document(make_docx):
+    sources = [make_docx(["Kotlin"]), b"not a document", make_docx(["Java"])]
+    sequential = extract_many(sources)
+    parallel = extract_many(sources, workers=2)
+
+    for outcomes in (sequential, parallel):
+        assert outcomes[0] == "Kotlin"
+        assert isinstance(outcomes[1], ValueError)
+        assert outcomes[2] == "Java"
+
+
+def test_cli_rank(tmp_path, capsys, make_docx):
+    paths = []
+    for i, text in enumerate(RESUMES):
+        p = tmp_path / f"r{i}.docx"
+        p.write_bytes(make_docx([text]))
+        paths.append(str(p))
+
+    cache = str(tmp_path / "cache.sqlite3")
+    main(["rank", "--jd-text", JD, "--top-k", "1", "--cache-path", cache, "--resumes", *paths])
+
+    out = json.loads(capsys.readouterr().out)
+    assert out["total_resumes"] == 3
+    assert len(out["results"]) == 1
+    assert out["results"][0]["resume_file"].endswith("r1.docx")
+
+
+def test_jd_index_instances_on_one_file_see_each_others_changes(tmp_path):
+    a = JDIndex(tmp_path / "jds.sqlite3")
+    b = JDIndex(tmp_path / "jds.sqlite3")
+    a.add(JDS[0], jd_id="x")
+    assert [m.jd_id for m in b.match(RESUMES[1])] == ["x"]
+
+    a.add(JDS[1], jd_id="y")
+    assert a.remove("x")
+    assert len(b) == 1
+    assert [m.jd_id for m in b.match(RESUMES[1])] == ["y"]
+
+
+def test_jd_index_ties_across_the_cut_keep_registration_order(tmp_path):
+    index = JDIndex(tmp_path / "jds.sqlite3")
+    index.add_many(["Mobile developer: Flutter, Dart, Firebase"] * 40 + [JDS[0]], ids=[str(i) for i in range(41)])
+
+    assert [m.jd_id for m in index.match(RESUMES[1], top_k=5)] == ["40", "0", "1", "2", "3"]
+    index.close()
+
+
+def test_rank_resumes_ties_across_the_cut_keep_input_order():
+    tied = "Java developer, some Docker"
+    resumes = [tied] * 40 + [RESUMES[1]]
+
+    ranked = rank_resumes(JD, resumes, top_k=5)
+
+    assert [r.index for r in ranked] == [40, 0, 1, 2, 3]
+
+
+def test_top_k_indices_matches_a_stable_sort():
+    rng = np.random.default_rng(3)
+    scores = rng.integers(0, 4, size=(50, 12)) / 4  # plenty of ties
+    for k in range(0, 14):
+        want = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+        assert (top_k_indices(scores, k) == want).all()
+        assert (top_k_indices(scores[7], k) == want[7]).all()
@@ -1,8 +1,168 @@
+import shutil
+
+import joblib
+import numpy as np
 import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.pipeline import Pipeline
 
+from resume_analyzer.ml.compact import CompactRoleModel, export_role_model
+from resume_analyzer.ml.registry import ModelRegistry
 from resume_analyzer.ml.role_predictor import RolePredictor
 
 
 def test_role_predictor_missing_model():
     with pytest.raises(FileNotFoundError):
         RolePredictor("models/nope.joblib")
+
+
+def _copy_model(dst):
+    shutil.copyfile("models/role_pipeline.joblib", dst)
+    return dst
+
+
+def test_registry_loads_artifact_once(tmp_path):
+    model = _copy_model(tmp_path / "role_pipeline_v1.joblib")
+    registry = ModelRegistry(pointer_path=tmp_path / "latest.txt", fallback_path=model)
+
+    first = registry.get()
+    assert registry.get() is first
+    assert registry.load(model) is first
+    assert first.model_version == "role_pipeline_v1"
+
+
+def test_registry_hot_reloads_on_pointer_change(tmp_path):
+    v1 = _copy_model(tmp_path / "role_pipeline_v1.joblib")
+    v2 = _copy_model(tmp_path / "role_pipeline_v2.joblib")
+    pointer = tmp_path / "latest.txt"
+    pointer.write_text(str(v1), encoding="utf-8")
+
+    registry = ModelRegistry(pointer_path=pointer, check_interval=0)
+    old = registry.get()
+    assert old.model_version == "role_pipeline_v1"
+
+    pointer.write_text(str(v2), encoding="utf-8")
+    new = registry.get()
+    assert new.model_version == "role_pipeline_v2"
+    # callers holding the old predictor can still use it
+    assert old.predict("Kotlin Android Jetpack").label == new.predict("Kotlin Android Jetpack").label
+
+
+def test_registry_load_keeps_a_bounded_lru_of_explicit_artifacts(tmp_path):
+    paths = [tmp_path / f"model_{i}.bin" for i in range(4)]
+    for p in paths:
+        p.write_bytes(b"x")
+    loads = []
+
+    def loader(path):
+        loads.append(path)
+        return object()
+
+    registry = ModelRegistry(pointer_path=tmp_path / "latest.txt", fallback_path=paths[0], loader=loader, max_items=2)
+
+    current = registry.get()
+    first = registry.load(paths[1])
+    registry.load(paths[2])  # evicts paths[1]; the pointer's model stays
+    assert registry.load(paths[0]) is current
+    assert registry.load(paths[1]) is not first
+    assert loads == [paths[0], paths[1], paths[2], paths[1]]
+
+
+def test_registry_keeps_current_model_when_pointer_is_broken(tmp_path):
+    v1 = _copy_model(tmp_path / "role_pipeline_v1.joblib")
+    pointer = tmp_path / "latest.txt"
+    pointer.write_text(str(v1), encoding="utf-8")
+
+    registry = ModelRegistry(pointer_path=pointer, check_interval=0)
+    current = registry.get()
+
+    pointer.write_text(str(tmp_path / "missing.joblib"), encoding="utf-8")
+    assert registry.get() is current
+
+
+TEXTS = [
+    "Kotlin Android Jetpack Compose Retrofit Room",
+    "Java Spring Boot Kafka microservices PostgreSQL",
+    "Flutter Dart Firebase state management",
+    "React TypeScript Redux CSS",
+    "Python pandas scikit-learn PyTorch",
+    "the and of",
+    "",
+]
+
+
+def test_compact_model_matches_joblib_pipeline(tmp_path):
+    pipeline = joblib.load("models/role_pipeline.joblib")
+    compact = CompactRoleModel(export_role_model(pipeline, tmp_path / "role_pipeline_v1.npz"))
+
+    assert isinstance(compact.coef, np.memmap)
+    assert list(compact.classes_) == list(pipeline.classes_)
+    np.testing.assert_allclose(compact.predict_proba(TEXTS), pipeline.predict_proba(TEXTS), rtol=0, atol=1e-12)
+
+
+def test_role_predictor_loads_compact_artifact(tmp_path):
+    path = export_role_model(joblib.load("models/role_pipeline.joblib"), tmp_path / "role_pipeline_v1.npz")
+    compact, full = RolePredictor(path), RolePredictor("models/role_pipeline.joblib")
+
+    assert compact.model_version == "role_pipeline_v1"
+    for text in TEXTS:
+        got, want = compact.predict_topk(text, k=5), full.predict_topk(text, k=5)
+        assert [p.label for p in got] == [p.label for p in want]
+        assert [p.confidence for p in got] == pytest.approx([p.confidence for p in want], abs=1e-12)
+
+
+def _fit(clf, texts, labels):
+    return Pipeline([("tfidf", TfidfVectorizer()), ("clf", clf)]).fit(texts, labels)
+
+
+def test_export_checks_the_classifier_link(tmp_path):
+    texts = ["kotlin android", "java spring", "python pandas", "kotlin compose", "java kafka", "python torch"]
+
+    # One-vs-rest probabilities are not a softmax of the decision function
+    ovr = _fit(SGDClassifier(loss="log_loss", random_state=0), texts, ["a", "j", "p"] * 2)
+    with pytest.raises(ValueError, match="softmax / sigmoid"):
+        export_role_model(ovr, tmp_path / "ovr.npz")
+
+    binary = _fit(LogisticRegression(), texts[:4], ["a", "j", "j", "a"])
+    compact = CompactRoleModel(export_role_model(binary, tmp_path / "binary.npz"))
+    np.testing.assert_allclose(compact.predict_proba(texts), binary.predict_proba(texts), rtol=0, atol=1e-12)
+
+
+def test_compact_model_rejects_compressed_npz(tmp_path):
+    path = tmp_path / "model.npz"
+    np.savez_compressed(path, coef=np.zeros((2, 2)))
+    with pytest.raises(ValueError):
+        CompactRoleModel(path)
+
+
+def test_predict_topk_batch_matches_single_predictions():
+    predictor = RolePredictor("models/role_pipeline.joblib")
+
+    batch = predictor.predict_topk_batch(TEXTS, k=2)
+    for text, got in zip(TEXTS, batch):
+        want = predictor.predict_topk(text, k=2)
+        assert [p.label for p in got] == [p.label for p in want]
+        assert [p.confidence for p in got] == pytest.approx([p.confidence for p in want], abs=1e-12)
+
+    arrays = predictor.predict_topk_batch(TEXTS, k=2, as_arrays=True)
+    assert arrays.indices.shape == arrays.confidences.shape == (len(TEXTS), 2)
+    assert list(arrays.indices[-1]) == [-1, -1]  # empty text
+    assert (arrays.confidences[:, 0] >= arrays.confidences[:, 1]).all()
+
+
+class _FixedProba:
+    classes_ = np.array(["a", "b", "c", "d", "e", "f"])
+
+    def predict_proba(self, texts):
+        return np.tile([0.1, 0.1, 0.1, 0.1, 0.1, 0.5], (len(texts), 1))
+
+
+def test_predict_topk_batch_breaks_ties_by_class_order():
+    predictor = RolePredictor.__new__(RolePredictor)
+    predictor.pipeline = _FixedProba()
+
+    for k in (1, 2, 3, 4, 5):
+        want = [p.label for p in predictor.predict_topk("x", k=k)]
+        assert [p.label for p in predictor.predict_topk_batch(["x", "y"], k=k)[1]] == want
+    assert want == ["f", "a", "b", "c", "d"]
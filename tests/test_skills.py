@@ -1,7 +1,18 @@
 
 
+import json
+import random
+import re
+
+import numpy as np
+import pytest
+
+from resume_analyzer.skills.bitset import SkillVocabulary, coverage_matrix
 from resume_analyzer.skills.taxonomy import load_taxonomy
-from resume_analyzer.skills.extract import extract_skills
+from resume_analyzer.skills.extract import SkillsExtractor, compiled_cache_path, extract_skills
+from resume_analyzer.skills.index import SkillIndex, decode_postings, encode_postings
+from resume_analyzer.skills.matcher import AliasMatcher
+from resume_analyzer.skills.registry import TaxonomyRegistry
 
 
 def test_load_taxonomy_ok():
@@ -25,3 +36,175 @@ def test_extract_skills_word_boundaries():
     text = "I love sequel databases (not really)."
     skills = extract_skills(text)
     assert "sql" not in skills
+
+
+def _legacy_regex_extract(tax, text):
+    found = set()
+    for alias, canonical in tax.alias_to_canonical.items():
+        pat = re.compile(r"(?<![A-Za-z0-9])" + re.escape(alias) + r"(?![A-Za-z0-9])", re.IGNORECASE)
+        if pat.search(text):
+            found.add(canonical)
+    return found
+
+
+def test_matcher_agrees_with_regex_semantics():
+    tax = load_taxonomy("data/skills_taxonomy.json")
+    matcher = AliasMatcher(tax.alias_to_canonical)
+    texts = [
+        "Worked with Python, Py, Flutter, SpringBoot, ReactJS and GitHub.",
+        "Senior ANDROID dev: Kotlin Coroutines, Jetpack Compose, Room DB, CI/CD via GitHub Actions.",
+        "I love sequel databases (not really). restful-apis; node.js/nodejs? c++ C# .net",
+        "",
+    ]
+    for text in texts:
+        assert matcher.extract(text) == _legacy_regex_extract(tax, text)
+
+
+def test_matcher_offsets_prefer_longest_alias():
+    matcher = AliasMatcher({"spring": "spring", "spring boot": "spring boot", "boot": "boot"})
+    text = "Spring Boot and spring"
+
+    matches = matcher.find_all(text)
+    assert [(m.canonical, m.start, m.end) for m in matches] == [("spring boot", 0, 11), ("spring", 16, 22)]
+    assert text[matches[0].start:matches[0].end] == "Spring Boot"
+
+    assert matcher.count(text) == {"spring boot": 1, "spring": 1}
+    assert len(matcher.find_all(text, overlapping=True)) == 4
+
+
+def test_matcher_stream_matches_across_chunk_boundaries():
+    tax = load_taxonomy("data/skills_taxonomy.json")
+    matcher = AliasMatcher(tax.alias_to_canonical)
+    text = "Senior ANDROID dev: Kotlin Coroutines, Jetpack Compose, Spring Boot, GitHub Actions, c++"
+
+    for size in (1, 2, 3, 7, len(text)):
+        chunks = [text[i : i + size] for i in range(0, len(text), size)]
+        assert matcher.extract_stream(chunks) == matcher.extract(text)
+
+    # "java" split from "script" must not count as Java
+    assert "java" not in AliasMatcher({"java": "java"}).extract_stream(["java", "script"])
+
+
+def _write_taxonomy(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_compiled_matcher_cache_round_trip(tmp_path):
+    tax = tmp_path / "skills.json"
+    _write_taxonomy(tax, {"python": ["py"], "spring boot": ["springboot"]})
+
+    first = SkillsExtractor(tax, cache=True)
+    assert not first.from_cache and compiled_cache_path(tax).exists()
+    second = SkillsExtractor(tax, cache=True)
+    assert second.from_cache
+    text = "Py and SpringBoot, not pyspark"
+    assert second.extract(text) == first.extract(text) == {"python", "spring boot"}
+    assert second.extract_matches(text) == first.extract_matches(text)
+
+    # A cache built from other contents (or a corrupt one) is rebuilt
+    _write_taxonomy(tax, {"kotlin": ["kt"]})
+    assert not SkillsExtractor(tax, cache=True).from_cache
+    compiled_cache_path(tax).write_bytes(b"garbage")
+    third = SkillsExtractor(tax, cache=True)
+    assert not third.from_cache and third.extract("KT dev") == {"kotlin"}
+    assert SkillsExtractor(tax, cache=True).from_cache
+
+
+def test_registry_reloads_changed_taxonomy_and_keeps_old_on_error(tmp_path):
+    tax = tmp_path / "skills.json"
+    _write_taxonomy(tax, {"python": ["py"]})
+    registry = TaxonomyRegistry(check_interval=0, cache=False)
+
+    old = registry.get(tax)
+    assert registry.get(tax) is old  # unchanged file: same extractor
+    assert old.extract("py and kotlin") == {"python"}
+
+    _write_taxonomy(tax, {"python": ["py"], "kotlin": ["kt"]})
+    new = registry.get(tax)
+    assert new is not old and new.extract("py and kotlin") == {"python", "kotlin"}
+    assert new.fingerprint != old.fingerprint
+
+    tax.write_text("{not json", encoding="utf-8")
+    assert registry.get(tax) is new
+
+    # Back to earlier contents: served from the LRU, not recompiled
+    _write_taxonomy(tax, {"python": ["py"]})
+    assert registry.get(tax) is old
+
+
+def test_registry_is_keyed_by_path_and_bounded(tmp_path):
+    registry = TaxonomyRegistry(max_items=2, check_interval=60, cache=False)
+    paths = []
+    for i, skill in enumerate(["python", "kotlin", "rust"]):
+        paths.append(tmp_path / f"t{i}.json")
+        _write_taxonomy(paths[-1], {skill: []})
+
+    extractors = [registry.get(p) for p in paths]
+    assert [e.extract("python kotlin rust") for e in extractors] == [{"python"}, {"kotlin"}, {"rust"}]
+    assert len(registry._extractors) == 2
+    assert registry.get(paths[0]) is extractors[0]  # still the current one for its path
+
+
+def test_skill_bitsets_match_set_operations():
+    vocab = SkillVocabulary(["python", "kotlin", "java", "docker", "sql"])
+    a, b = {"python", "docker", "sql"}, {"java", "sql", "python", "unknown"}
+    ma, mb = vocab.mask(a), vocab.mask(b)
+
+    assert vocab.names_of(ma & mb) == sorted(a & b)
+    assert vocab.names_of(mb & ~ma) == sorted((b - a) & set(vocab.names))
+    assert (ma | mb).bit_count() == len((a | b) & set(vocab.names))
+    assert vocab.to_matrix([ma, 0]).tolist() == [[n in a for n in vocab.names], [False] * 5]
+
+    cov = coverage_matrix([ma, mb, 0], [mb, 0], vocab)
+    assert cov.tolist() == [[2 / 3, 0.0], [1.0, 0.0], [0.0, 0.0]]
+
+
+def test_posting_lists_round_trip():
+    rng = np.random.default_rng(3)
+    for ids in ([], [0], [5, 6, 7, 1000], np.unique(rng.integers(0, 2**40, 500))):
+        ids = np.asarray(ids, dtype=np.int64)
+        data = encode_postings(ids)
+        assert data.dtype == np.uint8
+        assert decode_postings(data).tolist() == ids.tolist()
+    assert encode_postings(np.arange(1000)).size == 1000  # dense: one byte per posting
+
+
+def test_skill_index_boolean_queries_match_brute_force(tmp_path):
+    rng = random.Random(5)
+    vocab = ["python", "kafka", "java", "docker", "sql"]
+    docs = [(f"r{i}.pdf", {s for s in vocab if rng.random() < 0.4}) for i in range(300)]
+    index = SkillIndex.build(docs, taxonomy="abc")
+    index = SkillIndex.load(index.save(tmp_path / "index.npz"))
+    assert len(index) == 300 and index.taxonomy == "abc"
+
+    cases = {
+        "python AND kafka AND NOT java": lambda s: {"python", "kafka"} <= s and "java" not in s,
+        "(Docker or SQL) and not (python OR kafka)": lambda s: bool(s & {"docker", "sql"}) and not s & {"python", "kafka"},
+        "NOT NOT java": lambda s: "java" in s,
+        'python OR "kafka" AND java': lambda s: "python" in s or {"kafka", "java"} <= s,
+    }
+    for query, pred in cases.items():
+        found = index.search(query, limit=1000)
+        expected = [key for key, skills in docs if pred(skills)]
+        assert found.total == len(expected)
+        assert sorted(h.key for h in found.hits) == sorted(expected)
+
+    # Best coverage of the asked-for skills first, then index order; paging slices that order
+    found = index.search("python OR kafka OR java", limit=1000)
+    assert found.skills == ["java", "kafka", "python"]
+    order = [(-h.score, h.doc_id) for h in found.hits]
+    assert order == sorted(order)
+    hit = found.hits[0]
+    assert hit.matched_skills == sorted(docs[hit.doc_id][1] & {"python", "kafka", "java"})
+    assert index.search("python OR kafka OR java", limit=5, offset=3).hits == found.hits[3:8]
+
+
+def test_skill_index_resolves_aliases_and_rejects_bad_queries():
+    index = SkillIndex.build([("a", ["javascript", "machine learning"]), ("b", [])])
+    assert [h.key for h in index.search("JS AND Machine  Learning").hits] == ["a"]
+    assert index.search("kotlin").total == 0  # known skill, nobody has it
+    assert [h.key for h in index.search("NOT javascript").hits] == ["b"]
+
+    for query in ["", "python AND", "(python", "python )", '"python', "no such skill"]:
+        with pytest.raises(ValueError):
+            index.search(query)
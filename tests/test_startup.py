@@ -0,0 +1,21 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY = ["numpy", "scipy", "sklearn", "joblib", "pandas", "pypdf", "docx"]
+
+
+def test_entry_points_import_without_heavy_dependencies():
+    code = (
+        "import json, sys\n"
+        "import resume_analyzer.cli, resume_analyzer.api.main\n"
+        f"print(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    assert json.loads(out.stdout.strip().splitlines()[-1]) == []
@@ -5,6 +5,7 @@ from datetime import datetime
 from pathlib import Path
 
 import joblib
+import numpy as np
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
@@ -12,6 +13,8 @@ from sklearn.metrics import classification_report, f1_score
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 
+from resume_analyzer.ml.compact import CompactRoleModel, export_role_model
+
 
 DATA_PATH = Path("training/data/role_dataset.csv")
 MODEL_DIR = Path("models")
@@ -98,9 +101,18 @@ def main() -> None:
     model_path = MODEL_DIR / f"role_pipeline_v{stamp}.joblib"
     joblib.dump(pipeline, model_path)
 
-    # Track latest model path
+    # Compact, memory-mappable copy for serving; only used if it predicts exactly the same
+    compact_path = export_role_model(pipeline, model_path.with_suffix(".npz"))
+    compact_ok = bool(
+        np.allclose(CompactRoleModel(compact_path).predict_proba(X), pipeline.predict_proba(X), rtol=0, atol=1e-9)
+    )
+    serving_path = compact_path if compact_ok else model_path
+    if not compact_ok:
+        print(f"⚠️ Compact model disagrees with the pipeline; serving {model_path}")
+
+    # Track latest model path (forward slashes so the pointer resolves on any OS)
     latest_path = MODEL_DIR / "latest_role_model.txt"
-    latest_path.write_text(str(model_path), encoding="utf-8")
+    latest_path.write_text(serving_path.as_posix(), encoding="utf-8")
 
     # Save metrics report
     report_path = REPORTS_DIR / "role_metrics.json"
@@ -112,6 +124,7 @@ def main() -> None:
         "test_size": float(test_size),
         "stratified": bool(stratify is not None),
         "model_path": str(model_path),
+        "compact_model_path": str(compact_path) if compact_ok else None,
         "latest_model_pointer": str(latest_path),
         "macro_f1": float(macro_f1),
         "classes": sorted(list(set(y))),
@@ -120,6 +133,8 @@ def main() -> None:
     report_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
     print(f"✅ Saved model: {model_path}")
+    if compact_ok:
+        print(f"✅ Saved compact model: {compact_path}")
     print(f"✅ Updated latest pointer: {latest_path}")
     print(f"✅ Saved report: {report_path}")
     print(f"📊 Macro F1: {macro_f1:.3f}")
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import joblib
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from resume_analyzer.scoring.similarity import MIN_VOCABULARY
+
+
+# Reference corpus: the role dataset, one document per taxonomy skill (so every
+# alias is in the vocabulary) and any extra *.txt documents (one per file)
+DATA_PATH = Path("training/data/role_dataset.csv")
+TAXONOMY_PATH = Path("data/skills_taxonomy.json")
+EXTRA_CORPUS_DIR = Path("training/data/corpus")
+MODEL_DIR = Path("models")
+REPORTS_DIR = Path("reports")
+
+MODEL_DIR.mkdir(exist_ok=True)
+REPORTS_DIR.mkdir(exist_ok=True)
+
+
+def load_corpus() -> list[str]:
+    if not DATA_PATH.exists():
+        raise FileNotFoundError(f"Dataset not found: {DATA_PATH}")
+
+    df = pd.read_csv(DATA_PATH)
+    if "text" not in df.columns:
+        raise ValueError("CSV must contain a 'text' column")
+
+    docs = df["text"].dropna().astype(str).tolist()
+
+    if TAXONOMY_PATH.exists():
+        taxonomy = json.loads(TAXONOMY_PATH.read_text(encoding="utf-8"))
+        for canonical, aliases in taxonomy.items():
+            docs.append(" ".join([canonical, *aliases]))
+
+    if EXTRA_CORPUS_DIR.exists():
+        for p in sorted(EXTRA_CORPUS_DIR.glob("*.txt")):
+            docs.append(p.read_text(encoding="utf-8", errors="ignore"))
+
+    docs = [d for d in docs if d.strip()]
+    if len(docs) < 2:
+        raise ValueError("Corpus too small. Add more documents before fitting.")
+    return docs
+
+
+def main() -> None:
+    docs = load_corpus()
+
+    # Same analyzer settings as the old per-pair vectorizer, fitted once on the corpus
+    vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), min_df=1)
+    vectorizer.fit(docs)
+
+    # Versioned model save
+    stamp = datetime.now().strftime("%Y%m%d_%H%M")
+    model_path = MODEL_DIR / f"similarity_tfidf_v{stamp}.joblib"
+    joblib.dump(vectorizer, model_path)
+
+    # Track latest model path (forward slashes so the pointer works on any OS).
+    # Too small a vocabulary would score out-of-domain text 0: leave the per-pair fit on.
+    latest_path = MODEL_DIR / "latest_similarity_model.txt"
+    vocabulary_size = len(vectorizer.vocabulary_)
+    if vocabulary_size >= MIN_VOCABULARY:
+        latest_path.write_text(model_path.as_posix(), encoding="utf-8")
+
+    report_path = REPORTS_DIR / "similarity_model.json"
+    payload = {
+        "timestamp": stamp,
+        "dataset": str(DATA_PATH),
+        "taxonomy": str(TAXONOMY_PATH),
+        "extra_corpus_dir": str(EXTRA_CORPUS_DIR),
+        "n_documents": len(docs),
+        "vocabulary_size": vocabulary_size,
+        "model_path": str(model_path),
+        "latest_model_pointer": str(latest_path) if vocabulary_size >= MIN_VOCABULARY else None,
+    }
+    report_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    print(f"✅ Saved vectorizer: {model_path}")
+    if vocabulary_size >= MIN_VOCABULARY:
+        print(f"✅ Updated latest pointer: {latest_path}")
+    else:
+        print(
+            f"⚠️ Vocabulary {vocabulary_size} < {MIN_VOCABULARY}: pointer not updated. "
+            f"Add documents under {EXTRA_CORPUS_DIR} and retrain."
+        )
+    print(f"✅ Saved report: {report_path}")
+    print(f"📚 Documents: {len(docs)}, vocabulary: {len(vectorizer.vocabulary_)}")
+
+
+if __name__ == "__main__":
+    main()